@@ -1,11 +1,16 @@
+import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from alembic import context
+from app.configs.settings import settings
 from app.cores.db import Base
+from app.cores.migrations import stamp_legacy_baseline
 from app.models import *
+from app.models.teachers.teacher_search_document import FULLTEXT_INDEX_NAME
 
 
 # this is the Alembic Config object, which provides
@@ -14,19 +19,24 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
-# other values from the config, defined by the needs of env.py,
-# can be acquired:
-# my_important_option = config.get_main_option("my_important_option")
-# ... etc.
+# La URL sale de Settings (SQLALCHEMY_DATABASE_URI), igual que la aplicación;
+# `config.attributes["database_url"]` permite sobrescribirla desde código (pruebas).
+DATABASE_URL = config.attributes.get("database_url") or settings.SQLALCHEMY_DATABASE_URI
+
+# Índices que dependen del motor (FULLTEXT / tsvector) y no se declaran en los modelos
+DIALECT_ONLY_INDEXES = {FULLTEXT_INDEX_NAME}
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Evita que autogenerate proponga borrar los índices de DIALECT_ONLY_INDEXES."""
+    return not (type_ == "index" and reflected and name in DIALECT_ONLY_INDEXES)
 
 
 def run_migrations_offline() -> None:
@@ -41,38 +51,54 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url,
+        url=DATABASE_URL,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+        include_object=include_object,
+    )
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+    with context.begin_transaction():
+        # Bases creadas con create_all antes de Alembic: se marcan en la revisión base
+        stamp_legacy_baseline(context.get_context())
+        context.run_migrations()
 
-    """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+async def run_async_migrations() -> None:
+    """Run migrations in 'online' mode with the application's async driver."""
+    connectable = create_async_engine(DATABASE_URL, poolclass=pool.NullPool)
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
 
-        with context.begin_transaction():
-            context.run_migrations()
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    Si se recibe una conexión en `config.attributes["connection"]` se usa
+    directamente; si no, se crea un engine asíncrono con la URL de la aplicación.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
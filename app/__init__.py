@@ -1,143 +1,99 @@
 """
 Este bloque define la configuración de inicio (lifespan) y creación de la aplicación FastAPI.
-Incluye tareas que deben ejecutarse al arrancar la aplicación, como la creación de tablas y datos iniciales.
+Incluye tareas que deben ejecutarse al arrancar la aplicación, como verificar la versión del esquema.
+El esquema y los datos iniciales se aplican por despliegue con `alembic upgrade head`
+y `python -m app.scripts.databases.seed`.
+
+Los modelos, los routers y los subsistemas pesados (Alembic, pools de base de datos,
+Stripe, diccionarios de groserías) no se importan al importar el paquete `app`:
+los routers se registran desde `ROUTERS` dentro de `create_app()` y el resto se
+carga en `lifespan` o en su primer uso. `python -m app.main --profile-imports`
+muestra el reporte de tiempos de importación.
 """
 
+from importlib import import_module
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
-from app.cores.db import Base, engine
-from sqlalchemy.ext.asyncio import AsyncEngine
-from app.cores.rate_limiter import limiter, rate_limit_exceeded_handler
-from slowapi import _rate_limit_exceeded_handler
+from app.cores.rate_limiter import limiter, rate_limit_exceeded_handler, RateLimitMiddleware
 from slowapi.errors import RateLimitExceeded
 from app.cores.security_headers import SecurityHeadersMiddleware
 
-from app.models.common.status import Status
-from app.models.common.role import Role
-from app.models.common.modality import Modality
-from app.models.common.educational_level import EducationalLevel
-from app.models.common.verification_code import VerificationCode
-from app.models.common.price_range import PriceRange
-from app.models.common.stripe_price import StripePrice
-
-from app.models.users.user import User
-from app.models.users.preference import Preference
-
-
-from app.models.teachers.document import Document
-from app.models.teachers.price import Price
-from app.models.teachers.video import Video
-from app.models.teachers.availability import Availability
-from app.models.teachers.wallet import Wallet
-
-
-from app.models.privileges.privilege import Privilege
-from app.models.privileges.privilege_role import PrivilegeRole
-from app.models.privileges.privilege_user import PrivilegeUser
-
-from app.models.subscriptions.benefit import Benefit
-from app.models.subscriptions.plan import Plan
-from app.models.subscriptions.subscription import Subscription
-from app.models.subscriptions.payment_subscription import PaymentSubscription
-
-from  app.models.notifications.notifications import Notification
-from  app.models.notifications.user_notifications import User_notification
-
-from app.models.booking.bookings import Booking
-from app.models.booking.payment_bookings import PaymentBooking
-from app.models.booking.confirmation import Confirmation
-from app.models.booking.reschedule_request import RescheduleRequest
-
-from app.models.refunds.refund_request import RefundRequest
-
-from app.scripts.databases.create_status import create_status
-from app.scripts.databases.create_user_admin import create_admin_user
-from app.scripts.databases.create_role import create_role
-from app.scripts.databases.create_educational_level import create_educational_level
-from app.scripts.databases.create_modality import create_modality
-from app.scripts.databases.create_privilege import create_privileges
-from app.scripts.databases.create_privilege_role import create_privileges_role
-from app.scripts.databases.create_price_ranges import create_prices_range
-from app.scripts.databases.create_plan import create_premium_plan, create_free_plan
-from app.scripts.databases.create_benefit import create_benefit
-from app.scripts.databases.create_docente import crear_docente
-from app.scripts.databases.create_categories import create_categories
-
-from app.schemas.auths.register_shema import RegisterUserRequest
-from app.services.auths.register_service import RegisterUserRequest
-from app.apis.auth_api import register_student_route
-from app.apis.auth_api import register_teacher_route
-from better_profanity import profanity
-
-from app.apis.auth_api import router as auth_router
-from app.apis.privileges_api import router as privileges_router
-from app.apis.profile_api import router as profile_router
-from app.apis.price_api import router as price_router
-from app.apis.suscripcion_api import router as suscripcion_router
-from app.apis.notifications_api import router as notifications_router
-from app.apis.document_api import router as document_router
-from app.apis.booking_api import router as booking_router
-
-from app.apis.assessment_api import router as assessment_router
-
-
-from app.apis.confirm_teacher_api import router as confirm_teacher_router
-from app.apis.confirm_student_api import router as confirm_student_router
-from app.apis.wallet_api import router as wallet_router
-from app.apis.foro_api import router as foro_router
-from app.apis.teachers_public_api import router as teachers_public_router
-
-from app.apis.refund_api import router as refund_router
-
-from app.apis.availability_api import router as availability_router
-from app.apis.videos_api import router as videos_router
-from app.apis.public_videos_api import router as public_videos_router
-from app.apis.common import router as common_router
 
-
-from fastapi.middleware.cors import CORSMiddleware
-profanity.load_censor_words()
-
-
-
-from app.apis.videos_api import router as videos_router
-from app.apis.chat_api import router as chat_router
-from app.apis.activate_account_api import router as activation_router
+# (módulo, prefijo, etiquetas) en el orden en que se registran; el orden importa
+# cuando dos prefijos se solapan (/api/public y /api/public/videos)
+ROUTERS = (
+    ("app.apis.auth_api", "/api/auth", ["Auth"]),
+    ("app.apis.privileges_api", "/api/privileges", ["Privileges"]),
+    ("app.apis.profile_api", "/api/profile", ["Profile"]),
+    ("app.apis.price_api", "/api/prices", ["Prices"]),
+    ("app.apis.suscripcion_api", "/api/suscripcion", ["suscripcion"]),
+    ("app.apis.notifications_api", "/api/notifications", ["Notifications"]),
+    ("app.apis.document_api", "/api/documents", ["Documents"]),
+    ("app.apis.booking_api", "/api/bookings", ["Bookings"]),
+    ("app.apis.confirm_teacher_api", "/api/confirmation", ["Confirmation"]),
+    ("app.apis.confirm_student_api", "/api/confirmation", ["Confirmation"]),
+    ("app.apis.assessment_api", "/api/assessments", ["Assessments"]),
+    ("app.apis.wallet_api", "/api/wallet", ["Wallet"]),
+    ("app.apis.foro_api", "/api/foro", ["Foro"]),
+    ("app.apis.teachers_public_api", "/api/public", ["Public"]),
+    ("app.apis.refund_api", "/api/refunds", ["Refunds"]),
+    ("app.apis.availability_api", "/api/availability", ["Availability"]),
+    ("app.apis.videos_api", "/api/videos", ["Videos"]),
+    ("app.apis.chat_api", "/api/chat", ["Chat"]),
+    ("app.apis.public_videos_api", "/api/public/videos", ["Public Videos"]),
+    ("app.apis.common", "/api", ["Common Resources"]),
+    ("app.apis.activate_account_api", "/api/activation", ["Activation"]),
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Función que se ejecuta al iniciar la aplicación.
-    - Crea todas las tablas en la base de datos si no existen.
-    - Inserta datos iniciales requeridos como estados, roles, modalidades, niveles educativos.
+    - Verifica que la base de datos esté en la última migración de Alembic (no crea tablas ni datos).
+    - Carga en memoria los catálogos de referencia (status, roles, modalidades, niveles, rangos de precios).
+    - Programa la purga periódica de refresh tokens vencidos y el log de métricas de los pools.
     - Al finalizar, continúa con la ejecución normal de la app (con `yield`).
+    - Al apagar, detiene las tareas periódicas y libera el pool criptográfico del chat y los pools de las réplicas de lectura.
     """
-    async with engine.begin() as conn:
-        # Crea las tablas en la base de datos
-        await conn.run_sync(Base.metadata.create_all)
-    #Crean o ejecutan los script para los datos(roles,status, etc..)
-    await create_status()
-    await create_modality()
-    await create_role()
-    await create_educational_level()
-    await create_privileges()
-    await create_privileges_role()
-    await create_admin_user()
-    await create_prices_range()
-    await create_premium_plan()
-    await create_free_plan()
-    await create_benefit()
-    await crear_docente()  # Comentado: solo para testing, borra datos en cada inicio
-    await create_categories()
+    import asyncio
+    from app.configs.settings import settings
+    from app.cores.db import async_session, engine, read_replicas, run_pool_metrics_log
+    from app.cores.migrations import verify_schema_version
+    from app.services.auths.refresh_token_service import run_refresh_token_purge
+    from app.services.common.reference_data import reference_data
+    from app.services.encryption import shutdown_crypto_executor
+
+    # El esquema lo crean las migraciones (alembic upgrade head) y los datos el comando de seed
+    await verify_schema_version(engine)
+
+    # Catálogos de referencia en memoria (evita consultar nombre→id en cada petición)
+    await reference_data.load()
+
+    # Los diccionarios de groserías (chat, foro) se compilan en su primer uso
+
+    background_tasks = [asyncio.create_task(
+        run_refresh_token_purge(async_session, settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS)
+    )]
+    if settings.DB_POOL_METRICS_LOG_INTERVAL_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(
+            run_pool_metrics_log(settings.DB_POOL_METRICS_LOG_INTERVAL_SECONDS)
+        ))
 
     yield
 
+    for task in background_tasks:
+        task.cancel()
+    # Cierra el pool de trabajo criptográfico del chat
+    shutdown_crypto_executor()
+    # Cierra los pools de las réplicas de lectura
+    await read_replicas.dispose()
+
 """
     Función que construye y retorna la instancia principal de la aplicación FastAPI.
     - Establece el título de la app.
     - Aplica la función `lifespan` para la inicialización.
-    - Carga las rutas necesarias (por ahora, solo las de autenticación).
+    - Importa los modelos y registra los routers de `ROUTERS`.
 """
 
 
@@ -155,9 +111,8 @@ def create_app() -> FastAPI:
     # Agregar middleware de seguridad
     app.add_middleware(SecurityHeadersMiddleware)
     
-    # Aplicar rate limiting global a todas las rutas
-    from slowapi.middleware import SlowAPIMiddleware
-    app.add_middleware(SlowAPIMiddleware)
+    # Aplicar rate limiting global a todas las rutas (middlewares ASGI puros, sin BaseHTTPMiddleware)
+    app.add_middleware(RateLimitMiddleware)
 
     origins = [
         "http://localhost:5173/",
@@ -180,34 +135,10 @@ def create_app() -> FastAPI:
     def root():
         return {"status": "ok"}
 
-    # Agrega el router de autenticación con un prefijo y una etiqueta
-    app.include_router(auth_router, prefix="/api/auth", tags=["Auth"])
-    app.include_router(privileges_router, prefix="/api/privileges", tags=["Privileges"])
-    app.include_router(profile_router, prefix="/api/profile", tags=["Profile"])
-    app.include_router(price_router, prefix="/api/prices", tags=["Prices"])
-    app.include_router(suscripcion_router, prefix="/api/suscripcion", tags=["suscripcion"])
-    app.include_router(notifications_router, prefix="/api/notifications", tags=["Notifications"])
-    app.include_router(document_router, prefix="/api/documents", tags=["Documents"])
-    app.include_router(booking_router, prefix="/api/bookings", tags=["Bookings"])
-
-    app.include_router(confirm_teacher_router, prefix="/api/confirmation", tags=["Confirmation"])
-    app.include_router(confirm_student_router, prefix="/api/confirmation", tags=["Confirmation"])
-
-    app.include_router(assessment_router, prefix="/api/assessments", tags=["Assessments"])
-
-    ##app.include_router()
-
-    app.include_router(wallet_router, prefix="/api/wallet", tags=["Wallet"])
-    app.include_router(foro_router, prefix="/api/foro", tags=["Foro"])
-    app.include_router(teachers_public_router, prefix="/api/public", tags=["Public"])
-    ##app.include_router()
-    app.include_router(refund_router, prefix="/api/refunds", tags=["Refunds"])
-    app.include_router(availability_router, prefix="/api/availability", tags=["Availability"])
-    app.include_router(videos_router, prefix="/api/videos", tags=["Videos"])
-    app.include_router(chat_router, prefix="/api/chat", tags=["Chat"])
-
-    app.include_router(public_videos_router, prefix="/api/public/videos", tags=["Public Videos"])
-    app.include_router(common_router, prefix="/api", tags=["Common Resources"])
-    app.include_router(activation_router, prefix="/api/activation", tags=["Activation"])
-    
+    # Registra todos los modelos en Base.metadata antes de importar los routers
+    import_module("app.models")
+
+    for module_name, prefix, tags in ROUTERS:
+        app.include_router(import_module(module_name).router, prefix=prefix, tags=tags)
+
     return app
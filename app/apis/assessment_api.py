@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.apis.deps import auth_required, get_db, public_access
+from app.apis.deps import auth_required, get_db, get_read_db, public_access
 from app.schemas.bookings.assessment_schema import (
     AssessmentCreate, TeacherCommentsListResponse, TeacherCommentResponse
 )
@@ -32,7 +32,7 @@ async def add_assessment(
 # Comentarios privados (docente autenticado)
 @router.get("/teacher/comments/", response_model=TeacherCommentsListResponse, dependencies=[Depends(auth_required)])
 async def get_teacher_comments(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_data: dict = Depends(auth_required)
 ):
     teacher_id = user_data["user_id"]
@@ -53,7 +53,7 @@ async def get_teacher_comments(
 )
 async def get_public_comments(
     teacher_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     comments = await get_public_comments_service(db, teacher_id)
 
@@ -71,7 +71,7 @@ async def get_public_comments(
     dependencies=[Depends(auth_required)]
 )
 async def get_student_comments(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_data: dict = Depends(auth_required)
 ):
     student_id = user_data["user_id"]
@@ -85,7 +85,7 @@ async def get_student_comments(
 
 @router.get("/my-rating/", dependencies=[Depends(auth_required)])
 async def get_my_teacher_rating(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_data: dict = Depends(auth_required)
 ):
     """
@@ -109,12 +109,14 @@ async def send_email_api(email: EmailSchema):
 
 @router.post("/refresh-token/")
 async def refresh_token(request: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
-    access_token, payload = await refresh_access_token(db, request.token)
+    # El refresh token se rota: el recibido deja de ser válido y se entrega uno nuevo
+    access_token, refresh_token, payload = await refresh_access_token(db, request.token)
     return {
         "success": True,
         "message": "Token renovado exitosamente",
         "data": {
             "access_token": access_token,
+            "refresh_token": refresh_token,
             "token_type": "bearer"
         }
     }
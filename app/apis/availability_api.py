@@ -10,7 +10,7 @@ from app.services.teachers.teacher_agenda_service import (
 from app.schemas.availability.availability_schema import (
     TeacherAgendaResponse, AvailabilitySummaryResponse
 )
-from app.apis.deps import auth_required, get_db, public_access
+from app.apis.deps import auth_required, get_db, get_read_db, public_access
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -20,7 +20,7 @@ async def get_teacher_agenda(
     week: str = None,
     start_date: str = None,
     end_date: str = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_data: dict = Depends(auth_required)
 ):
     """
@@ -60,7 +60,7 @@ async def get_public_teacher_agenda(
     week: str = None,
     start_date: str = None,
     end_date: str = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Obtener la agenda pública de cualquier docente
@@ -93,7 +93,7 @@ async def get_public_teacher_agenda(
 
 @router.get("/list/", dependencies=[Depends(auth_required)])
 async def list_teacher_availabilities(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_data: dict = Depends(auth_required)
 ):
     """
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional, Tuple
 
 from app.apis.deps import get_db, auth_required
 from app.schemas.chat.chat_schema import (
@@ -11,10 +12,14 @@ from app.schemas.chat.chat_schema import (
     MessageResponse,
     MessageListResponse,
     MarkAsReadRequest,
+    MarkReadUpToRequest,
     ChatSummaryResponse,
     ChatSummaryListResponse,
 )
-from app.services.chat import ChatService, MessageService
+from app.cores.token import verify_access_token
+from app.services.chat import ChatService, MessageService, get_chat_broker
+from app.services.chat.chat_broker import user_channel
+from app.services.utils.pagination_service import PaginationService
 
 router = APIRouter()
 
@@ -217,31 +222,62 @@ async def get_chat_messages(
     chat_id: int,
     limit: int = Query(50, ge=1, le=100, description="Número máximo de mensajes"),
     offset: int = Query(0, ge=0, description="Número de mensajes a omitir"),
+    before_id: Optional[int] = Query(None, ge=1, description="Cursor: mensajes anteriores a este ID"),
+    after_id: Optional[int] = Query(None, ge=1, description="Cursor: mensajes posteriores a este ID"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto en next_cursor/prev_cursor"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(auth_required)
 ):
     """
     Obtiene los mensajes de un chat con paginación.
+    
+    - Modo offset (compatibilidad): `limit` + `offset`.
+    - Modo cursor: `before_id`/`after_id` o el `cursor` opaco devuelto en la respuesta.
+      Estable ante mensajes nuevos y sin costo creciente al retroceder en el historial.
     """
     try:
-        # Obtener mensajes con contenido desencriptado
+        if cursor:
+            if before_id is not None or after_id is not None:
+                raise ValueError("Usa solo cursor, before_id o after_id, no varios")
+            before_id, after_id = _decode_message_cursor(cursor)
+        elif before_id is not None and after_id is not None:
+            raise ValueError("Usa solo before_id o after_id, no ambos")
+        
+        # Se pide un mensaje extra para saber si hay más en la dirección de la página
         decrypted_messages = await MessageService.get_chat_messages_decrypted(
             db=db,
             chat_id=chat_id,
             user_id=current_user["user_id"],
-            limit=limit,
-            offset=offset
+            limit=limit + 1,
+            offset=offset,
+            before_id=before_id,
+            after_id=after_id
         )
+        has_more = len(decrypted_messages) > limit
+        if has_more:
+            # Vienen en orden cronológico: el extra es el más nuevo (after_id) o el más antiguo
+            decrypted_messages = decrypted_messages[:limit] if after_id is not None else decrypted_messages[1:]
         
         # Convertir a schema de respuesta (ya están desencriptados)
         message_responses = [MessageResponse.model_validate(msg) for msg in decrypted_messages]
         
+        # Cursores opacos para la siguiente página (más antiguos) y la anterior (más nuevos)
+        next_cursor = prev_cursor = None
+        if message_responses:
+            next_cursor = PaginationService.encode_cursor({"before_id": message_responses[0].id})
+            prev_cursor = PaginationService.encode_cursor({"after_id": message_responses[-1].id})
+        elif after_id is not None:
+            prev_cursor = PaginationService.encode_cursor({"after_id": after_id})
+        
         return MessageListResponse(
             success=True,
             message=f"✅ {len(message_responses)} mensaje(s) cargado(s) correctamente",
             data=message_responses,
             total=len(message_responses),
-            chat_id=chat_id
+            chat_id=chat_id,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            has_more=has_more
         )
         
     except ValueError as e:
@@ -253,6 +289,22 @@ async def get_chat_messages(
         )
 
 
+def _decode_message_cursor(cursor: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    (before_id, after_id) de un cursor de mensajes; exactamente uno viene definido.
+
+    Raises:
+        ValueError: Si el cursor no es válido o sus IDs no son enteros positivos
+    """
+    cursor_data = PaginationService.decode_cursor(cursor)
+    before_id = cursor_data.get("before_id")
+    after_id = cursor_data.get("after_id")
+    values = [value for value in (before_id, after_id) if value is not None]
+    if len(values) != 1 or not all(type(value) is int and value >= 1 for value in values):
+        raise ValueError("Cursor de paginación inválido")
+    return before_id, after_id
+
+
 @router.post("/messages/mark-read")
 async def mark_messages_as_read(
     request: MarkAsReadRequest,
@@ -270,19 +322,17 @@ async def mark_messages_as_read(
                 detail="❌ Debes proporcionar al menos un ID de mensaje"
             )
         
-        # Obtener el primer mensaje para verificar el chat
+        # Obtener el chat del primer mensaje (solo la columna, sin hidratar el mensaje)
         from app.models.chat import Message
         from sqlalchemy.future import select
         
-        first_message_query = select(Message).where(Message.id == request.message_ids[0])
-        first_message_result = await db.execute(first_message_query)
-        first_message = first_message_result.scalar_one_or_none()
+        chat_id_query = select(Message.chat_id).where(Message.id == request.message_ids[0])
+        chat_id_result = await db.execute(chat_id_query)
+        chat_id = chat_id_result.scalar_one_or_none()
         
-        if not first_message:
+        if chat_id is None:
             raise HTTPException(status_code=404, detail="❌ Mensaje no encontrado")
         
-        chat_id = first_message.chat_id
-        
         # Marcar como leído
         count = await MessageService.mark_messages_as_read(
             db=db,
@@ -306,6 +356,39 @@ async def mark_messages_as_read(
         )
 
 
+@router.post("/messages/{chat_id}/mark-read-up-to")
+async def mark_messages_as_read_up_to(
+    chat_id: int,
+    request: MarkReadUpToRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(auth_required)
+):
+    """
+    Marca como leídos todos los mensajes recibidos en el chat hasta `message_id` (incluido).
+    """
+    try:
+        count = await MessageService.mark_messages_as_read_up_to(
+            db=db,
+            chat_id=chat_id,
+            user_id=current_user["user_id"],
+            up_to_message_id=request.message_id
+        )
+        
+        return {
+            "success": True,
+            "message": f"✅ {count} mensaje(s) marcado(s) como leído(s)",
+            "data": {"marked_count": count}
+        }
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"❌ {str(e)}")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail="❌ Error interno al marcar mensajes como leídos. Por favor, intenta nuevamente."
+        )
+
+
 @router.delete("/messages/{message_id}")
 async def delete_message(
     message_id: int,
@@ -364,3 +447,59 @@ async def get_unread_count(
             status_code=500,
             detail="❌ Error interno al obtener el contador de mensajes no leídos. Por favor, intenta nuevamente."
         )
+
+
+# ============================================================================
+# TIEMPO REAL (WEBSOCKET)
+# ============================================================================
+
+@router.websocket("/ws")
+async def chat_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None, description="Token de acceso (los navegadores no envían headers en WebSocket)")
+):
+    """
+    Canal en tiempo real del usuario autenticado.
+    
+    Envía como JSON los eventos de todos sus chats:
+    `message.new`, `message.read`, `message.deleted`, `chat.blocked`, `chat.unblocked`.
+    Reemplaza el polling de `/messages/{chat_id}` y `/unread-count`.
+    """
+    try:
+        payload = verify_access_token(token) if token else None
+    except HTTPException:
+        payload = None
+    
+    if not payload or not payload.get("user_id"):
+        await websocket.close(code=1008)
+        return
+    
+    await websocket.accept()
+    
+    async with get_chat_broker().subscribe(user_channel(payload["user_id"])) as subscription:
+        # El cliente no necesita enviar nada; se lee solo para detectar la desconexión
+        client_closed = asyncio.create_task(_wait_for_disconnect(websocket))
+        try:
+            while True:
+                next_event = asyncio.create_task(subscription.get())
+                done, _ = await asyncio.wait(
+                    {next_event, client_closed},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if client_closed in done:
+                    next_event.cancel()
+                    break
+                await websocket.send_json(next_event.result())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            client_closed.cancel()
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Consume los mensajes del cliente (p. ej. pings) hasta que se desconecte."""
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
@@ -14,6 +14,7 @@ from app.schemas.common.modality_schema import (
 )
 from app.services.common.educational_level_service import EducationalLevelService
 from app.services.common.modality_service import ModalityService
+from app.services.common.reference_data import reference_data
 from app.apis.deps import get_db
 
 router = APIRouter()
@@ -51,7 +52,9 @@ async def create_educational_level(
     """
     Create a new educational level.
     """
-    return await EducationalLevelService.create_educational_level(db=db, level=level)
+    db_level = await EducationalLevelService.create_educational_level(db=db, level=level)
+    await reference_data.refresh(db)
+    return db_level
 
 @router.put("/educational-levels/{level_id}", response_model=EducationalLevel)
 async def update_educational_level(
@@ -67,6 +70,7 @@ async def update_educational_level(
     )
     if db_level is None:
         raise HTTPException(status_code=404, detail="Educational level not found")
+    await reference_data.refresh(db)
     return db_level
 
 @router.delete("/educational-levels/{level_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -80,6 +84,7 @@ async def delete_educational_level(
     success = await EducationalLevelService.delete_educational_level(db=db, level_id=level_id)
     if not success:
         raise HTTPException(status_code=404, detail="Educational level not found")
+    await reference_data.refresh(db)
     return {"ok": True}
 
 # Modality Endpoints
@@ -115,7 +120,9 @@ async def create_modality(
     """
     Create a new modality.
     """
-    return await ModalityService.create_modality(db=db, modality=modality)
+    db_modality = await ModalityService.create_modality(db=db, modality=modality)
+    await reference_data.refresh(db)
+    return db_modality
 
 @router.put("/modalities/{modality_id}", response_model=Modality)
 async def update_modality(
@@ -131,6 +138,7 @@ async def update_modality(
     )
     if db_modality is None:
         raise HTTPException(status_code=404, detail="Modality not found")
+    await reference_data.refresh(db)
     return db_modality
 
 @router.delete("/modalities/{modality_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -144,4 +152,5 @@ async def delete_modality(
     success = await ModalityService.delete_modality(db=db, modality_id=modality_id)
     if not success:
         raise HTTPException(status_code=404, detail="Modality not found")
+    await reference_data.refresh(db)
     return {"ok": True}
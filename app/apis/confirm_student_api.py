@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi.responses import StreamingResponse
@@ -19,7 +18,6 @@ from app.services.students.confirm_students_service import create_confirmation_b
 from app.services.students.confirm_students_service import get_student_evidence
 from app.cores.file_validator import FileValidator
 
-security = HTTPBearer()
 router = APIRouter()
 
 @router.post("/student/{payment_booking_id}",
@@ -30,17 +28,15 @@ async def confirm_student(
     confirmation: bool = Form(...),          
     description_student: str = Form(...),   # Nuevo campo obligatorio      
     evidence_file: UploadFile = File(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    
     # Validar archivo de evidencia
     await FileValidator.validate_file(evidence_file, file_type="image", max_size=5*1024*1024)
 
     confirmation_obj = await create_confirmation_by_student(
         db=db,
-        token=token,
+        claims=claims,
         confirmation_value=confirmation,
         payment_booking_id=payment_booking_id,   
         evidence_file=evidence_file,
@@ -66,12 +62,10 @@ async def confirm_student(
 async def get_student_evidence_api(
     confirmation_id: int,
     db: AsyncSession = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    claims: dict = Depends(auth_required)
 ):
-    token = credentials.credentials
-
     # Obtener bytes desencriptados desde el service
-    evidence_bytes, filename = await get_student_evidence(db, token, confirmation_id)
+    evidence_bytes, filename = await get_student_evidence(db, claims, confirmation_id)
 
     # Retornar como archivo descargable
     return StreamingResponse(
@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Depends, Form, File, UploadFile, HTTPException
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi.responses import StreamingResponse
@@ -14,7 +13,6 @@ from app.services.teachers.confirm_teacher_service import create_confirmation_by
 from app.services.teachers.confirm_teacher_service import get_teacher_evidence
 
 
-security = HTTPBearer()
 router = APIRouter()
 
 @router.post("/teacher/{payment_booking_id}", response_model=ConfirmationCreateResponse, dependencies=[Depends(auth_required)])
@@ -23,15 +21,13 @@ async def confirm_teacher(
     confirmation: bool = Form(...),
     description_teacher: str = Form(...),   # 🔹 Nuevo campo obligatorio
     evidence_file: UploadFile = File(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-
     # Pasamos todo al service, incluyendo el archivo
     confirmation_obj = await create_confirmation_by_teacher(
         db=db,
-        token=token,
+        claims=claims,
         confirmation_value=confirmation,
         #student_id=0,       # si quieres puedes pasar dinámico desde el request
         payment_booking_id=payment_booking_id,  # idem
@@ -58,12 +54,10 @@ async def confirm_teacher(
 async def get_teacher_evidence_api(
     confirmation_id: int,
     db: AsyncSession = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    claims: dict = Depends(auth_required)
 ):
-    token = credentials.credentials
-
     # Obtener bytes desencriptados desde el service
-    evidence_bytes, filename = await get_teacher_evidence(db, token, confirmation_id)
+    evidence_bytes, filename = await get_teacher_evidence(db, claims, confirmation_id)
 
     # Retornar como archivo descargable
     return StreamingResponse(
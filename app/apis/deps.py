@@ -1,14 +1,12 @@
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.cores.db import async_session 
-from fastapi import Depends, HTTPException, status, Header
+from app.cores.db import async_session, read_replicas
+from fastapi import Depends, HTTPException, status, Header, Request
 from typing import Optional
-from app.cores.token import verify_token
+from app.cores.token import verify_access_token
 
 from app.models.users import User
 from sqlalchemy.future import select
-from jose import JWTError, jwt
-from app.cores.token import SECRET_KEY, ALGORITHM
 from app.models.common.verification_code import VerificationCode
 from app.models.common.role import Role
 from app.models.common.status import Status
@@ -18,6 +16,12 @@ from app.models.privileges.privilege_user import PrivilegeUser
 from app.models.subscriptions.subscription import Subscription
 from app.models.subscriptions.plan import Plan
 from app.models.subscriptions.payment_subscription import PaymentSubscription
+from app.cores.authorization_cache import (
+    cache_privilege_decision,
+    cache_subscription_decision,
+    get_privilege_decision,
+    get_subscription_decision,
+)
 from datetime import datetime
 """
 Este archivo define la función `get_db`, que proporciona una sesión de base de datos asincrónica.
@@ -31,22 +35,96 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     finally:
         await session.close()
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Sesión para endpoints de solo lectura: se reparte entre las réplicas
+    configuradas (round-robin) y usa la primaria si no hay réplicas disponibles.
+    No debe usarse en rutas que escriban.
+    """
+    session = await read_replicas.open_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
 async def public_access():
     pass
 
-async def auth_required(authorization: Optional[str] = Header(None)):
+def get_token_claims(request: Request, authorization: Optional[str]) -> dict:
+    """
+    Claims del bearer token de la petición.
+
+    El token se verifica una sola vez por petición: los claims quedan en
+    `request.state.token_claims`, así `auth_required`, `require_access` y las rutas
+    que los reciben como dependencia no vuelven a decodificarlo. Entre peticiones,
+    `verify_access_token` reutiliza su caché por hash del token.
+
+    Raises:
+        HTTPException: 401 si falta el token, tiene otro formato o es inválido
+    """
     if not authorization:
         raise HTTPException(status_code=401, detail="Token not provided")
 
+    cached = getattr(request.state, "token_claims", None)
+    if cached is not None and cached[0] == authorization:
+        return cached[1]
+
     try:
         scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise HTTPException(status_code=401, detail="Invalid token format")
-
-        payload = verify_token(token)
-        return payload
-    except (ValueError, JWTError):
+    except ValueError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+    if scheme.lower() != "bearer":
+        raise HTTPException(status_code=401, detail="Invalid token format")
+
+    payload = verify_access_token(token)
+    request.state.token_claims = (authorization, payload)
+    return payload
+
+async def auth_required(request: Request, authorization: Optional[str] = Header(None)):
+    return get_token_claims(request, authorization)
+
+
+async def _has_privilege(db: AsyncSession, user_id: int, role_name: str, privilege_name: str, action: str) -> bool:
+    """Indica si el usuario tiene el privilegio asignado directamente o a través de su rol."""
+    result = await db.execute(
+        select(Privilege).where(Privilege.name == privilege_name, Privilege.action == action)
+    )
+    privilege = result.scalar_one_or_none()
+    if not privilege:
+        return False
+
+    result = await db.execute(
+        select(PrivilegeUser).where(
+            PrivilegeUser.user_id == user_id,
+            PrivilegeUser.privilege_id == privilege.id,
+            PrivilegeUser.status.has(name="active")
+        )
+    )
+    if result.scalar_one_or_none():
+        return True
+
+    result = await db.execute(
+        select(PrivilegeRole).join(Role).where(
+            Role.name == role_name,
+            PrivilegeRole.privilege_id == privilege.id,
+            PrivilegeRole.status.has(name="active")
+        )
+    )
+    return result.scalar_one_or_none() is not None
+
+
+async def _get_active_subscription(db: AsyncSession, user_id: int, plan_type: Optional[str]) -> Optional[Subscription]:
+    """Suscripción activa y vigente del usuario (opcionalmente de un tipo de plan)."""
+    query = select(Subscription).join(Plan).where(
+        Subscription.user_id == user_id,
+        Subscription.status.has(name="active"),
+        Subscription.end_date > datetime.utcnow()
+    )
+    if plan_type:
+        query = query.where(Plan.guy == plan_type)
+
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
 
 
 def require_access(
@@ -65,21 +143,16 @@ def require_access(
         subscription_required: Si se requiere suscripción (opcional)
         plan_type: Tipo específico de plan requerido (opcional)
         require_both: Si se requieren ambos (privilegio Y suscripción) o solo uno (privilegio O suscripción)
+
+    Las decisiones se guardan en la caché de autorización (`app.cores.authorization_cache`),
+    de modo que las peticiones repetidas de un mismo usuario no consultan la base de datos.
     """
     async def checker(
+        request: Request,
         authorization: Optional[str] = Header(None),
         db: AsyncSession = Depends(get_db)
     ):
-        if not authorization:
-            raise HTTPException(status_code=401, detail="Token not provided")
-        try:
-            scheme, token = authorization.split()
-            if scheme.lower() != "bearer":
-                raise HTTPException(status_code=401, detail="Invalid token format")
-
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        except (ValueError, JWTError):
-            raise HTTPException(status_code=401, detail="Invalid token")
+        payload = get_token_claims(request, authorization)
 
         user_id = payload.get("user_id")
         role_name = payload.get("role")
@@ -91,47 +164,24 @@ def require_access(
         has_subscription = False
 
         if privilege_name and action:
-            result = await db.execute(
-                select(Privilege).where(Privilege.name == privilege_name, Privilege.action == action)
-            )
-            privilege = result.scalar_one_or_none()
-            
-            if privilege:
-                result = await db.execute(
-                    select(PrivilegeUser).where(
-                        PrivilegeUser.user_id == user_id,
-                        PrivilegeUser.privilege_id == privilege.id,
-                        PrivilegeUser.status.has(name="active")
-                    )
-                )
-                privilege_user = result.scalar_one_or_none()
-
-                if not privilege_user:
-                    result = await db.execute(
-                        select(PrivilegeRole).join(Role).where(
-                            Role.name == role_name,
-                            PrivilegeRole.privilege_id == privilege.id,
-                            PrivilegeRole.status.has(name="active")
-                        )
-                    )
-                    privilege_role = result.scalar_one_or_none()
-                    has_privilege = privilege_role is not None
-                else:
-                    has_privilege = True
+            cached = get_privilege_decision(user_id, role_name, privilege_name, action)
+            if cached is not None:
+                has_privilege = cached
+            else:
+                has_privilege = await _has_privilege(db, user_id, role_name, privilege_name, action)
+                cache_privilege_decision(user_id, role_name, privilege_name, action, has_privilege)
 
         if subscription_required:
-            query = select(Subscription).join(Plan).where(
-                Subscription.user_id == user_id,
-                Subscription.status.has(name="active"),
-                Subscription.end_date > datetime.utcnow()
-            )
-            
-            if plan_type:
-                query = query.where(Plan.guy == plan_type)
-            
-            result = await db.execute(query)
-            subscription = result.scalar_one_or_none()
-            has_subscription = subscription is not None
+            cached = get_subscription_decision(user_id, plan_type)
+            if cached is not None:
+                has_subscription = cached
+            else:
+                subscription = await _get_active_subscription(db, user_id, plan_type)
+                has_subscription = subscription is not None
+                cache_subscription_decision(
+                    user_id, plan_type, has_subscription,
+                    subscription.end_date if subscription else None
+                )
 
         if privilege_name and action and subscription_required:
             if require_both:
@@ -1,12 +1,11 @@
 # apis/teachers/document_routes.py
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
 from fastapi.responses import StreamingResponse
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.apis.deps import auth_required, get_db
 from app.services.teachers.document_service import (
-    create_document_by_token, get_documents_by_token, get_user_id_from_token,
+    create_document_by_token, get_documents_by_token, get_user_id_from_claims,
     update_document_by_token
 )
 from app.schemas.teachers.document_schema import DocumentCreateResponse, DocumentCreateData, DocumentReadResponse
@@ -18,7 +17,6 @@ from app.cores.file_validator import FileValidator
 
 
 router = APIRouter()
-security = HTTPBearer()
 
 @router.post("/create/",
     response_model=DocumentCreateResponse,
@@ -29,7 +27,7 @@ async def create_document_route(
     description: str = Form(...),
     certificate: UploadFile = File(...),
     curriculum: UploadFile = File(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     try:
@@ -37,10 +35,9 @@ async def create_document_route(
         await FileValidator.validate_file(certificate, file_type="pdf", max_size=10*1024*1024)
         await FileValidator.validate_file(curriculum, file_type="pdf", max_size=10*1024*1024)
         
-        token = credentials.credentials
         document = await create_document_by_token(
             db=db,
-            token=token,
+            claims=claims,
             rfc=rfc,
             expertise_area=expertise_area,
             certificate_file=certificate,  # ← Nota: el parámetro se llama certificate_file
@@ -69,11 +66,10 @@ async def create_document_route(
     response_model=DocumentReadResponse,
     dependencies=[Depends(auth_required)])
 async def read_documents_route(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    docs = await get_documents_by_token(db, token)
+    docs = await get_documents_by_token(db, claims)
     return DocumentReadResponse(
         success=True,
         message="Lista de documentos",
@@ -94,15 +90,14 @@ async def read_documents_route(
 @router.get("/my-description/",
     dependencies=[Depends(auth_required)])
 async def get_my_document_description(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Consultar solo la descripción del documento del usuario autenticado.
     No requiere document_id, se obtiene automáticamente del token.
     """
-    token = credentials.credentials
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
     
     q = await db.execute(
         select(Document).where(Document.user_id == user_id)
@@ -122,15 +117,14 @@ async def get_my_document_description(
 @router.get("/my-expertise-area/",
     dependencies=[Depends(auth_required)])
 async def get_my_document_expertise_area(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Consultar solo el área de especialidad del documento del usuario autenticado.
     No requiere document_id, se obtiene automáticamente del token.
     """
-    token = credentials.credentials
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
     
     q = await db.execute(
         select(Document).where(Document.user_id == user_id)
@@ -157,7 +151,7 @@ async def update_document_route(
     description: str = Form(None),
     certificate: UploadFile = File(None),
     curriculum: UploadFile = File(None),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -171,10 +165,9 @@ async def update_document_route(
         if curriculum:
             await FileValidator.validate_file(curriculum, file_type="pdf", max_size=10*1024*1024)
         
-        token = credentials.credentials
         document = await update_document_by_token(
             db=db,
-            token=token,
+            claims=claims,
             document_id=document_id,
             rfc=rfc,
             expertise_area=expertise_area,
@@ -206,7 +199,7 @@ async def update_document_route(
 async def update_certificate_route(
     document_id: int,
     certificate: UploadFile = File(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -215,10 +208,9 @@ async def update_certificate_route(
     try:
         await FileValidator.validate_file(certificate, file_type="pdf", max_size=10*1024*1024)
         
-        token = credentials.credentials
         document = await update_document_by_token(
             db=db,
-            token=token,
+            claims=claims,
             document_id=document_id,
             certificate_file=certificate
         )
@@ -246,7 +238,7 @@ async def update_certificate_route(
 async def update_curriculum_route(
     document_id: int,
     curriculum: UploadFile = File(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -255,10 +247,9 @@ async def update_curriculum_route(
     try:
         await FileValidator.validate_file(curriculum, file_type="pdf", max_size=10*1024*1024)
         
-        token = credentials.credentials
         document = await update_document_by_token(
             db=db,
-            token=token,
+            claims=claims,
             document_id=document_id,
             curriculum_file=curriculum
         )
@@ -286,17 +277,16 @@ async def update_curriculum_route(
 async def update_rfc_route(
     document_id: int,
     rfc: str = Form(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Actualizar solo el RFC de un documento.
     """
     try:
-        token = credentials.credentials
         document = await update_document_by_token(
             db=db,
-            token=token,
+            claims=claims,
             document_id=document_id,
             rfc=rfc
         )
@@ -324,17 +314,16 @@ async def update_rfc_route(
 async def update_description_route(
     document_id: int,
     description: str = Form(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Actualizar solo la descripción de un documento.
     """
     try:
-        token = credentials.credentials
         document = await update_document_by_token(
             db=db,
-            token=token,
+            claims=claims,
             document_id=document_id,
             description=description
         )
@@ -362,17 +351,16 @@ async def update_description_route(
 async def update_expertise_area_route(
     document_id: int,
     expertise_area: str = Form(...),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Actualizar solo el área de especialidad de un documento.
     """
     try:
-        token = credentials.credentials
         document = await update_document_by_token(
             db=db,
-            token=token,
+            claims=claims,
             document_id=document_id,
             expertise_area=expertise_area
         )
@@ -401,11 +389,10 @@ async def update_expertise_area_route(
 async def download_document_route(
     document_id: int,
     kind: str,  # "certificate" | "curriculum"
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
 
     q = await db.execute(select(Document).where(Document.id == document_id, Document.user_id == user_id))
     doc = q.scalar_one_or_none()
@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Query
 from typing import Optional
@@ -13,7 +12,6 @@ from app.schemas.foro.foro_schema import (
 )
 
 router = APIRouter()
-security = HTTPBearer()
 
 
 # -----------------------------
@@ -22,11 +20,10 @@ security = HTTPBearer()
 @router.post("/create_foro/", response_model=ForoCreateResponse, dependencies=[Depends(auth_required)])
 async def create_foro_route(
     foro_data: ForoCreateRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    foro = await create_foro(db, token, foro_data)
+    foro = await create_foro(db, claims, foro_data)
 
     return ForoCreateResponse(
         success=True,
@@ -40,11 +37,10 @@ async def create_foro_route(
 @router.put("/update/me_foro/", response_model=ForoUpdateResponse, dependencies=[Depends(auth_required)])
 async def update_my_foro_route(
     foro_data: ForoUpdateMeRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    foro = await update_my_foro(db, token, foro_data)
+    foro = await update_my_foro(db, claims, foro_data)
 
     return ForoUpdateResponse(
         success=True,
@@ -60,12 +56,11 @@ async def update_my_foro_route(
 async def get_my_foros_route(
     offset: int = Query(0, ge=0),
     limit: int = Query(6, ge=1, le=50),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """Obtiene los foros del usuario autenticado"""
-    token = credentials.credentials
-    result = await get_my_foros(db, token, offset, limit)
+    result = await get_my_foros(db, claims, offset, limit)
     
     return ForoListResponse(
         success=True,
@@ -83,12 +78,11 @@ async def get_my_foros_route(
 async def get_recent_foros_route(
     offset: int = Query(0, ge=0),
     limit: int = Query(6, ge=1, le=50),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """Obtiene los foros más recientes"""
-    token = credentials.credentials
-    result = await get_recent_foros(db, token, offset, limit)  
+    result = await get_recent_foros(db, claims, offset, limit)  
     
     return ForoListResponse(
         success=True,
@@ -115,11 +109,10 @@ from app.schemas.foro.foro_comment_schema import (
 @router.post("/create_foro_comment/", response_model=ForoCommentCreateResponse, dependencies=[Depends(auth_required)])
 async def create_foro_comment_route(
     comment_data: ForoCommentCreateRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    comment = await create_foro_comment(db, token, comment_data)
+    comment = await create_foro_comment(db, claims, comment_data)
     return ForoCommentCreateResponse(
         success=True,
         message="Comentario creado exitosamente",
@@ -132,11 +125,10 @@ async def create_foro_comment_route(
 @router.put("/update/me_foro_comment/", response_model=ForoCommentUpdateResponse, dependencies=[Depends(auth_required)])
 async def update_my_foro_comment_route(
     comment_data: ForoCommentUpdateMeRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    comment = await update_my_foro_comment(db, token, comment_data)
+    comment = await update_my_foro_comment(db, claims, comment_data)
     return ForoCommentUpdateResponse(
         success=True,
         message="Comentario actualizado exitosamente",
@@ -149,11 +141,10 @@ async def update_my_foro_comment_route(
 @router.delete("/delete/me_foro_comment/", response_model=ForoCommentDeleteResponse, dependencies=[Depends(auth_required)])
 async def delete_my_foro_comment_route(
     delete_data: ForoCommentDeleteMeRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    await delete_my_foro_comment(db, token, delete_data)
+    await delete_my_foro_comment(db, claims, delete_data)
     return ForoCommentDeleteResponse(
         success=True,
         message="Comentario eliminado exitosamente"
@@ -168,12 +159,11 @@ async def delete_my_foro_comment_route(
 async def get_my_comments_route(
     offset: int = Query(0, ge=0),
     limit: int = Query(6, ge=1, le=50),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """Obtiene los comentarios del usuario autenticado"""
-    token = credentials.credentials
-    result = await get_my_comments(db, token, offset, limit)
+    result = await get_my_comments(db, claims, offset, limit)
     
     return ForoCommentListResponse(
         success=True,
@@ -191,12 +181,11 @@ async def get_my_comments_route(
 async def get_recent_comments_route(
     offset: int = Query(0, ge=0),
     limit: int = Query(6, ge=1, le=50),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """Obtiene los comentarios más recientes"""
-    token = credentials.credentials
-    result = await get_recent_comments(db, token, offset, limit)
+    result = await get_recent_comments(db, claims, offset, limit)
     
     return ForoCommentListResponse(
         success=True,
@@ -227,11 +216,10 @@ from app.schemas.foro.foro_reply_comment_schema import (
 @router.post("/create_foro_reply_comment/", response_model=ForoReplyCommentCreateResponse, dependencies=[Depends(auth_required)])
 async def create_foro_reply_comment_route(
     reply_data: ForoReplyCommentCreateRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    reply = await create_foro_reply_comment(db, token, reply_data)
+    reply = await create_foro_reply_comment(db, claims, reply_data)
     return ForoReplyCommentCreateResponse(
         success=True,
         message="Respuesta creada exitosamente",
@@ -244,11 +232,10 @@ async def create_foro_reply_comment_route(
 @router.put("/update/me_foro_reply_comment/", response_model=ForoReplyCommentUpdateResponse, dependencies=[Depends(auth_required)])
 async def update_my_foro_reply_comment_route(
     reply_data: ForoReplyCommentUpdateMeRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    reply = await update_my_foro_reply_comment(db, token, reply_data)
+    reply = await update_my_foro_reply_comment(db, claims, reply_data)
     return ForoReplyCommentUpdateResponse(
         success=True,
         message="Respuesta actualizada exitosamente",
@@ -261,11 +248,10 @@ async def update_my_foro_reply_comment_route(
 @router.delete("/delete/me_foro_reply_comment/", response_model=ForoReplyCommentDeleteResponse, dependencies=[Depends(auth_required)])
 async def delete_my_foro_reply_comment_route(
     delete_data: ForoReplyCommentDeleteMeRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
-    token = credentials.credentials
-    await delete_my_foro_reply_comment(db, token, delete_data)
+    await delete_my_foro_reply_comment(db, claims, delete_data)
     return ForoReplyCommentDeleteResponse(
         success=True,
         message="Respuesta eliminada exitosamente"
@@ -281,12 +267,11 @@ async def delete_my_foro_reply_comment_route(
 async def get_my_replies_route(
     offset: int = Query(0, ge=0),
     limit: int = Query(6, ge=1, le=50),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """Obtiene las respuestas del usuario autenticado"""
-    token = credentials.credentials
-    result = await get_my_replies(db, token, offset, limit)
+    result = await get_my_replies(db, claims, offset, limit)
     
     return ForoReplyCommentListResponse(
         success=True,
@@ -304,12 +289,11 @@ async def get_my_replies_route(
 async def get_recent_replies_route(
     offset: int = Query(0, ge=0),
     limit: int = Query(6, ge=1, le=50),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    claims: dict = Depends(auth_required),
     db: AsyncSession = Depends(get_db)
 ):
     """Obtiene las respuestas más recientes"""
-    token = credentials.credentials
-    result = await get_recent_replies(db, token, offset, limit)
+    result = await get_recent_replies(db, claims, offset, limit)
     
     return ForoReplyCommentListResponse(
         success=True,
@@ -6,7 +6,7 @@ from app.services.notifications import (
     get_user_notifications, 
     mark_notification_as_read
 )
-from app.apis.deps import auth_required, get_db
+from app.apis.deps import auth_required, get_db, get_read_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.get("/mis-notificaciones", response_model=GetNotificationsResponse)
 async def obtener_notificaciones(
     limit: int = Query(10, ge=1, le=50, description="Número máximo de notificaciones"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_data: dict = Depends(auth_required)
 ):
     """
@@ -18,7 +18,7 @@ from app.services.teachers.price_service import (
     get_price_availability_by_token,
 )
 from app.apis.deps import auth_required, get_db
-from app.cores.token import verify_token
+from app.cores.token import verify_access_token
 from app.models.teachers.price import Price
 from sqlalchemy import select
 
@@ -118,7 +118,7 @@ async def get_my_hourly_price(
     No requiere parámetros, se obtiene automáticamente del token.
     """
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_access_token(token)
     user_id = payload.get("user_id")
     
     if not user_id:
@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.apis.deps import get_db, public_access
+from app.apis.deps import get_read_db, public_access
+from app.cores.response_cache import response_cache
 from app.models.teachers.video import Video
 from app.models.users.user import User
 from app.schemas.teachers.video_schema import VideoResponse
+from app.services.teachers.public_catalog_cache import PUBLIC_TEACHERS_WITH_VIDEOS
+from app.services.teachers.teachers_public_service import PublicService
+from app.services.utils.pagination_service import PaginationService
 
 router = APIRouter()
 
@@ -13,7 +19,7 @@ router = APIRouter()
 @router.get("/teacher/{teacher_id}", response_model=VideoResponse)
 async def get_teacher_video_public(
     teacher_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     _: None = Depends(public_access)
 ):
     """
@@ -90,24 +96,33 @@ async def get_teacher_video_public(
 
 @router.get("/teachers/with-videos")
 async def get_teachers_with_videos_public(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    limit: int = Query(20, ge=1, le=100, description="Número máximo de profesores por página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto en next_cursor"),
+    db: AsyncSession = Depends(get_read_db),
     _: None = Depends(public_access)
 ):
     """
-    Obtiene una lista de todos los profesores que tienen videos de presentación disponibles.
+    Obtiene, paginada por cursor, la lista de profesores activos con video de presentación
+    público o no listado e incrustable (del video más reciente al más antiguo).
+    
+    `total` es el número de profesores listables en todas las páginas (no solo en esta).
     
     Este endpoint público permite ver qué profesores tienen videos de presentación
     para facilitar la navegación y descubrimiento de profesores.
     
     Args:
+        request (Request): Petición (encabezado `If-None-Match`)
+        limit (int): Número máximo de profesores por página
+        cursor (str): Cursor opaco de la página siguiente (`next_cursor` de la respuesta anterior)
         db (AsyncSession): Sesión de base de datos
         _ (None): Dependencia de acceso público (sin autenticación)
     
     Returns:
-        dict: Lista de profesores con sus videos básicos
+        dict: Página de profesores con sus videos básicos y el cursor de la siguiente
         
     Example:
-        GET /api/public/videos/teachers/with-videos
+        GET /api/public/videos/teachers/with-videos?limit=20
         
         Response:
         {
@@ -127,42 +142,47 @@ async def get_teachers_with_videos_public(
                     }
                 }
             ],
-            "total": 1
+            "total": 1,
+            "next_cursor": null,
+            "has_more": false
         }
+    
+    La respuesta se cachea (con `ETag`) y se invalida cuando un docente guarda su video.
     """
+    return await response_cache.respond(
+        request,
+        PUBLIC_TEACHERS_WITH_VIDEOS,
+        {"limit": limit, "cursor": cursor},
+        lambda: _teachers_with_videos(db, limit, cursor)
+    )
+
+
+async def _teachers_with_videos(db: AsyncSession, limit: int, cursor: Optional[str]) -> dict:
     try:
-        # Query para obtener profesores con videos usando JOIN
-        query = select(User, Video).join(Video, User.id == Video.user_id)
-        result = await db.execute(query)
-        teachers_with_videos = result.all()
+        before_id = None
+        if cursor:
+            before_id = PaginationService.decode_cursor(cursor).get("before_id")
+            if not isinstance(before_id, int):
+                raise ValueError("Cursor de paginación inválido")
         
-        # Formatear respuesta
-        teachers_data = []
-        for teacher, video in teachers_with_videos:
-            teacher_data = {
-                "teacher_id": teacher.id,
-                "teacher_name": f"{teacher.first_name} {teacher.last_name}",
-                "video": {
-                    "id": video.id,
-                    "youtube_video_id": video.youtube_video_id,
-                    "title": video.title,
-                    "thumbnail_url": video.thumbnail_url,
-                    "duration_seconds": video.duration_seconds,
-                    "embed_url": video.embed_url,
-                    "privacy_status": video.privacy_status,
-                    "embeddable": video.embeddable,
-                    "created_at": video.created_at.isoformat() if video.created_at else None
-                }
-            }
-            teachers_data.append(teacher_data)
+        result = await PublicService.get_teachers_with_videos(db, limit=limit, before_id=before_id)
+        teachers_data = result["teachers"]
+        
+        next_cursor = None
+        if result["has_more"]:
+            next_cursor = PaginationService.encode_cursor({"before_id": teachers_data[-1]["video"]["id"]})
         
         return {
             "success": True,
             "message": "Profesores con videos obtenidos exitosamente",
             "data": teachers_data,
-            "total": len(teachers_data)
+            "total": result["total"],
+            "next_cursor": next_cursor,
+            "has_more": result["has_more"]
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         # Error interno
         raise HTTPException(
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from app.apis.deps import get_db
+from app.apis.deps import get_read_db
+from app.cores.response_cache import response_cache
+from app.services.teachers.public_catalog_cache import PUBLIC_TEACHERS, PUBLIC_TEACHER_SEARCH
 from app.services.teachers.teachers_public_service import PublicService
 from app.schemas.teachers.teachers_public_shema import PublicTeacherProfile, TeacherSearchResponse, TeacherSearchResult
 from pydantic import BaseModel
@@ -19,18 +21,32 @@ class PaginationResponse(BaseModel):
 
 @router.get("/teachers/", response_model=PaginationResponse)
 async def public_access(
+    request: Request,
     min_bookings: Optional[int] = None,
     page: int = Query(1, ge=1, description="Número de página"),
     page_size: int = Query(10, ge=1, le=100, description="Resultados por página"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
+    """Listado público de docentes (respuesta cacheada por sus parámetros, con ETag)."""
+    return await response_cache.respond(
+        request,
+        PUBLIC_TEACHERS,
+        {"min_bookings": min_bookings, "page": page, "page_size": page_size},
+        lambda: _public_teachers(db, min_bookings, page, page_size)
+    )
+
+
+async def _public_teachers(
+    db: AsyncSession,
+    min_bookings: Optional[int],
+    page: int,
+    page_size: int
+) -> PaginationResponse:
     try:
-        teachers_data = await PublicService.get_public_teachers(db, min_bookings)
-        total = len(teachers_data)
+        result = await PublicService.get_public_teachers(db, min_bookings, page, page_size)
+        total = result["total"]
         total_pages = total // page_size + (1 if total % page_size else 0)
-        start = (page - 1) * page_size
-        end = start + page_size
-        data = teachers_data[start:end]
+        data = result["teachers"]
         
         return PaginationResponse(
             success=True,
@@ -50,6 +66,7 @@ async def public_access(
 
 @router.get("/search-teachers/", response_model=TeacherSearchResponse)
 async def search_teachers_catalog(
+    request: Request,
     name: Optional[str] = Query(None, description="Buscar por nombre o apellido del docente"),
     subject: Optional[str] = Query(None, description="Buscar por materia o área de especialidad"),
     educational_level_id: Optional[int] = Query(None, description="Filtrar por nivel educativo (ID)"),
@@ -58,7 +75,7 @@ async def search_teachers_catalog(
     min_rating: Optional[float] = Query(None, ge=0, le=5, description="Calificación mínima (0-5 estrellas)"),
     page: int = Query(1, ge=1, description="Número de página"),
     page_size: int = Query(10, ge=1, le=100, description="Resultados por página (máx: 100)"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Búsqueda pública de docentes con filtros múltiples y paginación.
@@ -67,15 +84,46 @@ async def search_teachers_catalog(
     
     **Filtros disponibles:**
     - `name`: Busca en nombre y apellido
-    - `subject`: Materia o área de especialidad
+    - `subject`: Materia o área de especialidad (también busca en la descripción)
+    - `name` y `subject` usan el índice de texto completo: no distinguen acentos ni
+      mayúsculas y aceptan prefijos ("mate" encuentra "Matemáticas")
     - `educational_level_id`: Nivel educativo del docente
     - `min_price` / `max_price`: Rango de precio por hora
     - `min_rating`: Calificación mínima en estrellas (0-5)
     - `page`: Número de página (default: 1)
     - `page_size`: Resultados por página (default: 10, max: 100)
     
-    **Ordenamiento:** Por calificación descendente (⭐ más calificados primero)
+    **Ordenamiento:** Con `name`/`subject`, por relevancia del texto combinada con la
+    calificación; sin texto, por calificación descendente (⭐ más calificados primero)
+    
+    **Caché:** La respuesta se cachea por los filtros anteriores y lleva `ETag`; con
+    `If-None-Match` se responde 304 si no cambió.
     """
+    return await response_cache.respond(
+        request,
+        PUBLIC_TEACHER_SEARCH,
+        {
+            "name": name, "subject": subject, "educational_level_id": educational_level_id,
+            "min_price": min_price, "max_price": max_price, "min_rating": min_rating,
+            "page": page, "page_size": page_size
+        },
+        lambda: _search_teachers_catalog(
+            db, name, subject, educational_level_id, min_price, max_price, min_rating, page, page_size
+        )
+    )
+
+
+async def _search_teachers_catalog(
+    db: AsyncSession,
+    name: Optional[str],
+    subject: Optional[str],
+    educational_level_id: Optional[int],
+    min_price: Optional[float],
+    max_price: Optional[float],
+    min_rating: Optional[float],
+    page: int,
+    page_size: int
+) -> TeacherSearchResponse:
     try:
         result = await PublicService.search_teachers_catalog(
             db=db,
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-import stripe
 from app.apis.deps import get_db, auth_required
 from app.schemas.wallets.wallet_schema import (
     WalletCreateRequest,
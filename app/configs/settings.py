@@ -10,6 +10,10 @@ Se carga automáticamente desde el archivo `.env` o las variables de entorno del
 class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_URI: str
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
+    # Réplicas de solo lectura separadas por comas (opcional); sin réplicas se lee de la primaria
+    SQLALCHEMY_READ_REPLICA_URIS: str = ""
+    # Segundos que una réplica caída queda fuera de la rotación
+    DB_REPLICA_RETRY_SECONDS: float = 30
     SECRET_KEY: str
 
     admin_email: str
@@ -37,6 +41,42 @@ class Settings(BaseSettings):
     # Clave para cifrar/descifrar documentos
     doc_cipher_key: str
 
+    # Vigencia de los catálogos de referencia en memoria (segundos): cada worker los
+    # recarga al vencer, así los cambios hechos en otro proceso se ven a lo sumo con este retraso
+    REFERENCE_DATA_TTL_SECONDS: float = 300
+
+    # Pool de conexiones (MySQL/PostgreSQL; se ignoran con SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800      # segundos; menor que el wait_timeout del servidor o del proxy
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_METRICS_LOG_INTERVAL_SECONDS: float = 300   # 0 desactiva el log periódico de métricas del pool
+    DB_ECHO: bool = False
+    # Caché de sentencias compiladas de SQLAlchemy
+    DB_QUERY_CACHE_SIZE: int = 500
+    # Caché de sentencias preparadas de asyncpg (0 la desactiva, necesario detrás de pgbouncer en modo transacción)
+    DB_ASYNCPG_STATEMENT_CACHE_SIZE: int = 100
+    # SQLite (desarrollo): modo WAL para permitir lecturas concurrentes con una escritura
+    DB_SQLITE_WAL: bool = True
+    DB_SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # Rate limiting: almacenamiento compartido entre workers (redis://host:6379/0, rediss://,
+    # redis+sentinel://; requieren el paquete `redis`) o en memoria por proceso con LRU acotado
+    RATE_LIMIT_STORAGE_URI: str = "bounded-memory://"
+    RATE_LIMIT_MEMORY_MAX_KEYS: int = 10000
+    RATE_LIMIT_DEFAULT: str = "100/minute"
+
+    # Cada cuánto se eliminan los refresh tokens vencidos (segundos)
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: float = 3600
+
+    # Peso de la calificación (0..5 llevada a 0..1) frente a la relevancia del texto en la búsqueda de docentes
+    TEACHER_SEARCH_RATING_WEIGHT: float = 0.3
+
+    # Caché de respuestas de los endpoints públicos (catálogo de docentes y videos)
+    PUBLIC_CACHE_TTL_SECONDS: float = 60
+    PUBLIC_CACHE_MAX_ENTRIES: int = 1000
+
     model_config = ConfigDict(
         env_file=".env",
         extra="ignore",          # ignore unexpected env keys instead of raising
@@ -0,0 +1,113 @@
+"""
+Caché de decisiones de autorización usada por `require_access`.
+
+Guarda, por unos segundos, si un usuario tiene un privilegio (por rol o
+asignado directamente) y si tiene una suscripción activa, para que las rutas
+protegidas no consulten la base de datos en cada petición.
+
+Los servicios que modifican privilegios, asignaciones de privilegios o
+suscripciones deben llamar a las funciones `invalidate_*` después de confirmar
+sus cambios; el TTL corto acota el desfase en cualquier otro caso (p. ej.
+cambios hechos por scripts en otro proceso).
+"""
+
+import os
+from datetime import datetime
+from typing import Optional
+
+from app.cores.ttl_cache import TTLCache
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_SIZE = int(os.getenv("AUTH_CACHE_MAX_SIZE", "10000"))
+
+_PRIVILEGE = "privilege"
+_SUBSCRIPTION = "subscription"
+
+# Instancia global
+_decisions = TTLCache(max_size=AUTH_CACHE_MAX_SIZE, ttl_seconds=AUTH_CACHE_TTL_SECONDS)
+
+
+def _privilege_key(user_id: int, role_name: str, privilege_name: str, action: str) -> tuple:
+    return (_PRIVILEGE, user_id, role_name, privilege_name, action)
+
+
+def _subscription_key(user_id: int, plan_type: Optional[str]) -> tuple:
+    return (_SUBSCRIPTION, user_id, plan_type)
+
+
+def get_privilege_decision(user_id: int, role_name: str, privilege_name: str, action: str) -> Optional[bool]:
+    """Decisión de privilegio en caché, o None si hay que consultarla."""
+    return _decisions.get(_privilege_key(user_id, role_name, privilege_name, action))
+
+
+def cache_privilege_decision(user_id: int, role_name: str, privilege_name: str, action: str, allowed: bool) -> None:
+    """Guarda la decisión de privilegio de un usuario."""
+    _decisions.set(_privilege_key(user_id, role_name, privilege_name, action), allowed)
+
+
+def get_subscription_decision(user_id: int, plan_type: Optional[str]) -> Optional[bool]:
+    """Decisión de suscripción en caché, o None si hay que consultarla."""
+    return _decisions.get(_subscription_key(user_id, plan_type))
+
+
+def cache_subscription_decision(
+    user_id: int,
+    plan_type: Optional[str],
+    allowed: bool,
+    end_date: Optional[datetime] = None,
+) -> None:
+    """
+    Guarda la decisión de suscripción de un usuario.
+
+    Args:
+        end_date: Fin de la suscripción encontrada; la entrada no vive más allá de esa fecha
+    """
+    ttl = None
+    if allowed and end_date is not None:
+        remaining = (end_date - datetime.utcnow()).total_seconds()
+        ttl = max(0.0, min(AUTH_CACHE_TTL_SECONDS, remaining))
+    _decisions.set(_subscription_key(user_id, plan_type), allowed, ttl_seconds=ttl)
+
+
+def invalidate_privilege_decisions() -> int:
+    """
+    Descarta todas las decisiones de privilegio (se llama al crear, editar o
+    cambiar el estado de un privilegio o de una asignación privilegio-rol).
+
+    Returns:
+        Número de entradas descartadas
+    """
+    return _decisions.invalidate(lambda key: key[0] == _PRIVILEGE)
+
+
+def invalidate_subscription_decisions(user_id: Optional[int] = None) -> int:
+    """
+    Descarta las decisiones de suscripción de un usuario, o de todos si no se indica.
+
+    Returns:
+        Número de entradas descartadas
+    """
+    return _decisions.invalidate(
+        lambda key: key[0] == _SUBSCRIPTION and (user_id is None or key[1] == user_id)
+    )
+
+
+def invalidate_user_decisions(user_id: int) -> int:
+    """
+    Descarta todas las decisiones de un usuario (cambio de rol, privilegios
+    asignados directamente o suscripción).
+
+    Returns:
+        Número de entradas descartadas
+    """
+    return _decisions.invalidate(lambda key: key[1] == user_id)
+
+
+def clear_authorization_cache() -> None:
+    """Vacía la caché de autorización."""
+    _decisions.clear()
+
+
+def get_authorization_cache_stats() -> dict:
+    """Estadísticas de la caché de autorización."""
+    return _decisions.stats()
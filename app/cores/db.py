@@ -1,30 +1,339 @@
 """
 Configuración de SQLAlchemy para trabajar con base de datos de forma asincrónica.
-Soporta SQLite (desarrollo) y MySQL (producción) según variable de entorno.
+Soporta SQLite (desarrollo) y MySQL/PostgreSQL (producción) según variable de entorno.
+
+El pool de conexiones se configura desde `Settings` (DB_POOL_*), y cada engine
+lleva métricas de uso del pool (checkouts, esperas, timeouts) consultables con
+`get_pool_metrics`; `run_pool_metrics_log` las escribe en el log periódicamente.
+
+Las lecturas pueden repartirse entre réplicas (SQLALCHEMY_READ_REPLICA_URIS) con
+`read_replicas`; si no hay réplicas o ninguna responde se usa la primaria.
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 from app.configs.settings import settings
 
 DATABASE_URL = settings.SQLALCHEMY_DATABASE_URI
 
-connect_args = {}
-if DATABASE_URL.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
 
-engine = create_async_engine(
-    DATABASE_URL,
-    connect_args=connect_args,
-    echo=False
-)
+class PoolMetrics:
+    """
+    Contadores de uso de un pool de conexiones.
+
+    - `checkouts` / `checkins`: conexiones entregadas y devueltas.
+    - `checked_out` / `peak_checked_out`: conexiones en uso ahora y máximo observado.
+    - `connects`: conexiones nuevas abiertas contra la base de datos.
+    - `checkout_seconds_*`: tiempo que tardó cada checkout (espera de conexión libre
+      o apertura de una nueva); `timeouts` cuenta los checkouts que agotaron DB_POOL_TIMEOUT.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+
+    def record_checkout_time(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkout_seconds_total += seconds
+            self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def on_connect(self, *args) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, *args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, *args) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def on_invalidate(self, *args) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checkout_seconds_avg": round(self.checkout_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "checkout_seconds_max": round(self.checkout_seconds_max, 6),
+            }
+
+
+_pool_metrics: Dict[str, PoolMetrics] = {}
+_engines: Dict[str, AsyncEngine] = {}
+
+
+def _metrics_for(name: str) -> PoolMetrics:
+    return _pool_metrics.setdefault(name, PoolMetrics())
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool asíncrono que mide cuánto tarda cada checkout en obtener una conexión."""
+
+    def connect(self):
+        metrics = _metrics_for(self._orig_logging_name or "default")
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            metrics.record_checkout_time(time.perf_counter() - start, timed_out=True)
+            raise
+        metrics.record_checkout_time(time.perf_counter() - start)
+        return connection
+
+
+def _enable_sqlite_wal(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={settings.DB_SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
+def create_db_engine(database_url: str, name: str = "primary") -> AsyncEngine:
+    """
+    Crea un engine asíncrono con el pool configurado según el motor de base de datos.
+
+    - SQLite en memoria: `StaticPool` (una sola conexión compartida).
+    - SQLite en archivo: pool local y, si DB_SQLITE_WAL, modo WAL en cada conexión.
+    - MySQL/PostgreSQL: DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
+      DB_POOL_RECYCLE y DB_POOL_PRE_PING.
+    - asyncpg: caché de sentencias preparadas según DB_ASYNCPG_STATEMENT_CACHE_SIZE.
+
+    Args:
+        database_url: URL de conexión
+        name: Nombre del engine, usado para sus métricas de pool
+
+    Returns:
+        AsyncEngine registrado bajo `name`
+    """
+    url = make_url(database_url)
+    connect_args: dict = {}
+    engine_kwargs: dict = {
+        "echo": settings.DB_ECHO,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        "pool_logging_name": name,
+    }
+
+    is_sqlite = url.get_backend_name() == "sqlite"
+    is_sqlite_memory = is_sqlite and url.database in (None, "", ":memory:")
+
+    if is_sqlite:
+        connect_args["check_same_thread"] = False
+        engine_kwargs["poolclass"] = StaticPool if is_sqlite_memory else InstrumentedQueuePool
+    else:
+        engine_kwargs.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+
+    if url.get_driver_name() == "asyncpg":
+        cache_size = settings.DB_ASYNCPG_STATEMENT_CACHE_SIZE
+        connect_args["statement_cache_size"] = cache_size
+        url = url.update_query_dict({"prepared_statement_cache_size": str(cache_size)})
+
+    engine = create_async_engine(url, connect_args=connect_args, **engine_kwargs)
+
+    if is_sqlite and not is_sqlite_memory and settings.DB_SQLITE_WAL:
+        event.listen(engine.sync_engine, "connect", _enable_sqlite_wal)
+
+    metrics = _metrics_for(name)
+    event.listen(engine.sync_engine, "connect", metrics.on_connect)
+    event.listen(engine.sync_engine, "checkout", metrics.on_checkout)
+    event.listen(engine.sync_engine, "checkin", metrics.on_checkin)
+    event.listen(engine.sync_engine, "invalidate", metrics.on_invalidate)
+
+    _engines[name] = engine
+    return engine
+
+
+def get_pool_metrics(name: Optional[str] = None) -> Dict[str, dict]:
+    """
+    Métricas de los pools de conexiones.
+
+    Args:
+        name: Engine a consultar; si no se indica se devuelven todos
+
+    Returns:
+        Diccionario {nombre: métricas}, incluyendo el estado actual del pool
+    """
+    names = [name] if name else list(_engines)
+    result = {}
+    for engine_name in names:
+        engine = _engines.get(engine_name)
+        if engine is None:
+            continue
+        data = _metrics_for(engine_name).snapshot()
+        data["pool_status"] = engine.pool.status()
+        result[engine_name] = data
+    return result
+
+
+async def run_pool_metrics_log(interval_seconds: float) -> None:
+    """Tarea de fondo: escribe en el log las métricas de cada pool cada `interval_seconds` (se cancela al apagar)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for engine_name, data in get_pool_metrics().items():
+            logging.info(f"Pool de conexiones {engine_name}: {data}")
+
+
+def create_sessionmaker(bind: AsyncEngine) -> async_sessionmaker:
+    """Fábrica de sesiones con la configuración común de la aplicación."""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+class ReplicaSession(Session):
+    """
+    Sesión de solo lectura que elige su réplica al pedir la primera conexión,
+    no al abrirse: una petición que no llega a consultar (p. ej. una respuesta
+    servida desde caché) no toma conexión de ningún pool.
+    """
+
+    def __init__(self, *args, router: "ReadReplicaRouter", **kwargs):
+        super().__init__(*args, **kwargs)
+        self._router = router
+        self._selected_bind: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if self._selected_bind is None:
+            self._selected_bind = self._router.select_bind()
+        return self._selected_bind
+
+
+class ReadReplicaRouter:
+    """
+    Reparte las sesiones de solo lectura entre réplicas en round-robin.
+
+    - La réplica se elige en la primera consulta de la sesión (`ReplicaSession`):
+      se comprueba que entregue una conexión; si falla, queda fuera de la rotación
+      durante `retry_seconds` y se prueba la siguiente.
+    - Si no hay réplicas configuradas o ninguna está disponible, se usa la primaria.
+    - Las sesiones de réplica son solo para lecturas: las escrituras deben usar `get_db`.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica_urls: Sequence[str] = (),
+        retry_seconds: float = 30,
+        name: str = "replica",
+    ):
+        self.primary = primary
+        self.retry_seconds = retry_seconds
+        self._replicas: List[AsyncEngine] = [
+            create_db_engine(url, f"{name}-{index}")
+            for index, url in enumerate(replica_urls)
+        ]
+        self._sessions = async_sessionmaker(
+            class_=AsyncSession,
+            sync_session_class=ReplicaSession,
+            router=self,
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False
+        )
+        self._counter = itertools.count()
+        self._unavailable_until: Dict[int, float] = {}
+
+    @property
+    def replica_count(self) -> int:
+        return len(self._replicas)
+
+    def _candidates(self) -> List[int]:
+        if not self._replicas:
+            return []
+        start = next(self._counter) % len(self._replicas)
+        now = time.monotonic()
+        order = [(start + offset) % len(self._replicas) for offset in range(len(self._replicas))]
+        return [index for index in order if self._unavailable_until.get(index, 0) <= now]
+
+    async def open_session(self) -> AsyncSession:
+        """Sesión de lectura; la réplica (o la primaria como respaldo) se elige en su primera consulta."""
+        if not self._replicas:
+            return self.primary()
+        return self._sessions()
+
+    def select_bind(self) -> Engine:
+        """
+        Engine de la siguiente réplica disponible, o el de la primaria como respaldo.
+        Se ejecuta dentro de la sesión (contexto síncrono de SQLAlchemy).
+        """
+        for index in self._candidates():
+            replica = self._replicas[index].sync_engine
+            try:
+                # La conexión vuelve al pool y la sesión la toma enseguida
+                with replica.connect():
+                    return replica
+            except Exception as e:
+                self._unavailable_until[index] = time.monotonic() + self.retry_seconds
+                logging.warning(f"Réplica de lectura {index} no disponible, se omite por {self.retry_seconds}s: {e}")
+        return self.primary.kw["bind"].sync_engine
+
+    async def dispose(self) -> None:
+        """Cierra los pools de las réplicas."""
+        for replica in self._replicas:
+            await replica.dispose()
+
+
+def _split_urls(value: str) -> List[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+engine = create_db_engine(DATABASE_URL)
+
+async_session = create_sessionmaker(engine)
 
-async_session = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False
+# Instancia global
+read_replicas = ReadReplicaRouter(
+    async_session,
+    _split_urls(settings.SQLALCHEMY_READ_REPLICA_URIS),
+    settings.DB_REPLICA_RETRY_SECONDS,
 )
 
 Base = declarative_base()
@@ -0,0 +1,107 @@
+"""
+Perfilador de tiempos de importación (arranque en frío de los workers).
+
+Ejecuta `python -X importtime -c "import <módulo>"` en un proceso nuevo (sin
+módulos ya cargados) y resume el reporte: tiempo total y los módulos más caros.
+
+Uso:
+    python -m app.main --profile-imports            # top 25 módulos de app.main
+    python -m app.main --profile-imports --top 50
+"""
+
+import os
+import subprocess
+import sys
+from typing import List, NamedTuple
+
+# Presupuesto de tiempo para `import app.main` en un proceso nuevo
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "3.0"))
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class ImportProfile(NamedTuple):
+    target: str
+    timings: List[ImportTiming]
+
+    @property
+    def total_seconds(self) -> float:
+        """Tiempo acumulado de importar el módulo objetivo."""
+        for timing in self.timings:
+            if timing.module == self.target:
+                return timing.cumulative_us / 1_000_000
+        return sum(t.self_us for t in self.timings) / 1_000_000
+
+    @property
+    def modules(self) -> List[str]:
+        return [timing.module for timing in self.timings]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Convierte la salida de `-X importtime` en una lista de tiempos.
+
+    Cada línea tiene el formato `import time: <self> | <cumulative> | <módulo>`;
+    la sangría del nombre indica la profundidad en el árbol de importaciones.
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # encabezado "self [us] | cumulative | imported package"
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        timings.append(ImportTiming(stripped, int(parts[0]), int(parts[1]), depth))
+    return timings
+
+
+def profile_imports(target: str = "app.main") -> ImportProfile:
+    """
+    Importa `target` en un intérprete nuevo con `-X importtime`.
+
+    Args:
+        target: Módulo a importar
+
+    Returns:
+        Reporte con el tiempo de cada módulo importado
+
+    Raises:
+        RuntimeError: Si la importación falla en el subproceso
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {target}:\n{result.stderr[-2000:]}")
+    return ImportProfile(target, parse_importtime(result.stderr))
+
+
+def format_report(profile: ImportProfile, top: int = 25) -> str:
+    """Reporte legible: total, presupuesto y los `top` módulos con mayor tiempo propio."""
+    lines = [
+        f"import {profile.target}: {profile.total_seconds:.3f}s "
+        f"(presupuesto {IMPORT_TIME_BUDGET_SECONDS:.3f}s, {len(profile.timings)} módulos)",
+        f"{'propio ms':>10} {'acumulado ms':>13}  módulo",
+    ]
+    slowest = sorted(profile.timings, key=lambda t: t.self_us, reverse=True)[:top]
+    for timing in slowest:
+        lines.append(f"{timing.self_us / 1000:>10.1f} {timing.cumulative_us / 1000:>13.1f}  {timing.module}")
+    return "\n".join(lines)
+
+
+def run_profile(target: str = "app.main", top: int = 25) -> int:
+    """Imprime el reporte y devuelve 1 si se excede el presupuesto (para CI)."""
+    profile = profile_imports(target)
+    print(format_report(profile, top))
+    return 0 if profile.total_seconds <= IMPORT_TIME_BUDGET_SECONDS else 1
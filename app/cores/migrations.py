@@ -0,0 +1,110 @@
+"""
+Utilidades de migraciones (Alembic) usadas por la aplicación.
+
+El esquema se crea y actualiza con `alembic upgrade head` en cada despliegue;
+al arrancar, la aplicación solo verifica que la base de datos esté en la última
+versión (`verify_schema_version`) en lugar de crear tablas.
+
+Las bases creadas antes de Alembic (con `Base.metadata.create_all`) no tienen la
+tabla `alembic_version`; `stamp_legacy_baseline` las marca en la revisión base
+(0001) para que `alembic upgrade head` aplique solo las migraciones posteriores.
+
+Alembic se importa dentro de cada función para no cargarlo al importar la aplicación.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Set
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Revisión cuyo esquema coincide con el que creaba `create_all` antes de las migraciones
+BASELINE_REVISION = "0001"
+LEGACY_MARKER_TABLE = "users"
+
+
+def get_alembic_config() -> "Config":
+    """Configuración de Alembic del proyecto, independiente del directorio actual."""
+    from alembic.config import Config
+
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    return config
+
+
+def get_head_revisions() -> Set[str]:
+    """Revisiones `head` de los scripts de migración."""
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory.from_config(get_alembic_config()).get_heads())
+
+
+async def get_current_revisions(engine: AsyncEngine) -> Set[str]:
+    """Revisiones aplicadas en la base de datos (vacío si nunca se migró)."""
+    from alembic.runtime.migration import MigrationContext
+
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            lambda sync_conn: set(MigrationContext.configure(sync_conn).get_current_heads())
+        )
+
+
+def stamp_legacy_baseline(migration_context: "MigrationContext") -> bool:
+    """
+    Marca en BASELINE_REVISION una base creada con `create_all` (tiene `users` pero
+    no `alembic_version`). Se llama desde `alembic/env.py` antes de migrar.
+
+    Args:
+        migration_context: Contexto de Alembic con la conexión dentro de su transacción
+
+    Returns:
+        bool: True si la base se marcó en la revisión base
+    """
+    from alembic.script import ScriptDirectory
+    from sqlalchemy import inspect
+
+    tables = set(inspect(migration_context.connection).get_table_names())
+    if LEGACY_MARKER_TABLE not in tables or migration_context.version_table in tables:
+        return False
+    migration_context.stamp(ScriptDirectory.from_config(get_alembic_config()), BASELINE_REVISION)
+    return True
+
+
+async def verify_schema_version(engine: AsyncEngine) -> Set[str]:
+    """
+    Verifica que la base de datos esté en la última migración.
+
+    Returns:
+        Revisiones actuales de la base de datos
+
+    Raises:
+        RuntimeError: Si faltan migraciones por aplicar (o la base es más nueva que el código)
+    """
+    heads = get_head_revisions()
+    current = await get_current_revisions(engine)
+    if current != heads:
+        raise RuntimeError(
+            f"El esquema de la base de datos está en {sorted(current) or 'ninguna versión'} "
+            f"y el código espera {sorted(heads)}. Ejecuta `alembic upgrade head`."
+        )
+    return current
+
+
+async def upgrade_to_head(engine: AsyncEngine) -> None:
+    """Aplica las migraciones pendientes usando el engine recibido (pruebas y desarrollo)."""
+    from alembic import command
+
+    config = get_alembic_config()
+    config.attributes["configure_logger"] = False
+
+    def run_upgrade(sync_conn) -> None:
+        config.attributes["connection"] = sync_conn
+        command.upgrade(config, "head")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(run_upgrade)
@@ -0,0 +1,76 @@
+"""
+Almacenamientos del rate limiter (slowapi usa los storages de la librería `limits`).
+
+- `redis://`, `rediss://`, `redis+sentinel://`, `redis+cluster://`: contadores
+  compartidos por todos los workers (y réplicas) de la API.
+- `bounded-memory://`: contadores en memoria del proceso con un máximo de claves;
+  al llenarse se descartan las claves usadas hace más tiempo (LRU). Es el modo
+  por defecto en desarrollo y en las pruebas.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict
+from urllib.parse import urlparse
+
+from limits.storage import MemoryStorage
+
+BOUNDED_MEMORY_SCHEME = "bounded-memory"
+
+
+class BoundedMemoryStorage(MemoryStorage):
+    """
+    `MemoryStorage` con desalojo LRU: guarda como máximo `max_keys` claves
+    (una por cliente y ventana), para que la memoria no crezca con cada IP distinta.
+    """
+
+    STORAGE_SCHEME = [BOUNDED_MEMORY_SCHEME]
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, max_keys: int = 10000, **options):
+        self.max_keys = int(max_keys)
+        self.evictions = 0
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    def _touch(self, key: str) -> None:
+        """Marca la clave como usada recientemente y desaloja las más antiguas si se excede el máximo."""
+        evicted = []
+        with self._recent_lock:
+            self._recent[key] = None
+            self._recent.move_to_end(key)
+            while len(self._recent) > self.max_keys:
+                oldest, _ = self._recent.popitem(last=False)
+                evicted.append(oldest)
+        for oldest in evicted:
+            MemoryStorage.clear(self, oldest)
+            self.evictions += 1
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        self._touch(key)
+        return super().incr(key, expiry, amount)
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        self._touch(key)
+        return super().acquire_entry(key, limit, expiry, amount)
+
+    def clear(self, key: str) -> None:
+        with self._recent_lock:
+            self._recent.pop(key, None)
+        super().clear(key)
+
+    def reset(self) -> int | None:
+        with self._recent_lock:
+            self._recent.clear()
+        return super().reset()
+
+    def key_count(self) -> int:
+        """Número de claves vigentes en el LRU."""
+        return len(self._recent)
+
+
+def get_storage_options(storage_uri: str, memory_max_keys: int) -> Dict[str, int]:
+    """Opciones del storage según el esquema del URI (solo el modo en memoria acepta `max_keys`)."""
+    if urlparse(storage_uri).scheme == BOUNDED_MEMORY_SCHEME:
+        return {"max_keys": memory_max_keys}
+    return {}
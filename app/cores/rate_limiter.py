@@ -1,8 +1,25 @@
+import inspect
+from typing import Dict
+
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import _find_route_handler, _should_exempt
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.configs.settings import settings
+from app.cores.rate_limit_storage import get_storage_options
+
+
+# Peso de cada petición en el límite por defecto (por prefijo de ruta; las demás cuestan 1).
+# Los endpoints que llaman a Stripe o hacen búsquedas pesadas consumen más del cupo.
+ROUTE_COSTS: Dict[str, int] = {
+    "/api/bookings/verificar-booking/": 5,
+    "/api/public/search-teachers/": 3,
+}
 
 
 def get_client_ip(request: Request) -> str:
@@ -26,11 +43,35 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
+def get_route_cost(request: Request) -> int:
+    """Peso de la petición según `ROUTE_COSTS` (1 si la ruta no tiene peso propio)."""
+    path = request.url.path
+    for prefix, cost in ROUTE_COSTS.items():
+        if path.startswith(prefix):
+            return cost
+    return 1
+
+
+class WeightedLimiter(Limiter):
+    """
+    Limiter de slowapi cuyos límites por defecto cobran `cost(request)` por petición
+    en lugar de 1 (slowapi solo permite el costo en los límites por decorador).
+    """
+
+    def __init__(self, *args, default_cost=get_route_cost, **kwargs):
+        super().__init__(*args, **kwargs)
+        for group in self._default_limits:
+            group.cost = default_cost
+
+
 # Configurar limiter global
-limiter = Limiter(
+limiter = WeightedLimiter(
     key_func=get_client_ip,
-    default_limits=["100/minute"],  # Límite por defecto: 100 peticiones/minuto
-    storage_uri="memory://",  # Usar memoria (para producción considerar Redis)
+    default_limits=[settings.RATE_LIMIT_DEFAULT],  # Límite por defecto: 100 peticiones/minuto
+    # Redis comparte los contadores entre workers; en memoria cada worker lleva los suyos
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    storage_options=get_storage_options(settings.RATE_LIMIT_STORAGE_URI, settings.RATE_LIMIT_MEMORY_MAX_KEYS),
+    in_memory_fallback_enabled=True,  # Si Redis no responde, limitar en memoria en vez de fallar
     headers_enabled=True,  # Incluir headers de rate limit en respuestas
 )
 
@@ -48,3 +89,52 @@ def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSO
             "detail": f"Límite excedido: {exc.detail}",
         },
     )
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI que aplica los límites por defecto de `app.state.limiter`
+    (reemplaza a `SlowAPIMiddleware`, basado en BaseHTTPMiddleware).
+
+    Las rutas con `@limiter.limit(...)` se validan en su decorador. Los headers
+    X-RateLimit-* se agregan al mensaje `http.response.start` sin retener el
+    cuerpo, así que las respuestas en streaming no se bufferizan.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        app = scope["app"]
+        limiter: Limiter = app.state.limiter
+        handler = _find_route_handler(app.routes, scope) if limiter.enabled else None
+        if handler is None or _should_exempt(limiter, handler):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive=receive)
+        try:
+            limiter._check_request_limit(request, handler, True)
+        except RateLimitExceeded as exc:
+            exception_handler = app.exception_handlers.get(RateLimitExceeded, rate_limit_exceeded_handler)
+            response = exception_handler(request, exc)
+            if inspect.isawaitable(response):
+                response = await response
+            await response(scope, receive, send)
+            return
+
+        current_limit = getattr(request.state, "view_rate_limit", None)
+        if current_limit is None or not limiter._headers_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                limiter._inject_asgi_headers(MutableHeaders(scope=message), current_limit)
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit_headers)
@@ -0,0 +1,190 @@
+"""
+Caché de respuestas para endpoints públicos (anónimos e iguales para todos).
+
+La llave es el espacio de nombres del endpoint más los parámetros que el endpoint
+declara, ya validados (ordenados, sin valores vacíos): los query params que no
+declara no generan entradas nuevas. Cada entrada guarda el cuerpo JSON ya serializado
+y su ETag, así que un `If-None-Match` que coincide se responde con 304 sin cuerpo.
+
+- Single-flight: si varias peticiones piden la misma llave sin caché, solo una
+  ejecuta la consulta y las demás esperan su resultado.
+- Invalidación: los servicios que escriben los datos llaman a `invalidate`
+  después del commit. Un contador de generación por espacio de nombres evita
+  guardar un resultado calculado antes de la invalidación.
+
+`ResponseCacheBackend` define el almacenamiento; `InMemoryResponseCacheBackend`
+es la implementación por defecto (un solo proceso). Un backend compartido
+(p. ej. Redis) puede reemplazarla con `set_response_cache_backend`.
+"""
+
+import asyncio
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.configs.settings import settings
+from app.cores.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Respuesta serializada lista para reenviar."""
+    body: bytes
+    etag: str
+    media_type: str = "application/json"
+
+
+class ResponseCacheBackend(ABC):
+    """Interfaz del almacenamiento de respuestas."""
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[CachedResponse]:
+        """Respuesta guardada o None si no existe o expiró."""
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, response: CachedResponse, ttl_seconds: float) -> None:
+        """Guarda una respuesta durante `ttl_seconds`."""
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> int:
+        """Elimina todas las respuestas del espacio de nombres. Retorna cuántas se eliminaron."""
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """Backend en memoria del proceso sobre `TTLCache` (LRU acotada)."""
+
+    def __init__(self, max_entries: int = 1000):
+        self._cache = TTLCache(max_size=max_entries)
+
+    async def get(self, namespace: str, key: str) -> Optional[CachedResponse]:
+        return self._cache.get((namespace, key))
+
+    async def set(self, namespace: str, key: str, response: CachedResponse, ttl_seconds: float) -> None:
+        self._cache.set((namespace, key), response, ttl_seconds=ttl_seconds)
+
+    async def invalidate(self, namespace: str) -> int:
+        return self._cache.invalidate(lambda cache_key: cache_key[0] == namespace)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+def cache_key(params: Mapping[str, Any]) -> str:
+    """Parámetros ordenados y sin valores vacíos (`{"b": 2, "a": 1, "c": None}` -> `a=1&b=2`)."""
+    items = sorted((name, value) for name, value in params.items() if value is not None and value != "")
+    return "&".join(f"{name}={value}" for name, value in items)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compara el encabezado `If-None-Match` (lista o `*`, admite ETags débiles) con el ETag actual."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class ResponseCache:
+    """Caché de respuestas con ETag, single-flight e invalidación por espacio de nombres."""
+
+    def __init__(self, backend: ResponseCacheBackend, ttl_seconds: float = 60):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+
+    async def respond(
+        self,
+        request: Request,
+        namespace: str,
+        params: Mapping[str, Any],
+        producer: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None
+    ) -> Response:
+        """
+        Devuelve la respuesta cacheada (o 304) o la genera con `producer`.
+
+        Args:
+            request: Petición entrante (`If-None-Match`)
+            namespace: Espacio de nombres del endpoint
+            params: Parámetros declarados del endpoint que definen la respuesta (llave)
+            producer: Corrutina que arma el contenido (modelo Pydantic, dict, ...)
+            ttl_seconds: TTL de la entrada (por defecto el de la caché)
+
+        Returns:
+            Response con el JSON y encabezados ETag / Cache-Control, o 304 sin cuerpo
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        key = cache_key(params)
+
+        cached = await self.backend.get(namespace, key)
+        if cached is None:
+            cached = await self._produce_once(namespace, key, producer, ttl)
+
+        headers = {"ETag": cached.etag, "Cache-Control": f"public, max-age={int(ttl)}"}
+        if etag_matches(request.headers.get("if-none-match"), cached.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached.body, media_type=cached.media_type, headers=headers)
+
+    async def invalidate(self, *namespaces: str) -> int:
+        """Invalida los espacios de nombres indicados. Retorna cuántas entradas se eliminaron."""
+        removed = 0
+        for namespace in namespaces:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            removed += await self.backend.invalidate(namespace)
+        return removed
+
+    async def _produce_once(
+        self,
+        namespace: str,
+        key: str,
+        producer: Callable[[], Awaitable[Any]],
+        ttl: float
+    ) -> CachedResponse:
+        inflight_key = (namespace, key)
+        while (pending := self._inflight.get(inflight_key)) is not None:
+            try:
+                # shield: si esta petición se cancela, la consulta sigue para las demás
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # Se canceló la petición que consultaba: otra toma su lugar
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        generation = self._generations.get(namespace, 0)
+        try:
+            content = await producer()
+            body = json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            cached = CachedResponse(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+            if self._generations.get(namespace, 0) == generation:
+                await self.backend.set(namespace, key, cached, ttl)
+            future.set_result(cached)
+            return cached
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Evita el aviso "exception was never retrieved" cuando nadie más esperaba
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+
+# Instancia global
+response_cache = ResponseCache(
+    InMemoryResponseCacheBackend(max_entries=settings.PUBLIC_CACHE_MAX_ENTRIES),
+    ttl_seconds=settings.PUBLIC_CACHE_TTL_SECONDS
+)
+
+
+def set_response_cache_backend(backend: ResponseCacheBackend) -> None:
+    """Reemplaza el almacenamiento (p. ej. por uno compartido entre procesos)."""
+    response_cache.backend = backend
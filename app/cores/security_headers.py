@@ -1,58 +1,77 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-from typing import Callable
+from typing import Tuple
 
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+# Content Security Policy (CSP) - Configuración básica
+# Ajusta según tus necesidades (especialmente si usas CDNs)
+CSP_DIRECTIVES = (
+    "default-src 'self'",
+    "script-src 'self' 'unsafe-inline'",  # Ajustar según necesidades
+    "style-src 'self' 'unsafe-inline'",   # Ajustar según necesidades
+    "img-src 'self' data: https:",
+    "font-src 'self' data:",
+    "connect-src 'self'",
+    "frame-ancestors 'none'",
+    "base-uri 'self'",
+    "form-action 'self'",
+)
+
+# Headers ya codificados (nombre en minúsculas, como los espera ASGI); se calculan una sola vez
+SECURITY_HEADERS: Tuple[Tuple[bytes, bytes], ...] = (
+    # Prevenir MIME type sniffing
+    (b"x-content-type-options", b"nosniff"),
+    # Protección contra clickjacking
+    (b"x-frame-options", b"DENY"),
+    # Política de referrer (no enviar información sensible en URLs)
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    # Política de permisos del navegador
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+    # XSS Protection (legacy, pero algunos navegadores antiguos lo usan)
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"content-security-policy", "; ".join(CSP_DIRECTIVES).encode("latin-1")),
+    # Strict Transport Security (HSTS) - Solo para HTTPS
+    # Descomentar cuando uses HTTPS en producción
+    # (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    # Ocultar información del servidor
+    (b"server", b"OnlyCation"),
+)
+
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in SECURITY_HEADERS)
+
+
+class SecurityHeadersMiddleware:
     """
-    Middleware que agrega headers de seguridad a todas las respuestas.
-    
+    Middleware ASGI que agrega headers de seguridad a todas las respuestas.
+
     Protege contra:
     - XSS (Cross-Site Scripting)
     - Clickjacking
     - MIME type sniffing
     - Información de versión del servidor
+
+    Solo modifica el mensaje `http.response.start`; el cuerpo pasa sin
+    tocarse, por lo que las respuestas en streaming se envían por partes.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        # Prevenir MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        # Protección contra clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-        
-        # Política de referrer (no enviar información sensible en URLs)
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        # Política de permisos del navegador
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        
-        # XSS Protection (legacy, pero algunos navegadores antiguos lo usan)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        
-        # Content Security Policy (CSP) - Configuración básica
-        # Ajusta según tus necesidades (especialmente si usas CDNs)
-        csp_directives = [
-            "default-src 'self'",
-            "script-src 'self' 'unsafe-inline'",  # Ajustar según necesidades
-            "style-src 'self' 'unsafe-inline'",   # Ajustar según necesidades
-            "img-src 'self' data: https:",
-            "font-src 'self' data:",
-            "connect-src 'self'",
-            "frame-ancestors 'none'",
-            "base-uri 'self'",
-            "form-action 'self'"
-        ]
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
-        
-        # Strict Transport Security (HSTS) - Solo para HTTPS
-        # Descomentar cuando uses HTTPS en producción
-        # response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        # Ocultar información del servidor
-        response.headers["Server"] = "OnlyCation"
-        
-        return response
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Reemplaza (no duplica) los headers que la respuesta ya traiga
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name.lower() not in _SECURITY_HEADER_NAMES
+                ]
+                headers.extend(SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
@@ -1,16 +1,29 @@
 from datetime import datetime, timedelta, UTC
 from fastapi import HTTPException
 from jose import JWTError, jwt
+import hashlib
 import os
 import secrets
+import time
 from typing import Optional
 
+from app.cores.ttl_cache import TTLCache
+
 
 SECRET_KEY = os.getenv("SECRET_KEY", "UUr09BTA_9ZGHjl6Mz75FuUn-ftJli7yN2XMyt1myeA")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
 RESET_TOKEN_EXPIRE_MINUTES = 3  # 30 minutos para el token de recuperación
-REFRESH_TOKEN_EXPIRE_DAYS = 30
+REFRESH_TOKEN_EXPIRE_DAYS = 7
+
+# Caché de tokens ya verificados: evita repetir la verificación HMAC + JSON cuando
+# el mismo token llega en muchas peticiones. La llave es el SHA-256 del token (no
+# se guarda el token en claro) y ninguna entrada vive más allá de su `exp`.
+TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "4096"))
+
+# Instancia global
+_verified_tokens = TTLCache(max_size=TOKEN_CACHE_MAX_SIZE, ttl_seconds=TOKEN_CACHE_TTL_SECONDS)
 
 
 """ 
@@ -29,14 +42,55 @@ def create_access_token(data: dict):
 def create_refresh_token(data: dict):
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"type": "refresh", "exp": expire})
+    # `jti` aleatorio: dos tokens emitidos en el mismo segundo no comparten hash
+    to_encode.update({"type": "refresh", "exp": expire, "jti": secrets.token_urlsafe(16)})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 def verify_token(token: str):
-    try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except JWTError:
+    """
+    Verifica el token y devuelve sus claims (una copia; el original queda en caché).
+
+    Raises:
+        HTTPException: 401 si el token es inválido o expiró
+    """
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    claims = _verified_tokens.get(key)
+    if claims is None:
+        try:
+            claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Token inválido o expirado")
+
+        ttl = TOKEN_CACHE_TTL_SECONDS
+        if claims.get("exp") is not None:
+            ttl = min(ttl, claims["exp"] - time.time())
+        if ttl > 0:
+            _verified_tokens.set(key, claims, ttl_seconds=ttl)
+    return dict(claims)
+
+
+def verify_access_token(token: str):
+    """
+    Verifica un token de acceso: igual que `verify_token`, pero rechaza los refresh
+    tokens, que solo sirven para renovar la sesión.
+
+    Raises:
+        HTTPException: 401 si el token es inválido, expiró o es un refresh token
+    """
+    claims = verify_token(token)
+    if claims.get("type") == "refresh":
         raise HTTPException(status_code=401, detail="Token inválido o expirado")
+    return claims
+
+
+def clear_token_cache() -> None:
+    """Vacía la caché de tokens verificados (p. ej. al rotar SECRET_KEY)."""
+    _verified_tokens.clear()
+
+
+def get_token_cache_stats() -> dict:
+    """Estadísticas de la caché de tokens verificados."""
+    return _verified_tokens.stats()
 
 
 
@@ -0,0 +1,102 @@
+"""
+Caché en memoria acotada (LRU) con expiración por tiempo (TTL).
+
+Se usa para memorizar resultados costosos de calcular dentro del proceso
+(claves derivadas, decisiones de autorización, etc.). Es segura para hilos,
+por lo que puede compartirse entre el event loop y un pool de ejecutores.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Caché LRU acotada con expiración por entrada.
+
+    - `max_size`: número máximo de entradas; al superarlo se expulsa la menos usada.
+    - `ttl_seconds`: segundos de vida de cada entrada desde que se guarda.
+    - Lleva contadores de aciertos (`hits`), fallos (`misses`) y expulsiones (`evictions`).
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300):
+        if max_size <= 0:
+            raise ValueError("max_size debe ser mayor que 0")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Devuelve el valor guardado o `default` si no existe o ya expiró."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Guarda un valor; `ttl_seconds` permite sobrescribir el TTL por defecto."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        """Elimina una entrada y devuelve su valor (o None si no existía)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Elimina todas las entradas cuya llave cumpla `predicate`. Retorna cuántas se eliminaron."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia los contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def stats(self) -> dict:
+        """Estadísticas de uso de la caché."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
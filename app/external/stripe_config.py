@@ -1,7 +1,41 @@
-import stripe
+"""
+Configuración del SDK de Stripe.
+
+El SDK se importa y configura en el primer uso (no al importar la aplicación):
+los módulos usan `from app.external.stripe_config import stripe` y el proxy
+carga `stripe` con la API key de Settings la primera vez que se accede a un atributo.
+"""
+
+import threading
+
 from app.configs.settings import settings
 
-stripe.api_key = settings.STRIPE_SECRET_KEY
+_stripe_module = None
+_stripe_lock = threading.Lock()
+
+
+def get_stripe():
+    """Devuelve el módulo `stripe` ya configurado, importándolo una sola vez."""
+    global _stripe_module
+    if _stripe_module is None:
+        with _stripe_lock:
+            if _stripe_module is None:
+                import stripe as stripe_sdk
+
+                stripe_sdk.api_key = settings.STRIPE_SECRET_KEY
+                _stripe_module = stripe_sdk
+    return _stripe_module
+
+
+class _LazyStripe:
+    """Proxy de `stripe`: `stripe.checkout.Session.create(...)` importa el SDK en el primer acceso."""
+
+    def __getattr__(self, name):
+        return getattr(get_stripe(), name)
+
+
+stripe = _LazyStripe()
+
 
 class StripeConfig:
     def __init__(self):
@@ -9,7 +43,6 @@ class StripeConfig:
         self.public_key = settings.STRIPE_PUBLIC_KEY
 
     def init(self):
-        stripe.api_key = self.secret_key
+        get_stripe().api_key = self.secret_key
 
 stripe_config = StripeConfig()
-stripe_config.init()
\ No newline at end of file
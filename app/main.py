@@ -1,10 +1,23 @@
 # app/main.py
 
+import argparse
+import sys
+
 from app import create_app
 import uvicorn
 
 app = create_app()
 
-    
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor de la API de onlyCation.")
+    parser.add_argument("--profile-imports", action="store_true", help="Muestra el reporte de tiempos de importación y termina")
+    parser.add_argument("--top", type=int, default=25, help="Número de módulos del reporte de importación")
+    args = parser.parse_args()
+
+    if args.profile_imports:
+        from app.cores.import_profiler import run_profile
+
+        sys.exit(run_profile("app.main", args.top))
+
     uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -4,15 +4,29 @@ from .common.modality import Modality
 from .common.educational_level import EducationalLevel
 from .common.price_range import PriceRange
 from .common.verification_code import VerificationCode
+from .common.seed_run import SeedRun
+from .common.stripe_price import StripePrice
 
 from .users.user import User
 from .users.preference import Preference
+from .users.profile import Profile
+from .users.refresh_token import RefreshToken
 
 from .teachers.document import Document
 from .teachers.price import Price
 from .teachers.video import Video
+from .teachers.availability import Availability
+from .teachers.wallet import Wallet
+from .teachers.teacher_stat import TeacherStat
+from .teachers.teacher_search_document import TeacherSearchDocument
 
 from .booking.bookings import Booking 
+from .booking.payment_bookings import PaymentBooking
+from .booking.confirmation import Confirmation
+from .booking.reschedule_request import RescheduleRequest
+from .booking.assessment import Assessment
+
+from .refunds.refund_request import RefundRequest
 
 from .privileges.privilege import Privilege
 from .privileges.privilege_role import PrivilegeRole
@@ -26,3 +40,11 @@ from .subscriptions.payment_subscription import PaymentSubscription
 from .notifications.notifications import Notification
 from .notifications.user_notifications import User_notification
 
+from .chat.chat import Chat
+from .chat.message import Message
+
+from .foro.category import Category
+from .foro.foro import Foro
+from .foro.foro_comment import ForoComment
+from .foro.foro_reply_comment import ForoReplyComment
+
@@ -19,6 +19,13 @@ class Chat(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     is_blocked = Column(Boolean, default=False, nullable=False)
     
+    # Bandeja de entrada desnormalizada (se mantiene al escribir mensajes).
+    # last_message_id no lleva FK para evitar la dependencia circular chats <-> messages.
+    last_message_id = Column(Integer, nullable=True)
+    last_message_at = Column(DateTime(timezone=True), nullable=True)
+    student_unread_count = Column(Integer, default=0, server_default="0", nullable=False)
+    teacher_unread_count = Column(Integer, default=0, server_default="0", nullable=False)
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -34,5 +41,9 @@ class Chat(Base):
         # Restricción única para evitar chats duplicados
     )
     
+    def unread_attribute_for(self, user_id: int) -> str:
+        """Nombre de la columna de mensajes no leídos del participante `user_id`."""
+        return "student_unread_count" if user_id == self.student_id else "teacher_unread_count"
+    
     def __repr__(self):
         return f"<Chat(id={self.id}, student={self.student_id}, teacher={self.teacher_id})>"
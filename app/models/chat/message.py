@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.cores.db import Base
@@ -35,5 +35,10 @@ class Message(Base):
     chat = relationship("Chat", back_populates="messages")
     sender = relationship("User", backref="sent_messages")
     
+    __table_args__ = (
+        # Índice compuesto para la paginación por cursor (keyset) del historial
+        Index("ix_messages_chat_id_id", "chat_id", "id"),
+    )
+    
     def __repr__(self):
         return f"<Message(id={self.id}, chat={self.chat_id}, sender={self.sender_id}, encrypted={self.is_encrypted})>"
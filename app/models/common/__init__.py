@@ -3,4 +3,5 @@ from .role import Role
 from .modality import Modality
 from .educational_level import EducationalLevel
 from .price_range import PriceRange
-from .verification_code import VerificationCode
\ No newline at end of file
+from .verification_code import VerificationCode
+from .seed_run import SeedRun
\ No newline at end of file
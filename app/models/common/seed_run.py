@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.cores.db import Base
+
+
+class SeedRun(Base):
+    """Marca de un script de datos iniciales ya aplicado (nombre + checksum de su código)."""
+    __tablename__ = "seed_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False, unique=True)
+    checksum = Column(String(64), nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<SeedRun(name={self.name}, checksum={self.checksum[:8]})>"
@@ -1,3 +1,5 @@
 from .document import Document
 from .price import Price
-from .video import Video
\ No newline at end of file
+from .video import Video
+from .teacher_stat import TeacherStat
+from .teacher_search_document import TeacherSearchDocument
\ No newline at end of file
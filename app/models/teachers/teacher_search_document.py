@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text
+from sqlalchemy.sql import func
+from app.cores.db import Base
+
+# Índice de texto completo creado por la migración 0004 solo en MySQL (FULLTEXT)
+# y PostgreSQL (GIN sobre to_tsvector); env.py lo excluye de autogenerate.
+FULLTEXT_INDEX_NAME = "ix_teacher_search_documents_fulltext"
+
+
+class TeacherSearchDocument(Base):
+    """
+    Texto de búsqueda por docente: nombre, área de especialidad y descripción
+    normalizados (minúsculas y sin acentos). Lo mantiene `TeacherSearchService`.
+    """
+    __tablename__ = "teacher_search_documents"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    search_text = Column(Text, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<TeacherSearchDocument(user_id={self.user_id})>"
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from app.cores.db import Base
+
+
+class TeacherStat(Base):
+    """
+    Agregados por docente (calificación promedio, reservas y clases completadas).
+    Se actualizan de forma incremental (`TeacherStatsService`) para que el catálogo
+    filtre y ordene sobre columnas indexadas en lugar de recalcular el AVG en cada petición.
+    """
+    __tablename__ = "teacher_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    avg_rating = Column(Float, nullable=False, default=0, server_default="0", index=True)
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    total_bookings = Column(Integer, nullable=False, default=0, server_default="0", index=True)
+    completed_classes = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<TeacherStat(user_id={self.user_id}, avg_rating={self.avg_rating}, total_bookings={self.total_bookings})>"
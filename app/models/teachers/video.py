@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from app.cores.db import Base
 from sqlalchemy.sql import func
@@ -26,8 +26,10 @@ class Video(Base):
     user = relationship("User", backref="teacher_videos")
     
     # Constraint: Un usuario solo puede tener un video
+    # Índice: listado público (videos públicos e incrustables, por id descendente)
     __table_args__ = (
         UniqueConstraint('user_id', name='uq_user_video'),
+        Index('ix_videos_public_listing', 'privacy_status', 'embeddable', 'id'),
     )
 
     def __repr__(self):
@@ -1,2 +1,3 @@
 from .user import User
-from .preference import Preference
\ No newline at end of file
+from .preference import Preference
+from .refresh_token import RefreshToken
\ No newline at end of file
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, String
+from sqlalchemy.sql import func
+from app.cores.db import Base
+
+
+class RefreshToken(Base):
+    """
+    Refresh token emitido en el login. Solo se guarda el SHA-256 del JWT (índice único),
+    así que renovar la sesión es una búsqueda puntual por `token_hash`.
+    Al rotar, el token usado queda revocado (`revoked_at`) y se emite uno nuevo.
+    """
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<RefreshToken(user_id={self.user_id}, expires_at={self.expires_at}, revoked={self.revoked_at is not None})>"
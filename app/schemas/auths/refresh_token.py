@@ -5,6 +5,7 @@ class RefreshTokenRequest(BaseModel):
 
 class RefreshTokenData(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str
 
 class RefreshTokenResponse(BaseModel):
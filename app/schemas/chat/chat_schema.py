@@ -76,6 +76,9 @@ class MessageListResponse(BaseModel):
     data: List[MessageResponse]
     total: int
     chat_id: int
+    next_cursor: Optional[str] = Field(None, description="Cursor opaco para cargar mensajes más antiguos")
+    prev_cursor: Optional[str] = Field(None, description="Cursor opaco para cargar mensajes más nuevos")
+    has_more: Optional[bool] = Field(None, description="Indica si hay más mensajes en la dirección de la página (más nuevos con after_id, más antiguos en otro caso)")
 
 
 # ============================================================================
@@ -87,6 +90,11 @@ class MarkAsReadRequest(BaseModel):
     message_ids: List[int] = Field(..., description="IDs de los mensajes a marcar como leídos")
 
 
+class MarkReadUpToRequest(BaseModel):
+    """Esquema para marcar como leído todo lo recibido hasta un mensaje (marca de agua)"""
+    message_id: int = Field(..., ge=1, description="ID del último mensaje visto")
+
+
 class ChatSummaryResponse(BaseModel):
     """Esquema para resumen de chat (último mensaje, contador no leídos)"""
     chat_id: int
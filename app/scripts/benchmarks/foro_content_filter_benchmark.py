@@ -0,0 +1,73 @@
+"""
+Micro-benchmark del filtro de contenido del foro.
+
+Compara la verificación anterior (better-profanity + bucle palabras × groserías)
+contra el motor compilado de una sola pasada, sobre descripciones de ~1k caracteres.
+
+Uso:
+    python -m app.scripts.benchmarks.foro_content_filter_benchmark
+"""
+
+import random
+import timeit
+
+from better_profanity import Profanity
+
+from app.services.foro.content_filter import content_filter, normalize_text
+
+SAMPLE_WORDS = (
+    "hola", "tengo", "una", "duda", "sobre", "la", "clase", "de", "matematicas",
+    "ecuaciones", "derivadas", "integrales", "profesor", "tarea", "examen",
+    "ejercicio", "resolver", "problema", "gracias", "ayuda", "entender", "tema",
+)
+ITERATIONS = 200
+
+
+class LegacyForoFilter:
+    """Implementación anterior de `contains_profanity`, conservada solo para comparar."""
+
+    def __init__(self, bad_words):
+        self.bad_words = list(bad_words)
+        self.profanity = Profanity(self.bad_words)
+
+    def contains_profanity(self, text: str) -> tuple[bool, str]:
+        normalized_text = normalize_text(text)
+        if self.profanity.contains_profanity(normalized_text):
+            for word in self.bad_words:
+                if word in normalized_text:
+                    return True, word
+            return True, "palabra no identificada"
+        for word in normalized_text.split():
+            if word in self.bad_words:
+                return True, word
+            for bad_word in self.bad_words:
+                if len(bad_word) > 3 and bad_word in word:
+                    return True, bad_word
+        return False, ""
+
+
+def build_description(length: int = 1000, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = []
+    while sum(len(w) + 1 for w in words) < length:
+        words.append(rng.choice(SAMPLE_WORDS))
+    return " ".join(words)[:length]
+
+
+def main() -> None:
+    legacy = LegacyForoFilter(content_filter.bad_words)
+    clean = build_description()
+    dirty = clean[:-20] + " eres un pendejo"
+
+    for label, text in (("limpio", clean), ("con groseria al final", dirty)):
+        assert legacy.contains_profanity(text)[0] == content_filter.contains_profanity(text)[0]
+        before = timeit.timeit(lambda: legacy.contains_profanity(text), number=ITERATIONS) / ITERATIONS
+        after = timeit.timeit(lambda: content_filter.contains_profanity(text), number=ITERATIONS) / ITERATIONS
+        print(
+            f"{label:<24} anterior: {before * 1e6:9.1f} µs   "
+            f"motor: {after * 1e6:9.1f} µs   x{before / after:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
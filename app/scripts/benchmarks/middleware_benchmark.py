@@ -0,0 +1,105 @@
+"""
+Benchmark de los middlewares globales: peticiones por segundo sobre `GET /`.
+
+Compara la pila anterior (SecurityHeadersMiddleware y SlowAPIMiddleware sobre
+BaseHTTPMiddleware) con los middlewares ASGI puros actuales. Las peticiones se
+hacen en proceso con httpx + ASGITransport, sin red ni servidor.
+
+Uso:
+    python -m app.scripts.benchmarks.middleware_benchmark
+    python -m app.scripts.benchmarks.middleware_benchmark --requests 5000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.cores.rate_limiter import RateLimitMiddleware, WeightedLimiter, get_client_ip, rate_limit_exceeded_handler
+from app.cores.security_headers import CSP_DIRECTIVES, SecurityHeadersMiddleware
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """Implementación anterior (BaseHTTPMiddleware, CSP armado en cada respuesta), solo para comparar."""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Content-Security-Policy"] = "; ".join(list(CSP_DIRECTIVES))
+        response.headers["Server"] = "OnlyCation"
+        return response
+
+
+def build_app(asgi: bool) -> FastAPI:
+    """App mínima con `GET /` y la pila de middlewares anterior (`asgi=False`) o la actual."""
+    app = FastAPI()
+    # Límite alto: se mide el costo del middleware, no las respuestas 429
+    app.state.limiter = WeightedLimiter(
+        key_func=get_client_ip,
+        default_limits=["1000000/minute"],
+        storage_uri="bounded-memory://",
+        storage_options={"max_keys": 1000},
+        headers_enabled=True,
+    )
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    if asgi:
+        app.add_middleware(SecurityHeadersMiddleware)
+        app.add_middleware(RateLimitMiddleware)
+    else:
+        app.add_middleware(LegacySecurityHeadersMiddleware)
+        app.add_middleware(SlowAPIMiddleware)
+
+    @app.get("/")
+    def root():
+        return {"status": "ok"}
+
+    return app
+
+
+async def measure(app: FastAPI, requests: int, concurrency: int) -> float:
+    """Peticiones por segundo de `requests` llamadas a `GET /` con `concurrency` clientes concurrentes."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        # Calentamiento (rutas, caches de slowapi)
+        for _ in range(50):
+            await client.get("/")
+
+        per_worker = requests // concurrency
+
+        async def worker():
+            for _ in range(per_worker):
+                response = await client.get("/")
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return per_worker * concurrency / elapsed
+
+
+async def run_benchmark(requests: int, concurrency: int) -> None:
+    before = await measure(build_app(asgi=False), requests, concurrency)
+    after = await measure(build_app(asgi=True), requests, concurrency)
+    print(f"GET /  ({requests} peticiones, concurrencia {concurrency})")
+    print(f"  BaseHTTPMiddleware: {before:>9.0f} req/s")
+    print(f"  ASGI puro:          {after:>9.0f} req/s  ({after / before:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de los middlewares globales sobre GET /.")
+    parser.add_argument("--requests", type=int, default=3000, help="Peticiones por pila de middlewares")
+    parser.add_argument("--concurrency", type=int, default=10, help="Clientes concurrentes")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,12 +18,13 @@ from app.models.subscriptions.subscription import Subscription
 from sqlalchemy import select
 from datetime import datetime, timedelta, time
 from app.models.common.stripe_price import StripePrice
-from app.external.stripe_config import stripe_config
-import stripe
+from app.external.stripe_config import stripe
 from app.cores.security import get_password_hash, rfc_hash_plain, encrypt_text, encrypt_bytes
 from app.models.common.status import Status
 import os
 from app.scripts.databases.create_alumno import crear_alumno
+from app.services.teachers.teacher_search_service import TeacherSearchService
+from app.services.teachers.teacher_stats_service import TeacherStatsService
 
 # =====================
 # Helpers (Docente de prueba)
@@ -976,7 +977,12 @@ async def crear_docente():
         )
         db.add(gt2_conf)
 
+        # Los documentos se insertan directo: se indexa el texto de búsqueda del docente
+        await TeacherSearchService.refresh_teacher(db, docente.id)
         await db.commit()
+
+        # Las reservas y evaluaciones se insertan directo: se recalculan sus agregados
+        await TeacherStatsService.rebuild_teacher_stats(db, [docente.id])
         print("Docente de prueba creado con documentos, video, alumno, booking, payment_booking, confirmation y assessment.")
 
 # Seed orchestrator disabled; usar crear_docente() desde app/__init__.py
@@ -6,8 +6,7 @@ from app.models.common.role import Role
 from app.models.subscriptions.plan import Plan
 from app.models.subscriptions.benefit import Benefit
 from app.models.subscriptions.plan_benefit import plan_benefits
-from app.external.stripe_config import stripe_config
-import stripe
+from app.external.stripe_config import stripe
 from datetime import datetime
 
 async def create_premium_plan():
@@ -5,6 +5,7 @@ from app.models.privileges.privilege import Privilege
 from app.models.common.role import Role
 from app.models.common.status import Status
 from app.models.privileges.privilege_role import PrivilegeRole
+from app.cores.authorization_cache import invalidate_privilege_decisions
 
 async def create_privileges_role():
     db: AsyncSession = async_session()
@@ -92,6 +93,7 @@ async def create_privileges_role():
                 ))
 
         await db.commit()
+        invalidate_privilege_decisions()
         print("Privileges and privilege-role relations created successfully.")
 
     except Exception as e:
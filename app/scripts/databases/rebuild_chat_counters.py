@@ -0,0 +1,29 @@
+"""
+Tarea de reparación: reconstruye el último mensaje y los contadores de no leídos
+de todos los chats a partir de la tabla `messages`.
+
+Uso:
+    python -m app.scripts.databases.rebuild_chat_counters
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cores.db import async_session
+from app.services.chat.chat_service import ChatService
+
+
+async def rebuild_chat_counters():
+    db: AsyncSession = async_session()
+    try:
+        updated = await ChatService.rebuild_inbox_counters(db)
+        print(f"✅ Contadores de {updated} chat(s) reconstruidos correctamente")
+    except Exception as e:
+        await db.rollback()
+        print(f"❌ Error al reconstruir contadores de chats: {e}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_chat_counters())
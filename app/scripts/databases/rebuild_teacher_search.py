@@ -0,0 +1,29 @@
+"""
+Tarea de reparación: regenera el índice de búsqueda de docentes
+(`teacher_search_documents`) a partir de usuarios y documentos.
+
+Uso:
+    python -m app.scripts.databases.rebuild_teacher_search
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cores.db import async_session
+from app.services.teachers.teacher_search_service import TeacherSearchService
+
+
+async def rebuild_teacher_search():
+    db: AsyncSession = async_session()
+    try:
+        indexed = await TeacherSearchService.rebuild_search_index(db)
+        print(f"✅ Índice de búsqueda regenerado para {indexed} docente(s)")
+    except Exception as e:
+        await db.rollback()
+        print(f"❌ Error al regenerar el índice de búsqueda de docentes: {e}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_teacher_search())
@@ -0,0 +1,29 @@
+"""
+Tarea de reparación: recalcula la tabla `teacher_stats` (calificación promedio,
+reservas y clases completadas) a partir de reservas y evaluaciones.
+
+Uso:
+    python -m app.scripts.databases.rebuild_teacher_stats
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cores.db import async_session
+from app.services.teachers.teacher_stats_service import TeacherStatsService
+
+
+async def rebuild_teacher_stats():
+    db: AsyncSession = async_session()
+    try:
+        rebuilt = await TeacherStatsService.rebuild_teacher_stats(db)
+        print(f"✅ Estadísticas de {rebuilt} docente(s) reconstruidas correctamente")
+    except Exception as e:
+        await db.rollback()
+        print(f"❌ Error al reconstruir estadísticas de docentes: {e}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_teacher_stats())
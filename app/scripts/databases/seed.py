@@ -0,0 +1,129 @@
+"""
+Carga los datos iniciales (status, roles, modalidades, privilegios, planes, ...)
+una sola vez por despliegue, después de `alembic upgrade head`.
+
+Cada paso se registra en la tabla `seed_runs` con el checksum del código de su
+script; en ejecuciones posteriores solo se vuelven a correr los pasos nuevos o
+cuyo script cambió.
+
+Uso:
+    alembic upgrade head
+    python -m app.scripts.databases.seed            # pasos pendientes
+    python -m app.scripts.databases.seed --force    # todos los pasos
+    python -m app.scripts.databases.seed --demo     # incluye el docente de prueba (borra sus reservas)
+"""
+
+import argparse
+import asyncio
+import hashlib
+import inspect
+from typing import Awaitable, Callable, List, NamedTuple, Sequence
+
+from sqlalchemy import select
+
+from app.cores.db import async_session
+from app.models.common.seed_run import SeedRun
+from app.scripts.databases.create_status import create_status
+from app.scripts.databases.create_user_admin import create_admin_user
+from app.scripts.databases.create_role import create_role
+from app.scripts.databases.create_educational_level import create_educational_level
+from app.scripts.databases.create_modality import create_modality
+from app.scripts.databases.create_privilege import create_privileges
+from app.scripts.databases.create_privilege_role import create_privileges_role
+from app.scripts.databases.create_price_ranges import create_prices_range
+from app.scripts.databases.create_plan import create_premium_plan, create_free_plan
+from app.scripts.databases.create_benefit import create_benefit
+from app.scripts.databases.create_docente import crear_docente
+from app.scripts.databases.create_categories import create_categories
+
+
+class SeedStep(NamedTuple):
+    name: str
+    run: Callable[[], Awaitable[None]]
+
+
+# El orden importa: los pasos posteriores dependen de los datos de los anteriores
+SEED_STEPS: Sequence[SeedStep] = (
+    SeedStep("status", create_status),
+    SeedStep("modality", create_modality),
+    SeedStep("role", create_role),
+    SeedStep("educational_level", create_educational_level),
+    SeedStep("privileges", create_privileges),
+    SeedStep("privileges_role", create_privileges_role),
+    SeedStep("admin_user", create_admin_user),
+    SeedStep("price_ranges", create_prices_range),
+    SeedStep("premium_plan", create_premium_plan),
+    SeedStep("free_plan", create_free_plan),
+    SeedStep("benefit", create_benefit),
+    SeedStep("categories", create_categories),
+)
+
+# Solo para entornos de prueba: recrea un docente con reservas y precios en Stripe
+DEMO_STEPS: Sequence[SeedStep] = (
+    SeedStep("demo_teacher", crear_docente),
+)
+
+
+def seed_checksum(step: SeedStep) -> str:
+    """SHA-256 del código del módulo que implementa el paso."""
+    module = inspect.getmodule(step.run)
+    source = inspect.getsource(module) if module else inspect.getsource(step.run)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+async def run_seeds(
+    steps: Sequence[SeedStep] = SEED_STEPS,
+    force: bool = False,
+    session_factory=async_session,
+) -> List[str]:
+    """
+    Ejecuta los pasos pendientes y registra su checksum en `seed_runs`.
+
+    Args:
+        steps: Pasos a considerar, en orden
+        force: Ejecutar todos los pasos aunque ya estén registrados
+        session_factory: Fábrica de sesiones para la tabla de marcas
+
+    Returns:
+        Nombres de los pasos ejecutados
+    """
+    async with session_factory() as db:
+        result = await db.execute(select(SeedRun.name, SeedRun.checksum))
+        applied = dict(result.all())
+
+    executed = []
+    for step in steps:
+        checksum = seed_checksum(step)
+        if not force and applied.get(step.name) == checksum:
+            print(f"⏭️  {step.name}: sin cambios, se omite")
+            continue
+
+        await step.run()
+
+        async with session_factory() as db:
+            marker = (
+                await db.execute(select(SeedRun).where(SeedRun.name == step.name))
+            ).scalar_one_or_none()
+            if marker:
+                marker.checksum = checksum
+            else:
+                db.add(SeedRun(name=step.name, checksum=checksum))
+            await db.commit()
+        executed.append(step.name)
+        print(f"✅ {step.name}: aplicado")
+
+    return executed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Carga los datos iniciales de la base de datos.")
+    parser.add_argument("--force", action="store_true", help="Ejecuta todos los pasos aunque ya estén aplicados")
+    parser.add_argument("--demo", action="store_true", help="Incluye los datos de prueba (docente demo)")
+    args = parser.parse_args()
+
+    steps = tuple(SEED_STEPS) + (tuple(DEMO_STEPS) if args.demo else ())
+    asyncio.run(run_seeds(steps, force=args.force))
+
+
+if __name__ == "__main__":
+    main()
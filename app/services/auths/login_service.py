@@ -2,13 +2,12 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
 from fastapi import HTTPException
 from app.models import User
-from app.cores.token import create_access_token, create_refresh_token
+from app.cores.token import create_access_token
 from app.cores.security import verify_password
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.validation.exception import unexpected_exception
-from app.models.common.verification_code import VerificationCode
-from datetime import datetime, timedelta
 from app.models.users.preference import Preference
+from app.services.auths.refresh_token_service import issue_refresh_token
 
 
 
@@ -38,34 +37,9 @@ async def login_user(db: AsyncSession, email: str, password: str):
 
         access_token = create_access_token(data=token_data)
 
-        result = await db.execute(
-            select(VerificationCode).where(
-                VerificationCode.email == user.email,
-                VerificationCode.purpose == "refresh_token",
-                VerificationCode.used == False,
-                VerificationCode.expires_at > datetime.utcnow()
-            ).order_by(VerificationCode.expires_at.desc())
-        )
-
-        existing_refresh = result.scalar_one_or_none()
-
-        if existing_refresh:
-            refresh_token = existing_refresh.code
-        else:
-            refresh_token = create_refresh_token(data=token_data)
-
-            code_entry = VerificationCode(
-                email=user.email,
-                role=user.role.name,
-                purpose="refresh_token",
-                code=refresh_token,
-                used=False,
-                expires_at=datetime.utcnow() + timedelta(days=7)
-            )
-
-
-            db.add(code_entry)
-            await db.commit()
+        # Cada login abre una sesión con su propio refresh token (se guarda solo su hash)
+        refresh_token = await issue_refresh_token(db, token_data)
+        await db.commit()
 
         # Buscar preference_id si es docente
         preference_id = None
@@ -1,40 +1,29 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete
-from datetime import datetime
-from app.models.common.verification_code import VerificationCode
+from app.models.users.user import User
+from app.services.auths.refresh_token_service import revoke_user_refresh_tokens
 
 
 '''
 Propósito: Invalidar refresh token en logout.
-Acción: Borra el token activo del usuario (no usado/no expirado).
+Acción: Revoca los refresh tokens vigentes del usuario (tabla refresh_tokens).
 Retorno: True (éxito) o False (no había token).
 '''
 
 async def logout_user(db: AsyncSession, email: str):
     try:
-        result = await db.execute(
-            select(VerificationCode).where(
-                VerificationCode.email == email,
-                VerificationCode.purpose == "refresh_token",
-                VerificationCode.used == False,
-                VerificationCode.expires_at > datetime.utcnow()
-            ).order_by(VerificationCode.expires_at.desc())
-        )
+        result = await db.execute(select(User.id).where(User.email == email))
+        user_id = result.scalar_one_or_none()
 
-        refresh_token = result.scalar_one_or_none()
-
-        if not refresh_token:
+        if not user_id:
             return False  # No hay sesión activa
 
-        await db.execute(
-            delete(VerificationCode).where(VerificationCode.id == refresh_token.id)
-        )
+        revoked = await revoke_user_refresh_tokens(db, user_id)
         await db.commit()
-        return True
+        return revoked > 0
 
     except Exception as e:
         import traceback
         print("ERROR:", e)
         traceback.print_exc()
-        raise e
\ No newline at end of file
+        raise e
@@ -1,40 +1,143 @@
-from datetime import datetime
-from jose import JWTError
+"""
+Refresh tokens guardados en la tabla `refresh_tokens`.
+
+Solo se guarda el SHA-256 del JWT (índice único), nunca el token en claro, así
+que validar un refresh token es una búsqueda puntual por `token_hash`.
+
+Cada renovación rota el token: el usado queda revocado y se entrega uno nuevo.
+Si llega un token ya rotado (posible robo), se revocan todas las sesiones del
+usuario. Las filas vencidas se eliminan periódicamente (`purge_expired_refresh_tokens`).
+"""
+
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
 from fastapi import HTTPException
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.models.common.verification_code import VerificationCode
-from app.cores.token import verify_token, create_access_token
 
-async def refresh_access_token(db: AsyncSession, refresh_token: str):
-    try:
-        payload = verify_token(refresh_token)
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+from app.cores.token import REFRESH_TOKEN_EXPIRE_DAYS, create_access_token, create_refresh_token, verify_token
+from app.models.users.refresh_token import RefreshToken
+
+logger = logging.getLogger(__name__)
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """SHA-256 (hex) del refresh token; es lo único que se guarda en la base de datos."""
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+
+async def issue_refresh_token(db: AsyncSession, token_data: dict) -> str:
+    """
+    Crea un refresh token para el usuario y registra su hash (el commit queda a cargo del llamador).
+
+    Args:
+        db: Sesión de base de datos
+        token_data: Claims del usuario (debe incluir `user_id`)
+
+    Returns:
+        El refresh token (JWT) para entregar al cliente
+    """
+    refresh_token = create_refresh_token(data=token_data)
+    db.add(RefreshToken(
+        user_id=token_data["user_id"],
+        token_hash=hash_refresh_token(refresh_token),
+        expires_at=datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    return refresh_token
+
+
+async def refresh_access_token(db: AsyncSession, refresh_token: str) -> Tuple[str, str, dict]:
+    """
+    Renueva el access token y rota el refresh token.
+
+    Args:
+        db: Sesión de base de datos
+        refresh_token: Refresh token recibido del cliente
+
+    Returns:
+        Tupla (access_token, nuevo refresh_token, claims del token recibido)
 
-    email = payload.get("email")
-    if not email:
-        raise HTTPException(status_code=400, detail="Error in email")
+    Raises:
+        HTTPException: 401 si el token es inválido, expiró, fue revocado o ya se usó
+    """
+    payload = verify_token(refresh_token)
 
+    # La vigencia se compara en SQL: evita mezclar fechas con y sin zona horaria según el driver
     result = await db.execute(
-        select(VerificationCode).where(
-            VerificationCode.email == email,
-            VerificationCode.purpose == "refresh_token",
-            VerificationCode.used == False,
-            VerificationCode.expires_at > datetime.utcnow()
-        ).order_by(VerificationCode.expires_at.desc())
+        select(RefreshToken).where(
+            RefreshToken.token_hash == hash_refresh_token(refresh_token),
+            RefreshToken.expires_at > datetime.now(timezone.utc),
+        )
     )
-
     record = result.scalar_one_or_none()
+    if not record:
+        raise HTTPException(status_code=401, detail="Update token invalid or not found")
 
-    if not record or record.code != refresh_token: # type: ignore
+    # Marca el token como usado solo si nadie más lo rotó (evita dos renovaciones concurrentes)
+    rotated = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == record.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+    if rotated.rowcount != 1:
+        await revoke_user_refresh_tokens(db, record.user_id)
+        await db.commit()
         raise HTTPException(status_code=401, detail="Update token invalid or not found")
 
-    access_token = create_access_token(data={
+    token_data = {
         "user_id": payload["user_id"],
         "email": payload["email"],
         "role": payload["role"],
         "statuses": payload["statuses"]
-    })
+    }
+    access_token = create_access_token(data=token_data)
+    new_refresh_token = await issue_refresh_token(db, token_data)
+    await db.commit()
+
+    return access_token, new_refresh_token, payload
+
+
+async def revoke_user_refresh_tokens(db: AsyncSession, user_id: int) -> int:
+    """Revoca todos los refresh tokens vigentes del usuario (logout). Retorna cuántos se revocaron."""
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+    return result.rowcount
+
+
+async def purge_expired_refresh_tokens(db: AsyncSession) -> int:
+    """
+    Elimina los refresh tokens vencidos. Los revocados se conservan hasta vencer
+    para poder detectar su reutilización.
+
+    Returns:
+        Número de filas eliminadas
+    """
+    # "fetch": la sesión no evalúa la fecha en Python (el driver puede devolverla sin zona horaria)
+    result = await db.execute(
+        delete(RefreshToken)
+        .where(RefreshToken.expires_at <= datetime.now(timezone.utc))
+        .execution_options(synchronize_session="fetch")
+    )
+    await db.commit()
+    return result.rowcount
+
 
-    return access_token, payload
+async def run_refresh_token_purge(session_factory, interval_seconds: float) -> None:
+    """Tarea de fondo: purga los refresh tokens vencidos cada `interval_seconds` (se cancela al apagar)."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_factory() as db:
+                purged = await purge_expired_refresh_tokens(db)
+            if purged:
+                logger.info("Refresh tokens vencidos eliminados: %s", purged)
+        except Exception:
+            logger.exception("Error al purgar refresh tokens vencidos")
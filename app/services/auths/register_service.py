@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.models import User, Role, Status
+from app.models import User
 from app.models.subscriptions.plan import Plan
 from app.models.subscriptions.payment_subscription import PaymentSubscription
 from app.models.subscriptions.subscription import Subscription
@@ -8,6 +8,8 @@ from app.schemas.auths.register_shema import RegisterUserRequest
 from app.services.validation.register_validater import validate_password,validate_privacy_policy_accepted,validate_first_name, validate_last_name
 from app.services.validation.exception import email_already_registered_exception, role_not_found_exception, status_not_found_exception, unexpected_exception
 from app.cores.security import get_password_hash
+from app.services.common.reference_data import reference_data
+from app.services.teachers.teacher_search_service import TeacherSearchService
 from fastapi import HTTPException
 from datetime import datetime
 
@@ -21,13 +23,11 @@ async def register_user(request: RegisterUserRequest, role_name: str, status_nam
             if result.scalars().first():
                 await email_already_registered_exception()
 
-            result = await db.execute(select(Role).filter(Role.name == role_name))
-            role = result.scalars().first()
+            role = await reference_data.get_role(db, role_name)
             if not role:
                 await role_not_found_exception(role_name)
 
-            result = await db.execute(select(Status).filter(Status.name == status_name))
-            status = result.scalars().first()
+            status = await reference_data.get_status(db, status_name)
             if not status:
                 await status_not_found_exception(status_name)
 
@@ -50,6 +50,8 @@ async def register_user(request: RegisterUserRequest, role_name: str, status_nam
 
             # Si es un docente, asignar plan gratuito por defecto
             if role_name == "teacher":
+                await TeacherSearchService.refresh_teacher(db, new_user.id)
+
                 # Buscar el plan gratuito
                 free_plan_result = await db.execute(
                     select(Plan).where(
@@ -61,10 +63,7 @@ async def register_user(request: RegisterUserRequest, role_name: str, status_nam
                 
                 if free_plan:
                     # Obtener status activo para la suscripción (diferente del usuario)
-                    active_status_result = await db.execute(
-                        select(Status).where(Status.name == "active")
-                    )
-                    active_status = active_status_result.scalar_one_or_none()
+                    active_status = await reference_data.get_status(db, "active")
                     
                     if active_status:
                         # Crear PaymentSubscription con status activo
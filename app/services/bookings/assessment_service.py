@@ -10,6 +10,8 @@ from app.models.booking.payment_bookings import PaymentBooking
 from app.models.booking.bookings import Booking
 from app.models.teachers.availability import Availability
 from app.models.users import User
+from app.services.teachers.teacher_stats_service import TeacherStatsService
+from app.services.teachers.public_catalog_cache import invalidate_public_catalog
 
 
 # Crear un assessment
@@ -51,8 +53,19 @@ async def create_assessment(db: AsyncSession, user_id: int, payment_booking_id:
     ).returning(Assessment)
 
     result = await db.execute(stmt)
+    assessment = result.scalar_one()
+
+    teacher_id = (await db.execute(
+        select(Availability.user_id)
+        .join(Booking, Booking.availability_id == Availability.id)
+        .where(Booking.id == payment_booking.booking_id)
+    )).scalar_one_or_none()
+    if teacher_id is not None:
+        await TeacherStatsService.record_assessment(db, teacher_id, assessment.qualification)
+
     await db.commit()
-    return result.scalar_one()
+    await invalidate_public_catalog()
+    return assessment
 
 
 
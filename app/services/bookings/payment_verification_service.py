@@ -7,7 +7,6 @@ from datetime import datetime, timedelta
 from app.models.booking.bookings import Booking
 from app.models.booking.payment_bookings import PaymentBooking
 from app.models.booking.confirmation import Confirmation
-from app.models.common.status import Status
 from app.models.users.user import User
 from app.models.teachers.availability import Availability
 from app.external.stripe_config import stripe
@@ -22,10 +21,11 @@ from app.services.notifications.booking_email_service import (
     send_new_booking_email_to_teacher
 )
 from app.services.bookings.room_service import generate_secure_room_link
+from app.services.common.reference_data import reference_data
+from app.services.teachers.teacher_stats_service import TeacherStatsService
 
 async def get_active_status(db: AsyncSession):
-    result = await db.execute(select(Status).where(Status.name == "active"))
-    return result.scalar_one_or_none()
+    return await reference_data.get_status(db, "active")
 
 async def verify_booking_payment_and_create_records(db: AsyncSession, session_id: str, user_id: int):
     # Obtener sesión de Stripe
@@ -144,6 +144,7 @@ async def verify_booking_payment_and_create_records(db: AsyncSession, session_id
     
     # Obtener teacher_id antes del commit para evitar problemas de sesión
     teacher_id = booking.availability.user_id
+    await TeacherStatsService.record_booking(db, teacher_id)
     
     # Notificar al estudiante sobre confirmación de reserva
     await send_booking_confirmation_to_student(db, user_id, booking_details)
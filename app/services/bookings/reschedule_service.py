@@ -12,6 +12,7 @@ from app.models.booking.confirmation import Confirmation
 from app.models.booking.payment_bookings import PaymentBooking
 from app.services.notifications.booking_notification_service import send_booking_rescheduled_notification
 from app.services.notifications.booking_email_service import send_booking_rescheduled_email
+from app.services.common.reference_data import reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +44,7 @@ async def reschedule_booking(
             raise HTTPException(status_code=404, detail="Reserva no encontrada o no pertenece al estudiante")
         
         # Validar que la reserva no esté cancelada
-        from app.models.common.status import Status
-        cancelled_status_result = await db.execute(select(Status).where(Status.name == "cancelled"))
-        cancelled_status = cancelled_status_result.scalar_one_or_none()
+        cancelled_status = await reference_data.get_status(db, "cancelled")
         
         if cancelled_status and booking.status_id == cancelled_status.id:
             raise HTTPException(status_code=400, detail="No puedes reagendar una reserva que ya está cancelada")
@@ -119,9 +118,7 @@ async def reschedule_booking(
         
         # Verificar que no haya conflictos con otras reservas en el nuevo horario
         # Obtener el ID del status 'cancelled'
-        from app.models.common.status import Status
-        cancelled_status_result = await db.execute(select(Status).where(Status.name == "cancelled"))
-        cancelled_status = cancelled_status_result.scalar_one_or_none()
+        cancelled_status = await reference_data.get_status(db, "cancelled")
         cancelled_status_id = cancelled_status.id if cancelled_status else None
         
         conflict_query = select(Booking).where(
@@ -56,12 +56,10 @@ async def create_booking_payment_session(db: AsyncSession, user: User, booking_d
 
     # 5. Validar que no hay traslape con otra reserva ya existente en esa disponibilidad
     from app.models.booking.bookings import Booking
-    from app.models.common.status import Status
+    from app.services.common.reference_data import reference_data
     
     # Obtener el ID del status 'cancelled'
-    cancelled_status_result = await db.execute(select(Status).where(Status.name == "cancelled"))
-    cancelled_status = cancelled_status_result.scalar_one_or_none()
-    cancelled_status_id = cancelled_status.id if cancelled_status else None
+    cancelled_status_id = await reference_data.get_status_id(db, "cancelled")
     
     overlap_result = await db.execute(
         select(Booking).where(
@@ -8,7 +8,6 @@ import logging
 
 from app.models.booking.reschedule_request import RescheduleRequest
 from app.models.booking.bookings import Booking
-from app.models.common.status import Status
 from app.services.utils.pagination_service import PaginationService
 from app.services.notifications.booking_notification_service import (
     send_reschedule_response_notification,
@@ -18,6 +17,7 @@ from app.services.notifications.booking_email_service import (
     send_reschedule_response_email,
     send_booking_rescheduled_email
 )
+from app.services.common.reference_data import reference_data
 logger = logging.getLogger(__name__)
 
 async def get_student_reschedule_requests(
@@ -31,8 +31,7 @@ async def get_student_reschedule_requests(
     """
     try:
         # Obtener el ID del status 'pending'
-        pending_status_result = await db.execute(select(Status).where(Status.name == "pending"))
-        pending_status = pending_status_result.scalar_one_or_none()
+        pending_status = await reference_data.get_status(db, "pending")
         pending_status_id = pending_status.id if pending_status else None
         
         # Construir query base con filtros
@@ -118,21 +117,18 @@ async def respond_to_reschedule_request(
             raise HTTPException(status_code=404, detail="Solicitud de reagendado no encontrada")
         
         # 2. Verificar que la solicitud esté pendiente
-        pending_status_result = await db.execute(select(Status).where(Status.name == "pending"))
-        pending_status = pending_status_result.scalar_one_or_none()
+        pending_status = await reference_data.get_status(db, "pending")
         
         if pending_status and request.status_id != pending_status.id:
             # Obtener el nombre del status actual
-            current_status_result = await db.execute(select(Status).where(Status.id == request.status_id))
-            current_status = current_status_result.scalar_one_or_none()
+            current_status = await reference_data.get_status_by_id(db, request.status_id)
             status_name = current_status.name if current_status else "unknown"
             raise HTTPException(status_code=400, detail=f"Esta solicitud ya fue {status_name}")
         
         # 3. Verificar que no haya expirado
         if datetime.utcnow() > request.expires_at:
             # Obtener el ID del status 'expired' o crear uno si no existe
-            expired_status_result = await db.execute(select(Status).where(Status.name == "expired"))
-            expired_status = expired_status_result.scalar_one_or_none()
+            expired_status = await reference_data.get_status(db, "expired")
             if expired_status:
                 request.status_id = expired_status.id
             else:
@@ -145,8 +141,7 @@ async def respond_to_reschedule_request(
             # VALIDAR: El horario debe ser en horas exactas (ej: 9:00, no 9:30)
             if request.new_start_time.minute != 0 or request.new_start_time.second != 0:
                 # Marcar como expirada por validación fallida
-                expired_status_result = await db.execute(select(Status).where(Status.name == "expired"))
-                expired_status = expired_status_result.scalar_one_or_none()
+                expired_status = await reference_data.get_status(db, "expired")
                 if expired_status:
                     request.status_id = expired_status.id
                 else:
@@ -161,8 +156,7 @@ async def respond_to_reschedule_request(
             
             if request.new_end_time.minute != 0 or request.new_end_time.second != 0:
                 # Marcar como expirada por validación fallida
-                expired_status_result = await db.execute(select(Status).where(Status.name == "expired"))
-                expired_status = expired_status_result.scalar_one_or_none()
+                expired_status = await reference_data.get_status(db, "expired")
                 if expired_status:
                     request.status_id = expired_status.id
                 else:
@@ -178,8 +172,7 @@ async def respond_to_reschedule_request(
             # VALIDAR: La hora de fin no puede ser antes que la de inicio
             if request.new_end_time <= request.new_start_time:
                 # Marcar como expirada por validación fallida
-                expired_status_result = await db.execute(select(Status).where(Status.name == "expired"))
-                expired_status = expired_status_result.scalar_one_or_none()
+                expired_status = await reference_data.get_status(db, "expired")
                 if expired_status:
                     request.status_id = expired_status.id
                 else:
@@ -197,8 +190,7 @@ async def respond_to_reschedule_request(
             current_time = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=6)  # Mexico time
             if request.new_start_time <= current_time:
                 # Marcar como expirada por validación fallida
-                expired_status_result = await db.execute(select(Status).where(Status.name == "expired"))
-                expired_status = expired_status_result.scalar_one_or_none()
+                expired_status = await reference_data.get_status(db, "expired")
                 if expired_status:
                     request.status_id = expired_status.id
                 else:
@@ -212,8 +204,7 @@ async def respond_to_reschedule_request(
                 )
             
             # Verificar que no haya conflictos en el nuevo horario (por si acaso)
-            cancelled_status_result = await db.execute(select(Status).where(Status.name == "cancelled"))
-            cancelled_status = cancelled_status_result.scalar_one_or_none()
+            cancelled_status = await reference_data.get_status(db, "cancelled")
             cancelled_status_id = cancelled_status.id if cancelled_status else None
             
             conflict_query = select(Booking).where(
@@ -229,8 +220,7 @@ async def respond_to_reschedule_request(
             
             if conflicting_booking:
                 # Obtener el ID del status 'expired'
-                expired_status_result = await db.execute(select(Status).where(Status.name == "expired"))
-                expired_status = expired_status_result.scalar_one_or_none()
+                expired_status = await reference_data.get_status(db, "expired")
                 if expired_status:
                     request.status_id = expired_status.id
                 else:
@@ -248,8 +238,7 @@ async def respond_to_reschedule_request(
             booking.updated_at = datetime.utcnow()
             
             # Obtener el ID del status 'approved'
-            approved_status_result = await db.execute(select(Status).where(Status.name == "approved"))
-            approved_status = approved_status_result.scalar_one_or_none()
+            approved_status = await reference_data.get_status(db, "approved")
             if approved_status:
                 request.status_id = approved_status.id
             else:
@@ -257,8 +246,7 @@ async def respond_to_reschedule_request(
             logger.info(f"✅ Reagendado aprobado - Reserva {request.booking_id} actualizada")
         else:
             # Obtener el ID del status 'rejected' o usar fallback
-            rejected_status_result = await db.execute(select(Status).where(Status.name == "rejected"))
-            rejected_status = rejected_status_result.scalar_one_or_none()
+            rejected_status = await reference_data.get_status(db, "rejected")
             if rejected_status:
                 request.status_id = rejected_status.id
             else:
@@ -312,8 +300,7 @@ async def respond_to_reschedule_request(
             await send_booking_rescheduled_email(db, teacher_id, email_reschedule_details)
         
         # Obtener el nombre del status actualizado
-        final_status_result = await db.execute(select(Status).where(Status.id == request.status_id))
-        final_status = final_status_result.scalar_one_or_none()
+        final_status = await reference_data.get_status_by_id(db, request.status_id)
         status_name = final_status.name if final_status else ("approved" if approved else "rejected")
         
         return {
@@ -338,10 +325,8 @@ async def expire_old_requests(db: AsyncSession):
     """
     try:
         # Obtener los IDs de los status
-        pending_status_result = await db.execute(select(Status).where(Status.name == "pending"))
-        pending_status = pending_status_result.scalar_one_or_none()
-        expired_status_result = await db.execute(select(Status).where(Status.name == "expired"))
-        expired_status = expired_status_result.scalar_one_or_none()
+        pending_status = await reference_data.get_status(db, "pending")
+        expired_status = await reference_data.get_status(db, "expired")
         
         query = select(RescheduleRequest).where(
             RescheduleRequest.status_id == pending_status.id if pending_status else RescheduleRequest.status == "pending",
@@ -9,11 +9,11 @@ import logging
 from app.models.booking.bookings import Booking
 from app.models.booking.reschedule_request import RescheduleRequest
 from app.models.teachers.availability import Availability
-from app.models.common.status import Status
 from app.models.users.user import User
 from app.services.utils.pagination_service import PaginationService
 from app.services.notifications.booking_notification_service import send_reschedule_request_notification
 from app.services.notifications.booking_email_service import send_reschedule_request_email
+from app.services.common.reference_data import reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -46,15 +46,13 @@ async def create_teacher_reschedule_request(
             raise HTTPException(status_code=403, detail="Esta reserva no pertenece a tu disponibilidad")
         
         # 2. Verificar que la reserva no esté cancelada
-        cancelled_status_result = await db.execute(select(Status).where(Status.name == "cancelled"))
-        cancelled_status = cancelled_status_result.scalar_one_or_none()
+        cancelled_status = await reference_data.get_status(db, "cancelled")
         
         if cancelled_status and booking.status_id == cancelled_status.id:
             raise HTTPException(status_code=400, detail="No puedes solicitar reagendar una reserva cancelada")
         
         # 3. Verificar que no haya una solicitud pendiente para esta reserva
-        pending_status_result = await db.execute(select(Status).where(Status.name == "pending"))
-        pending_status = pending_status_result.scalar_one_or_none()
+        pending_status = await reference_data.get_status(db, "pending")
         pending_status_id = pending_status.id if pending_status else None
         
         existing_request_query = select(RescheduleRequest).where(
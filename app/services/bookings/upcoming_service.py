@@ -7,7 +7,7 @@ from sqlalchemy.orm import selectinload
 from app.models.booking.bookings import Booking
 from app.models.teachers.availability import Availability
 from app.models.users.preference import Preference
-from app.models.common.status import Status
+from app.services.common.reference_data import reference_data
 from app.models.teachers.document import Document
 from app.models.booking.payment_bookings import PaymentBooking
 
@@ -31,11 +31,7 @@ async def get_upcoming_bookings_for_user(
     current_time = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=6)
 
     # Status cancelado
-    cancelled_status_id = None
-    cancelled_q = await db.execute(select(Status).where(Status.name == "cancelled"))
-    cancelled = cancelled_q.scalar_one_or_none()
-    if cancelled:
-        cancelled_status_id = cancelled.id
+    cancelled_status_id = await reference_data.get_status_id(db, "cancelled")
 
     # Base query: unimos Availability para poder distinguir rol y filtrar por docente
     base_query = (
@@ -132,8 +128,7 @@ async def get_bookings_by_status_for_user(
     current_time = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=6)
 
     # Status cancelado
-    cancelled_status = (await db.execute(select(Status).where(Status.name == "cancelled"))).scalar_one_or_none()
-    cancelled_status_id = cancelled_status.id if cancelled_status else None
+    cancelled_status_id = await reference_data.get_status_id(db, "cancelled")
 
     # Base query: participación como docente o alumno
     teacher_avail_subq = select(Availability.id).where(Availability.user_id == user_id)
@@ -248,7 +243,7 @@ async def search_bookings_for_user(
 
     # Filtro por status por nombre
     if status:
-        status_row = (await db.execute(select(Status).where(Status.name == status))).scalar_one_or_none()
+        status_row = await reference_data.get_status(db, status)
         if status_row:
             base = base.where(Booking.status_id == status_row.id)
         else:
@@ -1,4 +1,12 @@
 from .chat_service import ChatService
 from .message_service import MessageService
+from .chat_broker import ChatBroker, InMemoryChatBroker, get_chat_broker, set_chat_broker
 
-__all__ = ["ChatService", "MessageService"]
+__all__ = [
+    "ChatService",
+    "MessageService",
+    "ChatBroker",
+    "InMemoryChatBroker",
+    "get_chat_broker",
+    "set_chat_broker",
+]
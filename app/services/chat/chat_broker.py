@@ -0,0 +1,120 @@
+"""
+Broker de publicación/suscripción para eventos del chat en tiempo real.
+
+Los servicios publican eventos (mensaje nuevo, confirmación de lectura, bloqueo)
+en el canal de cada participante y los WebSockets conectados los reciben.
+
+`ChatBroker` define la interfaz; `InMemoryChatBroker` es la implementación por
+defecto (un solo proceso). Un backend compartido (p. ej. Redis pub/sub) puede
+reemplazarla con `set_chat_broker` sin tocar servicios ni endpoints.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, Set
+
+
+def user_channel(user_id: int) -> str:
+    """Canal en el que un usuario recibe todos los eventos de sus chats."""
+    return f"chat:user:{user_id}"
+
+
+class ChatSubscription:
+    """Suscripción a un canal: cola acotada de eventos pendientes de entregar."""
+
+    def __init__(self, channel: str, max_pending: int = 100):
+        self.channel = channel
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def deliver(self, event: dict) -> None:
+        """Encola un evento; si el consumidor va atrasado se descarta el más antiguo."""
+        if self._queue.full():
+            self._queue.get_nowait()
+            logging.warning(f"Suscripción lenta en {self.channel}: se descartó un evento")
+        self._queue.put_nowait(event)
+
+    async def get(self) -> dict:
+        """Espera el siguiente evento."""
+        return await self._queue.get()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        return await self.get()
+
+
+class ChatBroker(ABC):
+    """Interfaz de un broker de eventos del chat."""
+
+    @abstractmethod
+    async def publish(self, channel: str, event: dict) -> int:
+        """Publica un evento en un canal. Retorna cuántos suscriptores locales lo recibieron."""
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> "AsyncIterator[ChatSubscription]":
+        """Context manager asíncrono que entrega una `ChatSubscription` mientras está abierto."""
+
+    async def publish_to_users(self, user_ids: Iterable[int], event: dict) -> int:
+        """Publica el mismo evento en el canal de cada usuario."""
+        delivered = 0
+        for user_id in set(user_ids):
+            delivered += await self.publish(user_channel(user_id), event)
+        return delivered
+
+
+class InMemoryChatBroker(ChatBroker):
+    """Broker en memoria del proceso (por defecto y para pruebas)."""
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self._subscriptions: Dict[str, Set[ChatSubscription]] = {}
+
+    async def publish(self, channel: str, event: dict) -> int:
+        subscriptions = self._subscriptions.get(channel, ())
+        for subscription in list(subscriptions):
+            subscription.deliver(event)
+        return len(subscriptions)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[ChatSubscription]:
+        subscription = ChatSubscription(channel, self.max_pending)
+        self._subscriptions.setdefault(channel, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscriptions = self._subscriptions.get(channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        return len(self._subscriptions.get(channel, ()))
+
+
+_broker: ChatBroker = InMemoryChatBroker()
+
+
+def get_chat_broker() -> ChatBroker:
+    """Broker de eventos del chat en uso."""
+    return _broker
+
+
+def set_chat_broker(broker: ChatBroker) -> None:
+    """Reemplaza el broker (p. ej. por uno respaldado en Redis)."""
+    global _broker
+    _broker = broker
+
+
+async def publish_chat_event(user_ids: Iterable[int], event: dict) -> None:
+    """
+    Publica un evento a los participantes sin propagar errores del broker:
+    la operación de base de datos ya se confirmó y no debe fallar por la notificación.
+    """
+    try:
+        await get_chat_broker().publish_to_users(user_ids, event)
+    except Exception as e:
+        logging.error(f"Error publicando evento de chat {event.get('type')}: {e}")
@@ -1,11 +1,13 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, case, desc, func
 
 from app.models.chat import Chat, Message
 from app.models.users.user import User
-from app.schemas.chat.chat_schema import ChatCreateRequest, ChatSummaryResponse
+from app.schemas.chat.chat_schema import ChatCreateRequest, ChatSummaryResponse, MessageResponse
+from app.services.encryption import EncryptionService
+from app.services.chat.chat_broker import publish_chat_event
 
 
 class ChatService:
@@ -134,6 +136,9 @@ class ChatService:
         """
         Obtiene resúmenes de chats con información del último mensaje y contador de no leídos.
         
+        Usa una única consulta (sin importar cuántos chats tenga el usuario): el último
+        mensaje y el contador de no leídos se leen de las columnas desnormalizadas del chat.
+        
         Args:
             db: Sesión de base de datos
             user_id: ID del usuario
@@ -142,41 +147,68 @@ class ChatService:
         Returns:
             List[ChatSummaryResponse]: Lista de resúmenes de chats
         """
-        # Obtener chats del usuario
-        chats = await ChatService.get_user_chats(db, user_id, user_role)
-        summaries = []
+        if user_role == "student":
+            participant_column = Chat.student_id
+            unread_column = Chat.student_unread_count
+        else:
+            participant_column = Chat.teacher_id
+            unread_column = Chat.teacher_unread_count
         
-        for chat in chats:
-            # Obtener último mensaje
-            last_message_query = select(Message).where(
-                and_(
-                    Message.chat_id == chat.id,
-                    Message.is_deleted == False
-                )
-            ).order_by(desc(Message.created_at)).limit(1)
-            
-            last_message_result = await db.execute(last_message_query)
-            last_message = last_message_result.scalar_one_or_none()
-            
-            # Contar mensajes no leídos
-            unread_query = select(func.count(Message.id)).where(
-                and_(
-                    Message.chat_id == chat.id,
-                    Message.sender_id != user_id,
-                    Message.is_read == False,
-                    Message.is_deleted == False
-                )
+        # Una sola consulta: el último mensaje y los no leídos vienen desnormalizados en el chat
+        query = select(
+            Chat,
+            Message,
+            unread_column
+        ).outerjoin(
+            Message,
+            Message.id == Chat.last_message_id
+        ).where(
+            and_(
+                participant_column == user_id,
+                Chat.is_active == True
             )
-            
-            unread_result = await db.execute(unread_query)
-            unread_count = unread_result.scalar() or 0
+        ).order_by(desc(Chat.updated_at))
+        
+        result = await db.execute(query)
+        rows = result.all()
+        
+        # Desencriptar todos los últimos mensajes en un solo trabajo del pool criptográfico
+        encrypted_items = [
+            (message.encrypted_content, message.sender_id)
+            for _, message, _ in rows
+            if message is not None and message.is_encrypted
+        ]
+        decrypted_results = iter(await EncryptionService.decrypt_many(encrypted_items))
+        
+        summaries = []
+        for chat, message, unread_count in rows:
+            last_message_response = None
+            if message is not None:
+                if not message.is_encrypted:
+                    content = "[Mensaje no encriptado - posible error de seguridad]"
+                else:
+                    success, value = next(decrypted_results)
+                    content = value if success else f"[Mensaje no disponible: {value}]"
+                
+                last_message_response = MessageResponse(
+                    id=message.id,
+                    chat_id=message.chat_id,
+                    sender_id=message.sender_id,
+                    content=content,
+                    is_read=message.is_read,
+                    is_deleted=message.is_deleted,
+                    is_encrypted=message.is_encrypted,
+                    encryption_version=message.encryption_version,
+                    created_at=message.created_at,
+                    updated_at=message.updated_at
+                )
             
             # Crear resumen
             summary = ChatSummaryResponse(
                 chat_id=chat.id,
                 student_id=chat.student_id,
                 teacher_id=chat.teacher_id,
-                last_message=last_message,
+                last_message=last_message_response,
                 unread_count=unread_count,
                 is_active=chat.is_active,
                 created_at=chat.created_at,
@@ -187,6 +219,72 @@ class ChatService:
         
         return summaries
     
+    @staticmethod
+    async def rebuild_inbox_counters(
+        db: AsyncSession,
+        chat_ids: Optional[List[int]] = None
+    ) -> int:
+        """
+        Reconstruye desde la tabla `messages` las columnas desnormalizadas de los chats
+        (último mensaje y contadores de no leídos). Tarea de reparación.
+        
+        Args:
+            db: Sesión de base de datos
+            chat_ids: Chats a reparar (todos si no se indica)
+            
+        Returns:
+            int: Número de chats actualizados
+        """
+        message_filter = [Message.is_deleted == False]
+        chat_query = select(Chat)
+        if chat_ids is not None:
+            message_filter.append(Message.chat_id.in_(chat_ids))
+            chat_query = chat_query.where(Chat.id.in_(chat_ids))
+        
+        # Último mensaje no eliminado de cada chat
+        ranked_messages = select(
+            Message.chat_id,
+            Message.id,
+            Message.created_at,
+            func.row_number().over(
+                partition_by=Message.chat_id,
+                order_by=(desc(Message.created_at), desc(Message.id))
+            ).label("position")
+        ).where(and_(*message_filter)).subquery()
+        last_query = select(
+            ranked_messages.c.chat_id,
+            ranked_messages.c.id,
+            ranked_messages.c.created_at
+        ).where(ranked_messages.c.position == 1)
+        last_result = await db.execute(last_query)
+        last_messages = {row.chat_id: row for row in last_result.all()}
+        
+        # No leídos de cada participante (los enviados por la otra parte)
+        unread_query = select(
+            Message.chat_id,
+            func.sum(case((Message.sender_id == Chat.teacher_id, 1), else_=0)).label("student_unread"),
+            func.sum(case((Message.sender_id == Chat.student_id, 1), else_=0)).label("teacher_unread")
+        ).join(
+            Chat, Chat.id == Message.chat_id
+        ).where(
+            and_(Message.is_read == False, *message_filter)
+        ).group_by(Message.chat_id)
+        unread_result = await db.execute(unread_query)
+        unread_counts = {row.chat_id: row for row in unread_result.all()}
+        
+        chats_result = await db.execute(chat_query)
+        chats = chats_result.scalars().all()
+        for chat in chats:
+            last = last_messages.get(chat.id)
+            unread = unread_counts.get(chat.id)
+            chat.last_message_id = last.id if last else None
+            chat.last_message_at = last.created_at if last else None
+            chat.student_unread_count = int(unread.student_unread or 0) if unread else 0
+            chat.teacher_unread_count = int(unread.teacher_unread or 0) if unread else 0
+        
+        await db.commit()
+        return len(chats)
+    
     @staticmethod
     async def block_chat(
         db: AsyncSession, 
@@ -219,6 +317,11 @@ class ChatService:
         await db.commit()
         await db.refresh(chat)
         
+        await publish_chat_event(
+            [chat.student_id, chat.teacher_id],
+            {"type": "chat.blocked", "chat_id": chat.id, "by_user_id": user_id}
+        )
+        
         return chat
     
     @staticmethod
@@ -253,4 +356,9 @@ class ChatService:
         await db.commit()
         await db.refresh(chat)
         
+        await publish_chat_event(
+            [chat.student_id, chat.teacher_id],
+            {"type": "chat.unblocked", "chat_id": chat.id, "by_user_id": user_id}
+        )
+        
         return chat
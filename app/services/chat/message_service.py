@@ -1,13 +1,14 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, case, desc, func, update
 
 from app.models.chat import Chat, Message
 from app.models.users.user import User
 from app.schemas.chat.chat_schema import MessageCreateRequest
 from app.services.encryption import EncryptionService
-from app.services.content_filter import ContentFilterService
+from app.services.content_filter import chat_content_filter
+from app.services.chat.chat_broker import publish_chat_event
 
 
 class MessageService:
@@ -53,8 +54,7 @@ class MessageService:
             raise ValueError("No eres participante de este chat")
         
         # Filtrar contenido del mensaje
-        content_filter = ContentFilterService()
-        filter_result = content_filter.filter_message(content, user_role)
+        filter_result = chat_content_filter.filter_message(content, user_role)
         
         # Verificar si el mensaje es apropiado
         if not filter_result["is_appropriate"]:
@@ -67,7 +67,7 @@ class MessageService:
         
         # Encriptar el contenido del mensaje
         try:
-            encrypted_content = EncryptionService.encrypt_message(content, sender_id)
+            encrypted_content = await EncryptionService.encrypt_message_async(content, sender_id)
         except Exception as e:
             raise ValueError(f"Error al encriptar mensaje: {str(e)}")
         
@@ -84,12 +84,37 @@ class MessageService:
         )
         
         db.add(new_message)
-        
-        # Actualizar timestamp del chat
+        await db.flush()
+        
+        # Actualizar timestamp del chat y la bandeja de entrada desnormalizada
+        recipient_id = chat.teacher_id if sender_id == chat.student_id else chat.student_id
+        unread_attribute = chat.unread_attribute_for(recipient_id)
+        setattr(chat, unread_attribute, getattr(Chat, unread_attribute) + 1)
+        chat.last_message_id = new_message.id
+        chat.last_message_at = func.now()
         chat.updated_at = func.now()
         
         await db.commit()
         await db.refresh(new_message)
+        # Recargar los contadores calculados en SQL
+        await db.refresh(chat)
+        
+        # Notificar en tiempo real a los participantes (después del commit)
+        await publish_chat_event(
+            [chat.student_id, chat.teacher_id],
+            {
+                "type": "message.new",
+                "chat_id": chat_id,
+                "message": {
+                    "id": new_message.id,
+                    "chat_id": new_message.chat_id,
+                    "sender_id": new_message.sender_id,
+                    "content": content,
+                    "is_read": new_message.is_read,
+                    "created_at": new_message.created_at.isoformat() if new_message.created_at else None
+                }
+            }
+        )
         
         return new_message
     
@@ -99,17 +124,24 @@ class MessageService:
         chat_id: int,
         user_id: int,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> List[Message]:
         """
         Obtiene los mensajes de un chat con paginación.
         
+        Si se indica `before_id` o `after_id` se usa paginación por cursor (keyset) sobre
+        el índice (chat_id, id) y `offset` se ignora; si no, se usa paginación por offset.
+        
         Args:
             db: Sesión de base de datos
             chat_id: ID del chat
             user_id: ID del usuario que solicita los mensajes
             limit: Número máximo de mensajes a retornar
             offset: Número de mensajes a omitir
+            before_id: Retorna los mensajes anteriores a este ID (más antiguos)
+            after_id: Retorna los mensajes posteriores a este ID (más nuevos)
             
         Returns:
             List[Message]: Lista de mensajes del chat
@@ -126,13 +158,31 @@ class MessageService:
         if chat.student_id != user_id and chat.teacher_id != user_id:
             raise ValueError("No eres participante de este chat")
         
-        # Obtener mensajes con paginación
-        query = select(Message).where(
-            and_(
-                Message.chat_id == chat_id,
-                Message.is_deleted == False
-            )
-        ).order_by(desc(Message.created_at)).offset(offset).limit(limit)
+        if before_id is not None and after_id is not None:
+            raise ValueError("Usa solo before_id o after_id, no ambos")
+        
+        conditions = [
+            Message.chat_id == chat_id,
+            Message.is_deleted == False
+        ]
+        
+        if after_id is not None:
+            # Mensajes más nuevos que el cursor, ya en orden cronológico
+            query = select(Message).where(
+                and_(*conditions, Message.id > after_id)
+            ).order_by(Message.id).limit(limit)
+            result = await db.execute(query)
+            return list(result.scalars().all())
+        
+        if before_id is not None:
+            query = select(Message).where(
+                and_(*conditions, Message.id < before_id)
+            ).order_by(desc(Message.id)).limit(limit)
+        else:
+            # Obtener mensajes con paginación por offset (compatibilidad)
+            query = select(Message).where(
+                and_(*conditions)
+            ).order_by(desc(Message.created_at), desc(Message.id)).offset(offset).limit(limit)
         
         result = await db.execute(query)
         messages = result.scalars().all()
@@ -148,7 +198,7 @@ class MessageService:
         message_ids: List[int]
     ) -> int:
         """
-        Marca mensajes como leídos.
+        Marca mensajes como leídos con un único UPDATE (sin cargar los mensajes).
         
         Args:
             db: Sesión de base de datos
@@ -157,11 +207,58 @@ class MessageService:
             message_ids: Lista de IDs de mensajes a marcar
             
         Returns:
-            int: Número de mensajes marcados como leídos
+            int: Número de mensajes que pasaron a leídos
+            
+        Raises:
+            ValueError: Si el chat no existe o el usuario no es participante
+        """
+        if not message_ids:
+            return 0
+        
+        return await MessageService._mark_read_where(
+            db, chat_id, user_id,
+            Message.id.in_(message_ids),
+            event_data={"message_ids": list(message_ids)}
+        )
+    
+    @staticmethod
+    async def mark_messages_as_read_up_to(
+        db: AsyncSession,
+        chat_id: int,
+        user_id: int,
+        up_to_message_id: int
+    ) -> int:
+        """
+        Marca como leídos todos los mensajes recibidos en el chat hasta `up_to_message_id`
+        (incluido), con un único UPDATE. Útil al abrir una conversación con mucho atraso.
+        
+        Args:
+            db: Sesión de base de datos
+            chat_id: ID del chat
+            user_id: ID del usuario que marca como leído
+            up_to_message_id: ID del último mensaje visto (marca de agua)
+            
+        Returns:
+            int: Número de mensajes que pasaron a leídos
             
         Raises:
             ValueError: Si el chat no existe o el usuario no es participante
         """
+        return await MessageService._mark_read_where(
+            db, chat_id, user_id,
+            Message.id <= up_to_message_id,
+            event_data={"up_to_message_id": up_to_message_id}
+        )
+    
+    @staticmethod
+    async def _mark_read_where(
+        db: AsyncSession,
+        chat_id: int,
+        user_id: int,
+        condition,
+        event_data: dict
+    ) -> int:
+        """Ejecuta el UPDATE de lectura, ajusta el contador del lector y publica el evento."""
         # Verificar que el chat existe
         chat = await db.get(Chat, chat_id)
         if not chat:
@@ -171,26 +268,50 @@ class MessageService:
         if chat.student_id != user_id and chat.teacher_id != user_id:
             raise ValueError("No eres participante de este chat")
         
-        # Marcar mensajes como leídos (solo los que no son del usuario)
-        query = select(Message).where(
+        # Marcar mensajes como leídos (solo los que no son del usuario y siguen sin leer)
+        statement = update(Message).where(
             and_(
-                Message.id.in_(message_ids),
+                condition,
                 Message.chat_id == chat_id,
                 Message.sender_id != user_id,  # Solo mensajes de otros
+                Message.is_read == False,
                 Message.is_deleted == False
             )
-        )
-        
-        result = await db.execute(query)
-        messages = result.scalars().all()
-        
-        # Marcar como leído
-        for message in messages:
-            message.is_read = True
+        ).values(is_read=True).execution_options(synchronize_session=False)
+        
+        # Con RETURNING (SQLite >= 3.35, PostgreSQL) se obtienen los IDs marcados en la misma consulta
+        supports_returning = db.get_bind().dialect.update_returning
+        if supports_returning:
+            result = await db.execute(statement.returning(Message.id))
+            newly_read_ids = list(result.scalars().all())
+            newly_read = len(newly_read_ids)
+        else:
+            result = await db.execute(statement)
+            newly_read = result.rowcount or 0
+        
+        # Descontar del contador de no leídos del lector
+        if newly_read:
+            MessageService._decrement_unread(chat, user_id, newly_read)
         
         await db.commit()
+        if newly_read:
+            await db.refresh(chat)
+            
+            if supports_returning:
+                event_data = {"message_ids": newly_read_ids}
+            
+            # Confirmación de lectura en tiempo real
+            await publish_chat_event(
+                [chat.student_id, chat.teacher_id],
+                {
+                    "type": "message.read",
+                    "chat_id": chat_id,
+                    "reader_id": user_id,
+                    **event_data
+                }
+            )
         
-        return len(messages)
+        return newly_read
     
     @staticmethod
     async def delete_message(
@@ -221,9 +342,43 @@ class MessageService:
         if message.sender_id != user_id:
             raise ValueError("Solo puedes eliminar tus propios mensajes")
         
+        if message.is_deleted:
+            return True
+        
         # Marcar como eliminado (soft delete)
         message.is_deleted = True
+        
+        # Mantener la bandeja de entrada desnormalizada del chat
+        chat = await db.get(Chat, message.chat_id)
+        if chat:
+            if not message.is_read:
+                recipient_id = chat.teacher_id if message.sender_id == chat.student_id else chat.student_id
+                MessageService._decrement_unread(chat, recipient_id, 1)
+            
+            if chat.last_message_id == message.id:
+                previous_query = select(Message).where(
+                    and_(
+                        Message.chat_id == chat.id,
+                        Message.id != message.id,
+                        Message.is_deleted == False
+                    )
+                ).order_by(desc(Message.created_at), desc(Message.id)).limit(1)
+                previous_result = await db.execute(previous_query)
+                previous = previous_result.scalar_one_or_none()
+                chat.last_message_id = previous.id if previous else None
+                chat.last_message_at = previous.created_at if previous else None
+        
         await db.commit()
+        if chat:
+            await db.refresh(chat)
+            await publish_chat_event(
+                [chat.student_id, chat.teacher_id],
+                {
+                    "type": "message.deleted",
+                    "chat_id": chat.id,
+                    "message_id": message.id
+                }
+            )
         
         return True
     
@@ -236,25 +391,28 @@ class MessageService:
         """
         Obtiene el número de mensajes no leídos en un chat.
         
+        Lee el contador desnormalizado del chat (búsqueda por llave primaria).
+        
         Args:
             db: Sesión de base de datos
             chat_id: ID del chat
             user_id: ID del usuario
             
         Returns:
-            int: Número de mensajes no leídos
+            int: Número de mensajes no leídos (0 si el chat no existe o el usuario no participa)
         """
-        query = select(func.count(Message.id)).where(
-            and_(
-                Message.chat_id == chat_id,
-                Message.sender_id != user_id,  # Solo mensajes de otros
-                Message.is_read == False,
-                Message.is_deleted == False
-            )
-        )
+        chat = await db.get(Chat, chat_id)
+        if not chat or (chat.student_id != user_id and chat.teacher_id != user_id):
+            return 0
         
-        result = await db.execute(query)
-        return result.scalar() or 0
+        return getattr(chat, chat.unread_attribute_for(user_id)) or 0
+    
+    @staticmethod
+    def _decrement_unread(chat: Chat, user_id: int, amount: int) -> None:
+        """Resta `amount` del contador de no leídos de `user_id` sin bajar de cero (en SQL)."""
+        unread_attribute = chat.unread_attribute_for(user_id)
+        column = getattr(Chat, unread_attribute)
+        setattr(chat, unread_attribute, case((column > amount, column - amount), else_=0))
     
     @staticmethod
     def decrypt_message_content(message: Message, user_id: int) -> str:
@@ -291,7 +449,9 @@ class MessageService:
         chat_id: int,
         user_id: int,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> List[dict]:
         """
         Obtiene los mensajes de un chat con contenido desencriptado.
@@ -302,6 +462,8 @@ class MessageService:
             user_id: ID del usuario que solicita los mensajes
             limit: Número máximo de mensajes a retornar
             offset: Número de mensajes a omitir
+            before_id: Cursor: mensajes anteriores a este ID
+            after_id: Cursor: mensajes posteriores a este ID
             
         Returns:
             List[dict]: Lista de mensajes con contenido desencriptado
@@ -311,40 +473,42 @@ class MessageService:
         """
         # Obtener mensajes usando el método existente
         messages = await MessageService.get_chat_messages(
-            db, chat_id, user_id, limit, offset
+            db, chat_id, user_id, limit, offset, before_id, after_id
         )
         
-        # Desencriptar contenido de cada mensaje
+        # Desencriptar toda la página en un solo trabajo del pool criptográfico
+        encrypted_items = [
+            (message.encrypted_content, message.sender_id)
+            for message in messages
+            if message.is_encrypted
+        ]
+        decrypted_results = iter(await EncryptionService.decrypt_many(encrypted_items))
+        
         decrypted_messages = []
         for message in messages:
-            try:
-                decrypted_content = MessageService.decrypt_message_content(message, user_id)
-                decrypted_messages.append({
-                    "id": message.id,
-                    "chat_id": message.chat_id,
-                    "sender_id": message.sender_id,
-                    "content": decrypted_content,
-                    "is_read": message.is_read,
-                    "is_deleted": message.is_deleted,
-                    "is_encrypted": message.is_encrypted,
-                    "encryption_version": message.encryption_version,
-                    "created_at": message.created_at,
-                    "updated_at": message.updated_at
-                })
-            except ValueError as e:
-                # Si no se puede desencriptar, incluir mensaje de error
-                decrypted_messages.append({
-                    "id": message.id,
-                    "chat_id": message.chat_id,
-                    "sender_id": message.sender_id,
-                    "content": f"[Mensaje no disponible: {str(e)}]",
-                    "is_read": message.is_read,
-                    "is_deleted": message.is_deleted,
-                    "is_encrypted": message.is_encrypted,
-                    "encryption_version": message.encryption_version,
-                    "created_at": message.created_at,
-                    "updated_at": message.updated_at,
-                    "decryption_error": True
-                })
+            message_data = {
+                "id": message.id,
+                "chat_id": message.chat_id,
+                "sender_id": message.sender_id,
+                "is_read": message.is_read,
+                "is_deleted": message.is_deleted,
+                "is_encrypted": message.is_encrypted,
+                "encryption_version": message.encryption_version,
+                "created_at": message.created_at,
+                "updated_at": message.updated_at
+            }
+            
+            if not message.is_encrypted:
+                message_data["content"] = "[Mensaje no encriptado - posible error de seguridad]"
+            else:
+                success, value = next(decrypted_results)
+                if success:
+                    message_data["content"] = value
+                else:
+                    # Si no se puede desencriptar, incluir mensaje de error
+                    message_data["content"] = f"[Mensaje no disponible: Error al desencriptar mensaje: {value}]"
+                    message_data["decryption_error"] = True
+            
+            decrypted_messages.append(message_data)
         
         return decrypted_messages
@@ -0,0 +1,234 @@
+"""
+Registro en memoria de los catálogos de referencia (Status, Role, Modality,
+EducationalLevel y PriceRange).
+
+Estos catálogos casi no cambian, pero muchos servicios necesitan traducir un
+nombre ("active", "cancelled", "teacher", ...) a su id en cada petición. El
+registro se carga una vez al arrancar (`lifespan`) y los servicios lo consultan
+sin ir a la base de datos. Los endpoints de administración de catálogos
+(`app/apis/common.py`) llaman a `refresh` después de cada cambio, pero eso solo
+recarga el proceso que atendió la petición: con varios workers, cada uno vuelve a
+cargar su instantánea cuando vence REFERENCE_DATA_TTL_SECONDS.
+
+Si se usa antes de cargarse (scripts, pruebas), se carga en la primera consulta
+con la sesión recibida.
+"""
+
+import asyncio
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.configs.settings import settings
+from app.cores.db import async_session
+from app.models.common.educational_level import EducationalLevel
+from app.models.common.modality import Modality
+from app.models.common.price_range import PriceRange
+from app.models.common.role import Role
+from app.models.common.status import Status
+
+
+class StatusRef(NamedTuple):
+    id: int
+    name: str
+
+
+class RoleRef(NamedTuple):
+    id: int
+    name: str
+    description: Optional[str]
+    status_id: Optional[int]
+
+
+class ModalityRef(NamedTuple):
+    id: int
+    name: str
+    status_id: Optional[int]
+
+
+class EducationalLevelRef(NamedTuple):
+    id: int
+    name: str
+    status_id: Optional[int]
+
+
+class PriceRangeRef(NamedTuple):
+    id: int
+    educational_level_id: int
+    minimum_price: float
+    maximum_price: float
+    status_id: Optional[int]
+
+
+class _Snapshot(NamedTuple):
+    statuses: Dict[str, StatusRef]
+    statuses_by_id: Dict[int, StatusRef]
+    roles: Dict[str, RoleRef]
+    roles_by_id: Dict[int, RoleRef]
+    modalities: Dict[str, ModalityRef]
+    educational_levels: Dict[str, EducationalLevelRef]
+    educational_levels_by_id: Dict[int, EducationalLevelRef]
+    price_ranges: Dict[int, PriceRangeRef]
+    price_ranges_by_level: Dict[int, Tuple[PriceRangeRef, ...]]
+
+
+def _by_name(rows) -> dict:
+    """Indexa por nombre conservando el registro de menor id si hay nombres repetidos."""
+    index = {}
+    for row in sorted(rows, key=lambda row: row.id):
+        index.setdefault(row.name, row)
+    return index
+
+
+class ReferenceDataRegistry:
+    """
+    Catálogos de referencia cargados en memoria.
+
+    La instantánea es inmutable: `load`/`refresh` construyen una nueva y la
+    reemplazan de una vez, por lo que las lecturas concurrentes nunca ven un
+    estado a medio cargar. Pasados `ttl_seconds` desde la carga, la siguiente
+    consulta la recarga con su sesión (None: no vence).
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[_Snapshot] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    async def load(self, db: Optional[AsyncSession] = None) -> None:
+        """
+        Carga (o recarga) todos los catálogos.
+
+        Args:
+            db: Sesión a usar; si no se indica se abre una propia
+        """
+        if db is None:
+            async with async_session() as session:
+                await self._load(session)
+        else:
+            await self._load(db)
+
+    async def _load(self, db: AsyncSession) -> None:
+        statuses = [StatusRef(*row) for row in await db.execute(select(Status.id, Status.name))]
+        roles = [
+            RoleRef(*row)
+            for row in await db.execute(select(Role.id, Role.name, Role.description, Role.status_id))
+        ]
+        modalities = [
+            ModalityRef(*row)
+            for row in await db.execute(select(Modality.id, Modality.name, Modality.status_id))
+        ]
+        levels = [
+            EducationalLevelRef(*row)
+            for row in await db.execute(
+                select(EducationalLevel.id, EducationalLevel.name, EducationalLevel.status_id)
+            )
+        ]
+        price_ranges = [
+            PriceRangeRef(*row)
+            for row in await db.execute(
+                select(
+                    PriceRange.id,
+                    PriceRange.educational_level_id,
+                    PriceRange.minimum_price,
+                    PriceRange.maximum_price,
+                    PriceRange.status_id,
+                ).order_by(PriceRange.id)
+            )
+        ]
+
+        ranges_by_level: Dict[int, list] = {}
+        for price_range in price_ranges:
+            ranges_by_level.setdefault(price_range.educational_level_id, []).append(price_range)
+
+        self._loaded_at = time.monotonic()
+        self._snapshot = _Snapshot(
+            statuses=_by_name(statuses),
+            statuses_by_id={status.id: status for status in statuses},
+            roles=_by_name(roles),
+            roles_by_id={role.id: role for role in roles},
+            modalities=_by_name(modalities),
+            educational_levels=_by_name(levels),
+            educational_levels_by_id={level.id: level for level in levels},
+            price_ranges={price_range.id: price_range for price_range in price_ranges},
+            price_ranges_by_level={
+                level_id: tuple(ranges) for level_id, ranges in ranges_by_level.items()
+            },
+        )
+
+    async def refresh(self, db: Optional[AsyncSession] = None) -> None:
+        """Recarga los catálogos después de un cambio (crear, editar o desactivar)."""
+        async with self._lock:
+            await self.load(db)
+
+    def clear(self) -> None:
+        """Descarta la instantánea; la siguiente consulta vuelve a cargarla."""
+        self._snapshot = None
+
+    def _is_stale(self) -> bool:
+        if self._snapshot is None:
+            return True
+        return self.ttl_seconds is not None and time.monotonic() - self._loaded_at >= self.ttl_seconds
+
+    async def _get_snapshot(self, db: AsyncSession) -> _Snapshot:
+        if self._is_stale():
+            async with self._lock:
+                if self._is_stale():
+                    await self._load(db)
+        return self._snapshot
+
+    # ------------------------------------------------------------------
+    # Accesores
+    # ------------------------------------------------------------------
+
+    async def get_status(self, db: AsyncSession, name: str) -> Optional[StatusRef]:
+        """Status por nombre ("active", "cancelled", ...) o None si no existe."""
+        return (await self._get_snapshot(db)).statuses.get(name)
+
+    async def get_status_id(self, db: AsyncSession, name: str) -> Optional[int]:
+        """Id del status con ese nombre o None si no existe."""
+        status = await self.get_status(db, name)
+        return status.id if status else None
+
+    async def get_status_by_id(self, db: AsyncSession, status_id: int) -> Optional[StatusRef]:
+        """Status por id o None si no existe."""
+        return (await self._get_snapshot(db)).statuses_by_id.get(status_id)
+
+    async def get_role(self, db: AsyncSession, name: str) -> Optional[RoleRef]:
+        """Rol por nombre ("student", "teacher", ...) o None si no existe."""
+        return (await self._get_snapshot(db)).roles.get(name)
+
+    async def get_role_by_id(self, db: AsyncSession, role_id: int) -> Optional[RoleRef]:
+        """Rol por id o None si no existe."""
+        return (await self._get_snapshot(db)).roles_by_id.get(role_id)
+
+    async def get_modality(self, db: AsyncSession, name: str) -> Optional[ModalityRef]:
+        """Modalidad por nombre o None si no existe."""
+        return (await self._get_snapshot(db)).modalities.get(name)
+
+    async def get_educational_level(self, db: AsyncSession, name: str) -> Optional[EducationalLevelRef]:
+        """Nivel educativo por nombre o None si no existe."""
+        return (await self._get_snapshot(db)).educational_levels.get(name)
+
+    async def get_educational_level_by_id(self, db: AsyncSession, level_id: int) -> Optional[EducationalLevelRef]:
+        """Nivel educativo por id o None si no existe."""
+        return (await self._get_snapshot(db)).educational_levels_by_id.get(level_id)
+
+    async def get_price_range(self, db: AsyncSession, price_range_id: int) -> Optional[PriceRangeRef]:
+        """Rango de precios por id o None si no existe."""
+        return (await self._get_snapshot(db)).price_ranges.get(price_range_id)
+
+    async def get_price_ranges_for_level(self, db: AsyncSession, educational_level_id: int) -> Tuple[PriceRangeRef, ...]:
+        """Rangos de precios de un nivel educativo (ordenados por id)."""
+        return (await self._get_snapshot(db)).price_ranges_by_level.get(educational_level_id, ())
+
+
+# Instancia global
+reference_data = ReferenceDataRegistry(ttl_seconds=settings.REFERENCE_DATA_TTL_SECONDS)
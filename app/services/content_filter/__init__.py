@@ -2,6 +2,22 @@
 Servicio de filtrado de contenido para mensajes del chat.
 """
 
-from .content_filter_service import ContentFilterService, ContentSeverity
+from .content_filter_service import ContentFilterService, ContentSeverity, chat_content_filter
+from .profanity_engine import (
+    ProfanityEngine,
+    get_profanity_engine,
+    get_profanity_stats,
+    register_profanity_domain,
+    warm_up_profanity_engines,
+)
 
-__all__ = ["ContentFilterService", "ContentSeverity"]
+__all__ = [
+    "ContentFilterService",
+    "ContentSeverity",
+    "ProfanityEngine",
+    "chat_content_filter",
+    "get_profanity_engine",
+    "get_profanity_stats",
+    "register_profanity_domain",
+    "warm_up_profanity_engines",
+]
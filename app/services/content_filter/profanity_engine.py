@@ -0,0 +1,246 @@
+"""
+Motor de detección de groserías con vocabulario congelado.
+
+El vocabulario se normaliza una sola vez y se compila en una única expresión
+regular construida a partir de un trie (los prefijos comunes se comparten), de
+modo que revisar un texto es una sola pasada y no depende del tamaño de la lista.
+
+Las variantes con sustituciones (leet/símbolos: "f*ck", "b1tch", "a$$hole") se
+generan al compilar: cada letra del trie se vuelve una clase de caracteres con sus
+sustitutos (`LEET_SUBSTITUTIONS`, las mismas de better-profanity).
+
+Cada dominio (chat, foro, ...) registra su propio diccionario; los motores se
+construyen una sola vez, en el primer uso, y se comparten en modo
+solo lectura, sin tocar el singleton global de better-profanity.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+# Sustituciones de caracteres que better-profanity reconoce (CHARS_MAPPING)
+LEET_SUBSTITUTIONS: Dict[str, Tuple[str, ...]] = {
+    "a": ("a", "@", "*", "4"),
+    "i": ("i", "*", "l", "1"),
+    "o": ("o", "*", "0", "@"),
+    "u": ("u", "*", "v"),
+    "v": ("v", "*", "u"),
+    "l": ("l", "1"),
+    "e": ("e", "*", "3"),
+    "s": ("s", "$", "5"),
+    "t": ("t", "7"),
+}
+# Símbolos que forman parte de una palabra (no son separadores) al normalizar
+WORD_SYMBOLS = "@$*"
+_SEPARATOR_PATTERN = re.compile(r"[^\w\s" + re.escape(WORD_SYMBOLS) + "]")
+
+
+def fold_text(text: str) -> str:
+    """
+    Normaliza texto conservando su longitud: minúsculas, sin acentos y con los
+    caracteres que no son letras/dígitos ni WORD_SYMBOLS reemplazados por espacios.
+
+    Al conservar la longitud, las posiciones encontradas sobre el texto
+    normalizado son válidas también sobre el texto original.
+    """
+    if not text:
+        return ""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = ''.join(c.lower()[0] for c in text)
+    folded = ''.join(unicodedata.normalize('NFD', c)[0] for c in lowered)
+    return _SEPARATOR_PATTERN.sub(' ', folded)
+
+
+def load_default_wordlist() -> Tuple[str, ...]:
+    """Lista de palabras por defecto (inglés) incluida en better-profanity."""
+    # Se importa aquí para no cargar better-profanity hasta construir el primer motor
+    from better_profanity.utils import get_complete_path_of_file, read_wordlist
+
+    return tuple(read_wordlist(get_complete_path_of_file("profanity_wordlist.txt")))
+
+
+def _trie_to_regex(words: Iterable[str], substitutions: Optional[Mapping[str, Tuple[str, ...]]] = None) -> str:
+    """
+    Construye una alternancia regex a partir del trie de `words`. Con `substitutions`,
+    cada carácter acepta también sus sustitutos (p. ej. "a" -> [a@*4]).
+    """
+    substitutions = substitutions or {}
+
+    def char_token(char: str) -> str:
+        if char == " ":
+            return r"\s+"
+        if char in substitutions:
+            return "[" + "".join(re.escape(option) for option in substitutions[char]) + "]"
+        return re.escape(char)
+
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        is_end = "" in node
+        branches = []
+        for char in sorted(key for key in node if key):
+            branches.append(char_token(char) + build(node[char]))
+        if not branches:
+            return ""
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        pattern = "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if is_end else pattern
+
+    return build(trie)
+
+
+class ProfanityEngine:
+    """
+    Detector de groserías compilado una sola vez y de solo lectura.
+
+    - `vocabulary`: palabras normalizadas (frozenset).
+    - `normalizer`: función aplicada al vocabulario y a los textos revisados.
+      `censor` requiere que conserve la longitud del texto (como `fold_text`).
+    - Las coincidencias son por palabra completa (o frase completa) sobre el texto normalizado.
+    - `substring_min_length`: si se indica, las palabras de al menos esa longitud
+      también se detectan dentro de otras palabras (p. ej. "supendejote").
+      Ambos criterios se evalúan en la misma pasada y se devuelve la primera coincidencia.
+    - `substitutions`: sustitutos aceptados por letra (p. ej. LEET_SUBSTITUTIONS); se
+      compilan dentro del patrón, así que revisar un texto sigue siendo una sola pasada.
+    - Lleva estadísticas propias: textos revisados, textos con grosería y palabras más detectadas.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        normalizer: Callable[[str], str] = fold_text,
+        domain: str = "default",
+        substring_min_length: Optional[int] = None,
+        substitutions: Optional[Mapping[str, Tuple[str, ...]]] = None,
+    ):
+        self.domain = domain
+        self.normalizer = normalizer
+        self.substring_min_length = substring_min_length
+        normalized = (re.sub(r'\s+', ' ', normalizer(word)).strip() for word in words)
+        self.vocabulary = frozenset(word for word in normalized if word)
+
+        # Los sustitutos simbólicos cuentan como parte de la palabra en los límites
+        symbols = sorted({
+            option for options in (substitutions or {}).values() for option in options if not option.isalnum()
+        })
+        word_char = "[\\w" + "".join(re.escape(symbol) for symbol in symbols) + "]"
+        alternatives = []
+        if self.vocabulary:
+            alternatives.append(
+                f"(?<!{word_char})" + _trie_to_regex(self.vocabulary, substitutions) + f"(?!{word_char})"
+            )
+        if substring_min_length is not None:
+            long_words = [word for word in self.vocabulary if len(word) >= substring_min_length]
+            if long_words:
+                alternatives.append(_trie_to_regex(long_words, substitutions))
+        self._pattern = re.compile("|".join(alternatives) if alternatives else r"(?!x)x")
+        self._stats_lock = threading.Lock()
+        self.checks = 0
+        self.hits = 0
+        self.word_hits: Counter = Counter()
+
+    def _record(self, word: Optional[str]) -> None:
+        with self._stats_lock:
+            self.checks += 1
+            if word is not None:
+                self.hits += 1
+                self.word_hits[word] += 1
+
+    def find(self, text: str) -> Optional[Tuple[str, int]]:
+        """
+        Busca la primera grosería del texto.
+
+        Returns:
+            (palabra_normalizada, posición en el texto normalizado) o None si el texto es limpio
+        """
+        if not text:
+            return None
+        match = self._pattern.search(self.normalizer(text))
+        if match is None:
+            self._record(None)
+            return None
+        word = re.sub(r'\s+', ' ', match.group(0))
+        self._record(word)
+        return word, match.start()
+
+    def contains(self, text: str) -> bool:
+        """Indica si el texto contiene alguna grosería."""
+        return self.find(text) is not None
+
+    def censor(self, text: str, censor_char: str = "*") -> str:
+        """Reemplaza cada grosería del texto original por `censor_char` * 4."""
+        if not text:
+            return text
+        replacement = censor_char * 4
+        pieces = []
+        last_end = 0
+        for match in self._pattern.finditer(self.normalizer(text)):
+            pieces.append(text[last_end:match.start()])
+            pieces.append(replacement)
+            last_end = match.end()
+        pieces.append(text[last_end:])
+        return ''.join(pieces)
+
+    def stats(self) -> dict:
+        """Estadísticas de uso del motor."""
+        with self._stats_lock:
+            return {
+                "domain": self.domain,
+                "vocabulary_size": len(self.vocabulary),
+                "checks": self.checks,
+                "hits": self.hits,
+                "top_words": self.word_hits.most_common(10),
+            }
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+
+# ============================================================================
+# REGISTRO DE MOTORES POR DOMINIO
+# ============================================================================
+
+_factories: Dict[str, Callable[[], ProfanityEngine]] = {}
+_engines: Dict[str, ProfanityEngine] = {}
+_registry_lock = threading.Lock()
+
+
+def register_profanity_domain(domain: str, factory: Callable[[], ProfanityEngine]) -> None:
+    """Registra la función que construye el motor de un dominio (no lo construye todavía)."""
+    with _registry_lock:
+        _factories[domain] = factory
+        _engines.pop(domain, None)
+
+
+def get_profanity_engine(domain: str) -> ProfanityEngine:
+    """Devuelve el motor del dominio, construyéndolo una sola vez."""
+    engine = _engines.get(domain)
+    if engine is None:
+        with _registry_lock:
+            engine = _engines.get(domain)
+            if engine is None:
+                if domain not in _factories:
+                    raise KeyError(f"Dominio de filtrado no registrado: {domain}")
+                engine = _factories[domain]()
+                _engines[domain] = engine
+    return engine
+
+
+def warm_up_profanity_engines() -> None:
+    """Construye todos los motores registrados (se llama al arrancar la aplicación)."""
+    for domain in list(_factories):
+        get_profanity_engine(domain)
+
+
+def get_profanity_stats() -> Dict[str, dict]:
+    """Estadísticas de los motores ya construidos, por dominio."""
+    return {domain: engine.stats() for domain, engine in _engines.items()}
@@ -1,3 +1,4 @@
 from .encryption_service import EncryptionService
+from .crypto_executor import get_crypto_executor, run_crypto, shutdown_crypto_executor
 
-__all__ = ["EncryptionService"]
+__all__ = ["EncryptionService", "get_crypto_executor", "run_crypto", "shutdown_crypto_executor"]
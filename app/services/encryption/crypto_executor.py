@@ -0,0 +1,60 @@
+"""
+Ejecutor dedicado para el trabajo criptográfico del chat (PBKDF2 / Fernet).
+
+Las operaciones de cifrado son CPU-bound y síncronas; ejecutarlas dentro de un
+handler async bloquea el event loop de uvicorn. Este módulo mantiene un pool
+(hilos o procesos, configurable por variables de entorno) al que se despachan
+los lotes de cifrado/descifrado.
+
+Variables de entorno:
+    CRYPTO_EXECUTOR: "thread" (por defecto) o "process"
+    CRYPTO_EXECUTOR_WORKERS: número de workers (por defecto min(4, CPUs))
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+CRYPTO_EXECUTOR_KIND = os.getenv("CRYPTO_EXECUTOR", "thread").lower()
+CRYPTO_EXECUTOR_WORKERS = int(os.getenv("CRYPTO_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def get_crypto_executor() -> Executor:
+    """Devuelve el pool criptográfico, creándolo en el primer uso."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                if CRYPTO_EXECUTOR_KIND == "process":
+                    _executor = ProcessPoolExecutor(max_workers=CRYPTO_EXECUTOR_WORKERS)
+                else:
+                    _executor = ThreadPoolExecutor(
+                        max_workers=CRYPTO_EXECUTOR_WORKERS,
+                        thread_name_prefix="crypto",
+                    )
+    return _executor
+
+
+async def run_crypto(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Ejecuta `func(*args, **kwargs)` en el pool criptográfico sin bloquear el event loop.
+
+    Con el pool de procesos, `func` y sus argumentos deben ser serializables (pickle).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_crypto_executor(), partial(func, *args, **kwargs))
+
+
+def shutdown_crypto_executor(wait: bool = True) -> None:
+    """Cierra el pool (se llama al apagar la aplicación)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
@@ -4,9 +4,12 @@ import hashlib
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Optional
+from typing import List, Optional, Tuple
 import os
 
+from app.cores.ttl_cache import TTLCache
+from app.services.encryption.crypto_executor import run_crypto
+
 class EncryptionService:
     """
     Servicio de encriptación AES-256 para mensajes de chat.
@@ -17,9 +20,18 @@ class EncryptionService:
     
     # Clave maestra para derivar claves de usuario (en producción debe estar en .env)
     MASTER_KEY = os.getenv("ENCRYPTION_MASTER_KEY", "onlycation_master_key_2024_secure")
+    # Versión de la clave maestra; cambiarla invalida las claves derivadas en caché
+    MASTER_KEY_VERSION = os.getenv("ENCRYPTION_MASTER_KEY_VERSION", "v1")
     SALT_LENGTH = 32
     KEY_LENGTH = 32
     
+    # Caché de instancias Fernet derivadas, llave: (user_id, versión de clave maestra).
+    # Evita repetir el PBKDF2 de 100k iteraciones en cada mensaje.
+    _fernet_cache = TTLCache(
+        max_size=int(os.getenv("ENCRYPTION_KEY_CACHE_SIZE", "1024")),
+        ttl_seconds=int(os.getenv("ENCRYPTION_KEY_CACHE_TTL", "900")),
+    )
+    
     @staticmethod
     def _derive_key(user_id: int, master_key: str = None) -> bytes:
         """
@@ -49,6 +61,39 @@ class EncryptionService:
         key = base64.urlsafe_b64encode(kdf.derive(f"{master_key}_{user_id}".encode()))
         return key
     
+    @staticmethod
+    def _get_fernet(user_id: int) -> Fernet:
+        """
+        Obtiene la instancia Fernet del usuario, derivando la clave solo si no está en caché.
+        
+        Args:
+            user_id: ID del usuario
+            
+        Returns:
+            Fernet: Instancia lista para encriptar/desencriptar
+        """
+        cache_key = (user_id, EncryptionService.MASTER_KEY_VERSION)
+        fernet = EncryptionService._fernet_cache.get(cache_key)
+        if fernet is None:
+            fernet = Fernet(EncryptionService._derive_key(user_id))
+            EncryptionService._fernet_cache.set(cache_key, fernet)
+        return fernet
+    
+    @staticmethod
+    def get_key_cache_stats() -> dict:
+        """
+        Obtiene las estadísticas de la caché de claves derivadas (aciertos, fallos, tamaño).
+        
+        Returns:
+            dict: Estadísticas de la caché
+        """
+        return EncryptionService._fernet_cache.stats()
+    
+    @staticmethod
+    def clear_key_cache() -> None:
+        """Vacía la caché de claves derivadas (por ejemplo, al rotar la clave maestra)."""
+        EncryptionService._fernet_cache.clear()
+    
     @staticmethod
     def generate_user_key(user_id: int) -> str:
         """
@@ -85,11 +130,8 @@ class EncryptionService:
             raise ValueError("ID de usuario inválido")
         
         try:
-            # Obtener clave del usuario
-            key = EncryptionService._derive_key(user_id)
-            
-            # Crear instancia de Fernet
-            fernet = Fernet(key)
+            # Obtener instancia Fernet del usuario (clave derivada en caché)
+            fernet = EncryptionService._get_fernet(user_id)
             
             # Encriptar mensaje
             encrypted_bytes = fernet.encrypt(content.encode('utf-8'))
@@ -124,11 +166,8 @@ class EncryptionService:
             raise ValueError("ID de usuario inválido")
         
         try:
-            # Obtener clave del usuario
-            key = EncryptionService._derive_key(user_id)
-            
-            # Crear instancia de Fernet
-            fernet = Fernet(key)
+            # Obtener instancia Fernet del usuario (clave derivada en caché)
+            fernet = EncryptionService._get_fernet(user_id)
             
             # Decodificar de base64
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_content.encode())
@@ -144,6 +183,52 @@ class EncryptionService:
         except Exception as e:
             raise ValueError(f"Error al desencriptar mensaje: {str(e)}")
     
+    @staticmethod
+    def decrypt_batch(items: List[Tuple[str, int]]) -> List[Tuple[bool, str]]:
+        """
+        Desencripta un lote de mensajes de forma síncrona (pensado para ejecutarse en el pool).
+        
+        Args:
+            items: Lista de tuplas (contenido_encriptado, user_id)
+            
+        Returns:
+            List[Tuple[bool, str]]: Por cada mensaje, (True, contenido) si se pudo
+            desencriptar o (False, mensaje_de_error) en caso contrario
+        """
+        results = []
+        for encrypted_content, user_id in items:
+            try:
+                results.append((True, EncryptionService.decrypt_message(encrypted_content, user_id)))
+            except ValueError as e:
+                results.append((False, str(e)))
+        return results
+    
+    @staticmethod
+    async def decrypt_many(items: List[Tuple[str, int]]) -> List[Tuple[bool, str]]:
+        """
+        Desencripta una página completa de mensajes en un único trabajo despachado
+        al pool criptográfico, sin bloquear el event loop.
+        
+        Args:
+            items: Lista de tuplas (contenido_encriptado, user_id)
+            
+        Returns:
+            List[Tuple[bool, str]]: Mismo formato que `decrypt_batch`, en el mismo orden
+        """
+        if not items:
+            return []
+        return await run_crypto(EncryptionService.decrypt_batch, list(items))
+    
+    @staticmethod
+    async def encrypt_message_async(content: str, user_id: int) -> str:
+        """
+        Versión asíncrona de `encrypt_message` que se ejecuta en el pool criptográfico.
+        
+        Raises:
+            ValueError: Si el contenido está vacío, el user_id es inválido o falla el cifrado
+        """
+        return await run_crypto(EncryptionService.encrypt_message, content, user_id)
+    
     @staticmethod
     def verify_encryption(original_content: str, encrypted_content: str, user_id: int) -> bool:
         """
@@ -11,6 +11,7 @@ from app.configs.settings import settings
 from app.models.teachers.video import Video
 from app.models.users.user import User
 from app.schemas.teachers.video_schema import VideoMetadata
+from app.services.teachers.public_catalog_cache import invalidate_public_catalog
 
 
 YOUTUBE_VIDEO_URL = "https://www.googleapis.com/youtube/v3/videos"
@@ -352,6 +353,7 @@ async def save_validated_video(db: AsyncSession, user_id: int, url_or_id: str) -
         
         db.add(new_video)
         await db.commit()
+        await invalidate_public_catalog(include_videos=True)
         await db.refresh(new_video)
         
         return new_video
@@ -446,6 +448,7 @@ async def update_user_video(db: AsyncSession, user_id: int, url_or_id: str) -> V
         
         # 5. Guardar cambios en la base de datos
         await db.commit()
+        await invalidate_public_catalog(include_videos=True)
         await db.refresh(existing_video)
         
         return existing_video
@@ -8,7 +8,6 @@ from typing import Dict, Any
 from app.services.foro.content_filter import content_filter
 from app.models.foro import ForoComment, Foro
 from app.models.users.user import User
-from app.cores.token import verify_token
 from app.schemas.foro.foro_comment_schema import (
     ForoCommentCreateRequest,
     ForoCommentUpdateMeRequest,
@@ -19,9 +18,9 @@ from app.services.utils.pagination_service import PaginationService
 # -----------------------------
 # Helpers
 # -----------------------------
-async def get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
-    user_id = payload.get("user_id")
+async def get_user_id_from_claims(claims: dict) -> int:
+    """`user_id` de los claims ya verificados por la dependencia `auth_required`."""
+    user_id = claims.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido: falta user_id")
     return user_id
@@ -108,8 +107,8 @@ def handle_db_errors(func):
 # Create Comment
 # -----------------------------
 @handle_db_errors
-async def create_foro_comment(db: AsyncSession, token: str, comment_data: ForoCommentCreateRequest) -> ForoComment:
-    user_id = await get_user_id_from_token(token)
+async def create_foro_comment(db: AsyncSession, claims: dict, comment_data: ForoCommentCreateRequest) -> ForoComment:
+    user_id = await get_user_id_from_claims(claims)
     await _validate_user_exists(db, user_id)
     await _validate_foro_exists(db, comment_data.foro_id)
 
@@ -133,8 +132,8 @@ async def create_foro_comment(db: AsyncSession, token: str, comment_data: ForoCo
 # Update My Comment
 # -----------------------------
 @handle_db_errors
-async def update_my_foro_comment(db: AsyncSession, token: str, update_data: ForoCommentUpdateMeRequest) -> ForoComment:
-    user_id = await get_user_id_from_token(token)
+async def update_my_foro_comment(db: AsyncSession, claims: dict, update_data: ForoCommentUpdateMeRequest) -> ForoComment:
+    user_id = await get_user_id_from_claims(claims)
     await _validate_user_exists(db, user_id)
 
     comment_text = (update_data.comment or "").strip()
@@ -160,8 +159,8 @@ async def update_my_foro_comment(db: AsyncSession, token: str, update_data: Foro
 # Delete My Comment
 # -----------------------------
 @handle_db_errors
-async def delete_my_foro_comment(db: AsyncSession, token: str, delete_data: ForoCommentDeleteMeRequest) -> dict:
-    user_id = await get_user_id_from_token(token)
+async def delete_my_foro_comment(db: AsyncSession, claims: dict, delete_data: ForoCommentDeleteMeRequest) -> dict:
+    user_id = await get_user_id_from_claims(claims)
     await _validate_user_exists(db, user_id)
 
     comment = await get_user_comment(
@@ -180,13 +179,12 @@ async def delete_my_foro_comment(db: AsyncSession, token: str, delete_data: Foro
 
 async def get_my_comments(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     offset: int = 0,
     limit: int = 6
 ) -> Dict[str, Any]:
     """Obtiene solo los comentarios del usuario autenticado"""
-    payload = verify_token(token)
-    user_id = payload.get("user_id")
+    user_id = claims.get("user_id")
     
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido")
@@ -201,13 +199,12 @@ async def get_my_comments(
 
 async def get_recent_comments(
     db: AsyncSession,
-    token: str,  # ← Agregar token
+    claims: dict,
     offset: int = 0,
     limit: int = 6
 ) -> Dict[str, Any]:
     """Obtiene los comentarios más recientes"""
-    payload = verify_token(token)
-    if not payload.get("user_id"):
+    if not claims.get("user_id"):
         raise HTTPException(status_code=401, detail="Token inválido")
     
     return await PaginationService.get_paginated_data(
@@ -8,7 +8,6 @@ from typing import Dict, Any
 from app.services.foro.content_filter import content_filter
 from app.models.foro import ForoReplyComment, ForoComment
 from app.models.users.user import User
-from app.cores.token import verify_token
 from app.schemas.foro.foro_reply_comment_schema import (
     ForoReplyCommentCreateRequest,
     ForoReplyCommentUpdateMeRequest,
@@ -19,9 +18,9 @@ from app.services.utils.pagination_service import PaginationService
 # -----------------------------
 # Helpers
 # -----------------------------
-async def get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
-    user_id = payload.get("user_id")
+async def get_user_id_from_claims(claims: dict) -> int:
+    """`user_id` de los claims ya verificados por la dependencia `auth_required`."""
+    user_id = claims.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido: falta user_id")
     return user_id
@@ -108,9 +107,9 @@ def handle_db_errors(func):
 # -----------------------------
 @handle_db_errors
 async def create_foro_reply_comment(
-    db: AsyncSession, token: str, reply_data: ForoReplyCommentCreateRequest
+    db: AsyncSession, claims: dict, reply_data: ForoReplyCommentCreateRequest
 ) -> ForoReplyComment:
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
     await validate_user_and_comment(db, user_id, comment_id=reply_data.foro_comment_id)
 
     reply_text = (reply_data.comment or "").strip()
@@ -136,9 +135,9 @@ async def create_foro_reply_comment(
 # -----------------------------
 @handle_db_errors
 async def update_my_foro_reply_comment(
-    db: AsyncSession, token: str, update_data: ForoReplyCommentUpdateMeRequest
+    db: AsyncSession, claims: dict, update_data: ForoReplyCommentUpdateMeRequest
 ) -> ForoReplyComment:
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
     await _validate_user_exists(db, user_id)
 
     reply_text = (update_data.comment or "").strip()
@@ -164,9 +163,9 @@ async def update_my_foro_reply_comment(
 # -----------------------------
 @handle_db_errors
 async def delete_my_foro_reply_comment(
-    db: AsyncSession, token: str, delete_data: ForoReplyCommentDeleteMeRequest
+    db: AsyncSession, claims: dict, delete_data: ForoReplyCommentDeleteMeRequest
 ) -> dict:
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
     await _validate_user_exists(db, user_id)
 
     reply = await get_user_reply(
@@ -190,13 +189,12 @@ async def delete_my_foro_reply_comment(
 
 async def get_my_replies(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     offset: int = 0,
     limit: int = 6
 ) -> Dict[str, Any]:
     """Obtiene solo las respuestas del usuario autenticado"""
-    payload = verify_token(token)
-    user_id = payload.get("user_id")
+    user_id = claims.get("user_id")
     
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido")
@@ -212,13 +210,12 @@ async def get_my_replies(
 
 async def get_recent_replies(
     db: AsyncSession,
-    token: str, 
+    claims: dict,
     offset: int = 0,
     limit: int = 6
 ) -> Dict[str, Any]:
     """Obtiene las respuestas más recientes"""
-    payload = verify_token(token)
-    if not payload.get("user_id"):
+    if not claims.get("user_id"):
         raise HTTPException(status_code=401, detail="Token inválido")
     
     return await PaginationService.get_paginated_data(
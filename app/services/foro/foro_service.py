@@ -9,7 +9,6 @@ from typing import Dict, Any
 from app.services.foro.content_filter import content_filter
 from app.models.foro import Foro, Category
 from app.models.users.user import User
-from app.cores.token import verify_token
 from app.schemas.foro.foro_schema import ForoCreateRequest, ForoUpdateMeRequest
 from app.services.utils.pagination_service import PaginationService  
 
@@ -17,9 +16,9 @@ from app.services.utils.pagination_service import PaginationService
 # -----------------------------
 # Helpers
 # -----------------------------
-async def get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
-    user_id = payload.get("user_id")
+async def get_user_id_from_claims(claims: dict) -> int:
+    """`user_id` de los claims ya verificados por la dependencia `auth_required`."""
+    user_id = claims.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido: falta user_id")
     return user_id
@@ -71,8 +70,8 @@ def handle_db_errors(func):
 # Create Foro
 # -----------------------------
 @handle_db_errors
-async def create_foro(db: AsyncSession, token: str, foro_data: ForoCreateRequest) -> Foro:
-    user_id = await get_user_id_from_token(token)
+async def create_foro(db: AsyncSession, claims: dict, foro_data: ForoCreateRequest) -> Foro:
+    user_id = await get_user_id_from_claims(claims)
     await _validate_user_exists(db, user_id)
     await _validate_category_exists(db, foro_data.category_id)
 
@@ -106,8 +105,8 @@ async def create_foro(db: AsyncSession, token: str, foro_data: ForoCreateRequest
 # Update My Foro
 # -----------------------------
 @handle_db_errors
-async def update_my_foro(db: AsyncSession, token: str, update_data: ForoUpdateMeRequest) -> Foro:
-    user_id = await get_user_id_from_token(token)
+async def update_my_foro(db: AsyncSession, claims: dict, update_data: ForoUpdateMeRequest) -> Foro:
+    user_id = await get_user_id_from_claims(claims)
     await _validate_user_exists(db, user_id)
 
     result = await db.execute(
@@ -150,13 +149,12 @@ async def update_my_foro(db: AsyncSession, token: str, update_data: ForoUpdateMe
 
 async def get_my_foros(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     offset: int = 0,
     limit: int = 6
 ) -> Dict[str, Any]:
     """Obtiene solo los foros del usuario autenticado"""
-    payload = verify_token(token)
-    user_id = payload.get("user_id")
+    user_id = claims.get("user_id")
     
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido")
@@ -171,14 +169,13 @@ async def get_my_foros(
 
 async def get_recent_foros(
     db: AsyncSession,
-    token: str,  # ← AGREGAR token aquí también
+    claims: dict,
     offset: int = 0,
     limit: int = 6
 ) -> Dict[str, Any]:
     """Obtiene los foros más recientes (ordenados por fecha)"""
-    # Solo validamos el token, no usamos el user_id para filtro
-    payload = verify_token(token)
-    if not payload.get("user_id"):
+    # Solo validamos los claims, no usamos el user_id para filtro
+    if not claims.get("user_id"):
         raise HTTPException(status_code=401, detail="Token inválido")
     
     return await PaginationService.get_paginated_data(
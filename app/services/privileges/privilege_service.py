@@ -2,13 +2,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from fastapi import HTTPException
 from app.models.privileges.privilege import Privilege
-from app.models.common.status import Status
 from app.schemas.privileges.privilege_shema import PrivilegeCreateRequest, PrivilegeUpdateRequest, PrivilegeStatusRequest, PrivilegeResponse
 from datetime import datetime
 from typing import Sequence
 
 from app.services.validation.exception import unexpected_exception
 from app.services.utils.pagination_service import PaginationService
+from app.cores.authorization_cache import invalidate_privilege_decisions
+from app.services.common.reference_data import reference_data
 
 
 async def create_privilege_service(db: AsyncSession, data: PrivilegeCreateRequest) -> Privilege: # type: ignore
@@ -25,10 +26,7 @@ async def create_privilege_service(db: AsyncSession, data: PrivilegeCreateReques
             raise HTTPException(status_code=400, detail="Privilege already exists.")
 
         # Buscar el status activo
-        result_status = await db.execute(
-            select(Status).where(Status.name == "active")
-        )
-        status = result_status.scalar_one_or_none()
+        status = await reference_data.get_status(db, "active")
         if not status:
             raise HTTPException(status_code=404, detail="Status 'active' not found.")
 
@@ -42,6 +40,7 @@ async def create_privilege_service(db: AsyncSession, data: PrivilegeCreateReques
 
         db.add(new_privilege)
         await db.commit()
+        invalidate_privilege_decisions()
         await db.refresh(new_privilege)
         return new_privilege
 
@@ -79,6 +78,7 @@ async def update_privilege_service(db: AsyncSession, privilege_id: int, data: Pr
         privilege.description = data.description # type: ignore
 
         await db.commit()
+        invalidate_privilege_decisions()
         await db.refresh(privilege)
         return privilege
 
@@ -130,10 +130,7 @@ async def change_privilege_status_service(db: AsyncSession, privilege_id: int, d
             raise HTTPException(status_code=404, detail="Privilege not found.")
 
         # Verificar que el status existe
-        result_status = await db.execute(
-            select(Status).where(Status.id == data.status_id)
-        )
-        status = result_status.scalar_one_or_none()
+        status = await reference_data.get_status_by_id(db, data.status_id)
         if not status:
             raise HTTPException(status_code=404, detail="Status not found.")
 
@@ -141,6 +138,7 @@ async def change_privilege_status_service(db: AsyncSession, privilege_id: int, d
         privilege.status_id = data.status_id # type: ignore
 
         await db.commit()
+        invalidate_privilege_decisions()
         await db.refresh(privilege)
         return privilege
 
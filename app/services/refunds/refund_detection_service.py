@@ -4,7 +4,7 @@ from sqlalchemy.orm import joinedload
 from app.models.booking.confirmation import Confirmation
 from app.models.booking.bookings import Booking
 from app.models.booking.payment_bookings import PaymentBooking
-from app.models.common.status import Status
+from app.services.common.reference_data import reference_data
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import logging
@@ -19,11 +19,8 @@ async def detect_refund_needed_confirmations(db: AsyncSession) -> List[Confirmat
     """
     try:
         # Obtener status "denied" y "expired"
-        denied_status = await db.execute(select(Status).where(Status.name == "denied"))
-        denied_status = denied_status.scalar_one_or_none()
-        
-        expired_status = await db.execute(select(Status).where(Status.name == "expired"))
-        expired_status = expired_status.scalar_one_or_none()
+        denied_status = await reference_data.get_status(db, "denied")
+        expired_status = await reference_data.get_status(db, "expired")
         
         if not denied_status or not expired_status:
             logger.warning("⚠️ No se encontraron status 'denied' o 'expired'")
@@ -6,6 +6,7 @@ from app.models.booking.bookings import Booking
 from datetime import datetime
 from typing import Optional, Dict
 import logging
+from app.services.common.reference_data import reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +55,7 @@ async def update_booking_status_after_refund(
     """
     try:
         # Buscar el status 'cancelled' en la base de datos
-        from app.models.common.status import Status
-        status_result = await db.execute(select(Status).where(Status.name == "cancelled"))
-        cancelled_status = status_result.scalar_one_or_none()
+        cancelled_status = await reference_data.get_status(db, "cancelled")
         
         if not cancelled_status:
             logger.error("❌ Status 'cancelled' no encontrado en la base de datos")
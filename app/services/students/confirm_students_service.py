@@ -4,12 +4,11 @@ from datetime import datetime
 from fastapi import HTTPException
 
 
-from app.models.common.status import Status
 
 
 from app.models.booking.confirmation import Confirmation
 from app.models.users.user import User
-from app.cores.token import verify_token
+from app.models.teachers.availability import Availability
 #Notifiacion en la app
 from app.services.notifications.notification_service import create_notification
 
@@ -27,6 +26,8 @@ from app.models.booking.bookings import Booking
 import os
 import shutil
 import uuid
+from app.services.common.reference_data import reference_data
+from app.services.teachers.teacher_stats_service import TeacherStatsService
 from fastapi import UploadFile
 
 
@@ -46,9 +47,9 @@ async def _validate_student_exists(db: AsyncSession, student_id: int):
         raise HTTPException(status_code=404, detail=f"El estudiante con ID {student_id} no existe")
 
 
-async def get_student_id_from_token(token: str) -> int:
-    payload = verify_token(token)
-    student_id = payload.get("user_id")
+async def get_student_id_from_claims(claims: dict) -> int:
+    """`user_id` de los claims ya verificados por la dependencia `auth_required`."""
+    student_id = claims.get("user_id")
     if not student_id:
         raise HTTPException(status_code=401, detail="Token inválido: falta user_id")
     return student_id
@@ -57,8 +58,7 @@ async def get_student_id_from_token(token: str) -> int:
 # --- Función auxiliar para actualizar Booking ---
 async def update_booking_to_complete(db: AsyncSession, booking_id: int):
     # Obtener el status "complete"
-    result = await db.execute(select(Status).where(Status.name == "completed"))
-    status = result.scalar_one_or_none()
+    status = await reference_data.get_status(db, "completed")
     if not status:
         raise HTTPException(status_code=500, detail="El status 'completed' no existe en la BD")
 
@@ -70,21 +70,26 @@ async def update_booking_to_complete(db: AsyncSession, booking_id: int):
     if not booking:
         raise HTTPException(status_code=404, detail="Booking no encontrado")
 
-    # Actualizar el status
-    booking.status_id = status.id
+    # Actualizar el status (la clase cuenta una sola vez en las estadísticas del docente)
+    if booking.status_id != status.id:
+        booking.status_id = status.id
+        teacher_id = (await db.execute(
+            select(Availability.user_id).where(Availability.id == booking.availability_id)
+        )).scalar_one()
+        await TeacherStatsService.record_completed_class(db, teacher_id)
     await db.commit()
     await db.refresh(booking)
 
 
 async def create_confirmation_by_student(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     confirmation_value: bool,
     payment_booking_id: int,
     evidence_file: UploadFile,
     description_student: str
 ) -> Confirmation:
-    student_id = await get_student_id_from_token(token)
+    student_id = await get_student_id_from_claims(claims)
     await _validate_student_exists(db, student_id)
 
     # Buscar PaymentBooking con su Booking
@@ -192,10 +197,10 @@ async def create_confirmation_by_student(
 
 async def get_student_evidence(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     confirmation_id: int
 ) -> tuple[bytes, str]:
-    student_id = await get_student_id_from_token(token)
+    student_id = await get_student_id_from_claims(claims)
 
     # Buscar la confirmación que pertenece al estudiante
     result = await db.execute(
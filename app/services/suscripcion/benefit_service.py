@@ -2,10 +2,10 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
 from fastapi import HTTPException
 from app.models.subscriptions import Benefit
-from app.models.common import Status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.validation.exception import unexpected_exception
 from app.schemas.suscripcion.benefit_schema import CreateBenefitRequest, UpdateBenefitRequest
+from app.services.common.reference_data import reference_data
 
 async def create_benefit(db: AsyncSession, benefit_data: CreateBenefitRequest):
     try:
@@ -16,8 +16,7 @@ async def create_benefit(db: AsyncSession, benefit_data: CreateBenefitRequest):
         if existing_benefit:
             raise HTTPException(status_code=400, detail="A benefit with this name already exists")
 
-        status_result = await db.execute(select(Status).where(Status.name == "active"))
-        status = status_result.scalar_one_or_none()
+        status = await reference_data.get_status(db, "active")
         if not status:
             raise HTTPException(status_code=404, detail="Active status not found")
 
@@ -66,8 +65,7 @@ async def update_benefit(db: AsyncSession, benefit_id: int, benefit_data: Update
                 raise HTTPException(status_code=400, detail="A benefit with this name already exists")
 
         # Verificar que el status existe
-        status_result = await db.execute(select(Status).where(Status.id == benefit_data.status_id))
-        status = status_result.scalar_one_or_none()
+        status = await reference_data.get_status_by_id(db, benefit_data.status_id)
         if not status:
             raise HTTPException(status_code=404, detail="Status not found")
 
@@ -9,16 +9,17 @@ from app.models.users import User
 from app.models.common import Status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.validation.exception import unexpected_exception
+from app.cores.authorization_cache import invalidate_subscription_decisions
 from app.schemas.suscripcion.benefit_schema import CreateBenefitRequest, UpdateBenefitRequest
 from datetime import datetime, timedelta
 from app.external.stripe_config import stripe
 from app.services.notifications.notification_service import create_welcome_notification, create_subscription_notification
 from app.services.notifications.subscription_email_service import send_subscription_confirmation_email
+from app.services.common.reference_data import reference_data
 
 async def get_active_status(db: AsyncSession):
     """Obtiene el status activo"""
-    result = await db.execute(select(Status).where(Status.name == "active"))
-    return result.scalar_one_or_none()
+    return await reference_data.get_status(db, "active")
 
 async def create_subscription_session(db: AsyncSession, user: User, plan_id: int):
     """
@@ -245,6 +246,7 @@ async def process_successful_payment(db: AsyncSession, session):
         
         db.add(subscription)
         await db.commit()
+        invalidate_subscription_decisions(user_id)
         await db.refresh(subscription)
 
         try:
@@ -337,6 +339,7 @@ async def subscribe_user_to_plan(db: AsyncSession, user: User, plan_guy: str):
         
         db.add(subscription)
         await db.commit()
+        invalidate_subscription_decisions(user.id)
         await db.refresh(subscription)
 
         return {
@@ -390,8 +393,7 @@ async def cancel_user_subscription(db: AsyncSession, user_id: int):
             raise HTTPException(status_code=404, detail="No tienes suscripción activa")
 
         # Obtener status cancelado
-        canceled_status_result = await db.execute(select(Status).where(Status.name == "canceled"))
-        canceled_status = canceled_status_result.scalar_one_or_none()
+        canceled_status = await reference_data.get_status(db, "canceled")
         
         if not canceled_status:
             raise HTTPException(status_code=500, detail="Status cancelado no encontrado")
@@ -399,6 +401,7 @@ async def cancel_user_subscription(db: AsyncSession, user_id: int):
         # Actualizar suscripción
         subscription.status_id = canceled_status.id
         await db.commit()
+        invalidate_subscription_decisions(user_id)
         await db.refresh(subscription)
 
         return subscription
@@ -2,10 +2,11 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
 from fastapi import HTTPException
 from app.models.subscriptions import Plan
-from app.models.common import Status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.validation.exception import unexpected_exception
+from app.cores.authorization_cache import invalidate_subscription_decisions
 from app.schemas.suscripcion.plan_schema import CreatePlanRequest, UpdatePlanRequest
+from app.services.common.reference_data import reference_data
 
 async def create_plan(db: AsyncSession, plan_data: CreatePlanRequest):
     try:
@@ -18,15 +19,12 @@ async def create_plan(db: AsyncSession, plan_data: CreatePlanRequest):
             raise HTTPException(status_code=400, detail="A plan with this name already exists")
 
         # Verificar que el rol existe
-        from app.models.common import Role
-        role_result = await db.execute(select(Role).where(Role.id == plan_data.role_id))
-        role = role_result.scalar_one_or_none()
+        role = await reference_data.get_role_by_id(db, plan_data.role_id)
         if not role:
             raise HTTPException(status_code=404, detail="Role not found")
 
         # Obtener el status "active"
-        status_result = await db.execute(select(Status).where(Status.name == "active"))
-        status = status_result.scalar_one_or_none()
+        status = await reference_data.get_status(db, "active")
         if not status:
             raise HTTPException(status_code=404, detail="Active status not found")
 
@@ -87,15 +85,12 @@ async def update_plan(db: AsyncSession, plan_id: int, plan_data: UpdatePlanReque
                 raise HTTPException(status_code=400, detail="A plan with this name already exists")
 
         # Verificar que el rol existe
-        from app.models.common import Role
-        role_result = await db.execute(select(Role).where(Role.id == plan_data.role_id))
-        role = role_result.scalar_one_or_none()
+        role = await reference_data.get_role_by_id(db, plan_data.role_id)
         if not role:
             raise HTTPException(status_code=404, detail="Role not found")
 
         # Verificar que el status existe
-        status_result = await db.execute(select(Status).where(Status.id == plan_data.status_id))
-        status = status_result.scalar_one_or_none()
+        status = await reference_data.get_status_by_id(db, plan_data.status_id)
         if not status:
             raise HTTPException(status_code=404, detail="Status not found")
 
@@ -109,6 +104,8 @@ async def update_plan(db: AsyncSession, plan_id: int, plan_data: UpdatePlanReque
         plan.status_id = plan_data.status_id # type: ignore
 
         await db.commit()
+        # El tipo o el estado del plan cambian el resultado de require_subscription
+        invalidate_subscription_decisions()
         await db.refresh(plan)
         
         return plan
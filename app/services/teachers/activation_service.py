@@ -2,19 +2,19 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, List
 
-from app.cores.token import verify_token
+from app.cores.token import verify_access_token
 from app.models.users.user import User
 from app.models.users.preference import Preference
 from app.models.teachers.price import Price
 from app.models.teachers.wallet import Wallet
 from app.models.teachers.video import Video
 from app.models.teachers.document import Document
-from app.models.common.status import Status
 from app.models.teachers.availability import Availability
+from app.services.common.reference_data import reference_data
 
 
 async def _get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
+    payload = verify_access_token(token)
     user_id = payload.get("user_id")
     if not user_id:
         raise ValueError("Token inválido: falta user_id")
@@ -102,8 +102,7 @@ async def activate_teacher_account(db: AsyncSession, token: str) -> Dict:
     if not user:
         raise ValueError("Usuario no encontrado")
 
-    status_q = await db.execute(select(Status).where(Status.name == "active"))
-    active_status = status_q.scalar_one_or_none()
+    active_status = await reference_data.get_status(db, "active")
     if not active_status:
         raise ValueError("No existe el status 'active' en la base de datos")
 
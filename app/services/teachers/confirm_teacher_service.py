@@ -16,16 +16,17 @@ from datetime import datetime, timedelta, timezone
 from app.models.booking.payment_bookings import PaymentBooking
 from app.models.booking.bookings import Booking 
 
-from app.models.common.status import Status  
 from app.models.booking.confirmation import Confirmation
 from app.models.users.user import User
-from app.cores.token import verify_token
+from app.models.teachers.availability import Availability
 
 #Notifiacion en la app
 from app.services.notifications.notification_service import create_notification
 
 # 📧 Servicio de correo
 from app.services.notifications.booking_email_service import send_teacher_confirmation_email 
+from app.services.common.reference_data import reference_data
+from app.services.teachers.teacher_stats_service import TeacherStatsService
 
 # Cargar la clave de .env
 EVIDENCE_KEY = config("EVIDENCE_ENCRYPTION_KEY")
@@ -36,8 +37,7 @@ UPLOAD_DIR_TEACHER = os.path.join(os.getcwd(), "evidence", "teacher")
 os.makedirs(UPLOAD_DIR_TEACHER, exist_ok=True)
 
 async def get_status_id(db: AsyncSession, name: str) -> int:
-    result = await db.execute(select(Status).where(Status.name == name))
-    status = result.scalar_one_or_none()
+    status = await reference_data.get_status(db, name)
     if not status:
         raise HTTPException(status_code=500, detail=f"El status '{name}' no existe en la BD")
     return status.id
@@ -51,9 +51,9 @@ async def _validate_teacher_exists(db: AsyncSession, teacher_id: int):
         raise HTTPException(status_code=404, detail=f"El docente con ID {teacher_id} no existe")
 
 
-async def get_teacher_id_from_token(token: str) -> int:
-    payload = verify_token(token)
-    teacher_id = payload.get("user_id")
+async def get_teacher_id_from_claims(claims: dict) -> int:
+    """`user_id` de los claims ya verificados por la dependencia `auth_required`."""
+    teacher_id = claims.get("user_id")
     if not teacher_id:
         raise HTTPException(status_code=401, detail="Token inválido: falta user_id")
     return teacher_id
@@ -61,8 +61,7 @@ async def get_teacher_id_from_token(token: str) -> int:
 # --- Función auxiliar para actualizar Booking ---
 async def update_booking_to_complete(db: AsyncSession, booking_id: int):
     # Obtener el status "complete"
-    result = await db.execute(select(Status).where(Status.name == "completed"))
-    status = result.scalar_one_or_none()
+    status = await reference_data.get_status(db, "completed")
     if not status:
         raise HTTPException(status_code=500, detail="El status 'completed' no existe en la BD")
 
@@ -74,21 +73,26 @@ async def update_booking_to_complete(db: AsyncSession, booking_id: int):
     if not booking:
         raise HTTPException(status_code=404, detail="Booking no encontrado")
 
-    # Actualizar el status
-    booking.status_id = status.id
+    # Actualizar el status (la clase cuenta una sola vez en las estadísticas del docente)
+    if booking.status_id != status.id:
+        booking.status_id = status.id
+        teacher_id = (await db.execute(
+            select(Availability.user_id).where(Availability.id == booking.availability_id)
+        )).scalar_one()
+        await TeacherStatsService.record_completed_class(db, teacher_id)
     await db.commit()
     await db.refresh(booking)
 
 
 async def create_confirmation_by_teacher(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     confirmation_value: bool,
     payment_booking_id: int,
     evidence_file: UploadFile,
     description_teacher: str
 ) -> Confirmation:
-    teacher_id = await get_teacher_id_from_token(token)
+    teacher_id = await get_teacher_id_from_claims(claims)
     await _validate_teacher_exists(db, teacher_id)
 
     # Buscar PaymentBooking con su Booking
@@ -189,10 +193,10 @@ async def create_confirmation_by_teacher(
 
 async def get_teacher_evidence(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     confirmation_id: int
 ) -> tuple[bytes, str]:
-    teacher_id = await get_teacher_id_from_token(token)
+    teacher_id = await get_teacher_id_from_claims(claims)
 
     # Buscar la confirmación
     result = await db.execute(
@@ -4,7 +4,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import UploadFile
 from app.models import Document, User
-from app.cores.token import verify_token
+from app.services.teachers.teacher_search_service import TeacherSearchService
+from app.services.teachers.public_catalog_cache import invalidate_public_catalog
 from app.cores.security import (
     rfc_hash_plain, encrypt_text, encrypt_bytes
 )
@@ -47,11 +48,11 @@ async def _validate_description(value: str, field_name: str = "Descripción"):
     if len(value.strip()) > 500:
         raise ValueError(f"El campo {field_name} no puede exceder los 500 caracteres")
 
-# -------- Token --------
+# -------- Claims del token --------
 
-async def get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
-    user_id = payload.get("user_id")
+async def get_user_id_from_claims(claims: dict) -> int:
+    """`user_id` de los claims ya verificados por la dependencia `auth_required`."""
+    user_id = claims.get("user_id")
     if not user_id:
         raise ValueError("Token inválido: falta user_id")
     return user_id
@@ -80,14 +81,14 @@ async def _save_encrypted_file(file: UploadFile, folder: str) -> str:
 
 async def create_document_by_token(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     rfc: str,
     expertise_area: str,
     certificate_file: UploadFile,
     curriculum_file: UploadFile,
     description: str
 ) -> Document:
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
 
     # Validaciones
     await _validate_user_exists(db, user_id)
@@ -121,18 +122,20 @@ async def create_document_by_token(
     )
 
     db.add(db_document)
+    await TeacherSearchService.refresh_teacher(db, user_id)
     await db.commit()
+    await invalidate_public_catalog()
     await db.refresh(db_document)
     return db_document
 
-async def get_documents_by_token(db: AsyncSession, token: str) -> list[Document]:
-    user_id = await get_user_id_from_token(token)
+async def get_documents_by_token(db: AsyncSession, claims: dict) -> list[Document]:
+    user_id = await get_user_id_from_claims(claims)
     res = await db.execute(select(Document).where(Document.user_id == user_id))
     return res.scalars().all()
 
 async def update_document_by_token(
     db: AsyncSession,
-    token: str,
+    claims: dict,
     document_id: int,
     rfc: str = None,
     expertise_area: str = None,
@@ -144,7 +147,7 @@ async def update_document_by_token(
     Actualizar un documento existente. Los archivos son opcionales.
     Si se envían nuevos archivos, se reemplazan los antiguos.
     """
-    user_id = await get_user_id_from_token(token)
+    user_id = await get_user_id_from_claims(claims)
     
     # Obtener documento existente y verificar propiedad
     q = await db.execute(
@@ -193,7 +196,10 @@ async def update_document_by_token(
         document.curriculum = await _save_encrypted_file(curriculum_file, UPLOAD_DIR)
     
     document.updated_at = datetime.utcnow()
+    if expertise_area is not None or description is not None:
+        await TeacherSearchService.refresh_teacher(db, user_id)
     
     await db.commit()
+    await invalidate_public_catalog()
     await db.refresh(document)
     return document
@@ -3,11 +3,13 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import desc
 
-import stripe
+from app.external.stripe_config import stripe
 from app.models.common.stripe_price import StripePrice
-from app.models import Price, Preference, PriceRange, User
+from app.models import Price, Preference, User
 from app.schemas.teachers.price_schema import PriceCreateRequest
-from app.cores.token import verify_token
+from app.cores.token import verify_access_token
+from app.services.common.reference_data import reference_data
+from app.services.teachers.public_catalog_cache import invalidate_public_catalog
 
 # ==================== VALIDACIONES ====================
 
@@ -17,8 +19,7 @@ async def _validate_user_exists(db: AsyncSession, user_id: int):
         raise ValueError(f"El usuario con ID {user_id} no existe")
 
 async def _validate_price_range_exists(db: AsyncSession, price_range_id: int):
-    result = await db.execute(select(PriceRange).where(PriceRange.id == price_range_id))
-    if not result.scalar_one_or_none():
+    if not await reference_data.get_price_range(db, price_range_id):
         raise ValueError("El rango de precios no existe")
 
 async def _validate_preference_exists(db: AsyncSession, preference_id: int, user_id: int):
@@ -61,10 +62,8 @@ async def _validate_price_range_matches_educational_level(
         raise ValueError("No se encontró el nivel educativo de la preferencia")
 
     # Obtener el educational_level_id del rango de precios
-    range_result = await db.execute(
-        select(PriceRange.educational_level_id).where(PriceRange.id == price_range_id)
-    )
-    range_level_id = range_result.scalar_one_or_none()
+    price_range = await reference_data.get_price_range(db, price_range_id)
+    range_level_id = price_range.educational_level_id if price_range else None
     if not range_level_id:
         raise ValueError("No se encontró el nivel educativo del rango de precios")
 
@@ -75,7 +74,7 @@ async def _validate_price_range_matches_educational_level(
 # ==================== FUNCIONES PRINCIPALES ====================
 
 async def get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
+    payload = verify_access_token(token)
     user_id = payload.get("user_id")
     if not user_id:
         raise ValueError("Token inválido: falta user_id")
@@ -176,6 +175,7 @@ async def create_price_by_token(
 
     db.add(db_price)
     await db.commit()
+    await invalidate_public_catalog()
     await db.refresh(db_price)
     return db_price
 
@@ -201,10 +201,7 @@ async def get_price_availability_by_token(db: AsyncSession, token: str) -> dict:
         raise ValueError("El usuario no tiene preferencias registradas")
 
     # Fetch price ranges by the preference's educational level
-    ranges_q = await db.execute(
-        select(PriceRange).where(PriceRange.educational_level_id == preference.educational_level_id)
-    )
-    ranges = ranges_q.scalars().all()
+    ranges = await reference_data.get_price_ranges_for_level(db, preference.educational_level_id)
 
     return {
         "preference_id": preference.id,
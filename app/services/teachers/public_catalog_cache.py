@@ -0,0 +1,31 @@
+"""
+Espacios de nombres de la caché de respuestas del catálogo público y su invalidación.
+
+Los servicios que escriben precios, documentos, preferencias, calificaciones o
+videos llaman a `invalidate_public_catalog` después del commit.
+"""
+
+import logging
+
+from app.cores.response_cache import response_cache
+
+PUBLIC_TEACHERS = "public:teachers"
+PUBLIC_TEACHER_SEARCH = "public:search-teachers"
+PUBLIC_TEACHERS_WITH_VIDEOS = "public:teachers-with-videos"
+
+
+async def invalidate_public_catalog(include_videos: bool = False) -> None:
+    """
+    Invalida las respuestas cacheadas del catálogo de docentes sin propagar errores
+    de la caché: el cambio ya se confirmó en la base de datos.
+
+    Args:
+        include_videos: También invalida el listado de docentes con video
+    """
+    namespaces = [PUBLIC_TEACHERS, PUBLIC_TEACHER_SEARCH]
+    if include_videos:
+        namespaces.append(PUBLIC_TEACHERS_WITH_VIDEOS)
+    try:
+        await response_cache.invalidate(*namespaces)
+    except Exception as e:
+        logging.error(f"Error invalidando la caché del catálogo público: {e}")
@@ -0,0 +1,241 @@
+"""
+Índice de búsqueda de docentes (nombre, área de especialidad y descripción).
+
+El texto se guarda normalizado con `normalize_text` (minúsculas, sin acentos) en
+`teacher_search_documents` y se consulta según el motor:
+
+- MySQL: índice FULLTEXT con MATCH ... AGAINST en modo booleano.
+- PostgreSQL: índice GIN sobre `to_tsvector('simple', search_text)`.
+- SQLite (u otros): índice invertido en memoria cargado desde la tabla.
+
+Todos los términos deben coincidir (como prefijo). El orden combina la
+relevancia del texto (llevada a 0..1 en todos los motores) con la calificación
+guardada en `teacher_stats`.
+"""
+
+import bisect
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import case, delete, func, literal_column, select
+from sqlalchemy.dialects.mysql import match as mysql_match
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.configs.settings import settings
+from app.models.teachers.document import Document
+from app.models.teachers.teacher_search_document import TeacherSearchDocument
+from app.models.users.user import User
+from app.services.foro.content_filter import normalize_text
+
+TEACHER_ROLE_ID = 1
+TS_CONFIG = literal_column("'simple'::regconfig")
+
+
+def build_search_text(first_name: str, last_name: str, documents: Iterable[Tuple[str, str]] = ()) -> str:
+    """Texto normalizado del docente: nombre + (área de especialidad, descripción) de cada documento."""
+    parts = [first_name or "", last_name or ""]
+    for expertise_area, description in documents:
+        parts.extend((expertise_area or "", description or ""))
+    return normalize_text(" ".join(parts))
+
+
+def search_terms(query: str) -> List[str]:
+    """Términos normalizados y sin repetir de una consulta."""
+    return list(dict.fromkeys(normalize_text(query).split()))
+
+
+class SearchMatch(NamedTuple):
+    """Condición de coincidencia y expresión de relevancia sobre `TeacherSearchDocument`."""
+    condition: ColumnElement
+    relevance: ColumnElement
+
+
+class TeacherSearchIndex:
+    """
+    Índice invertido en memoria (respaldo para SQLite): término -> {user_id: frecuencia}.
+    La relevancia es TF-IDF por término (se toma el mejor término que empiece con el
+    buscado), normalizada a 0..1. Solo refleja los cambios hechos en este proceso.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._documents: Dict[int, Counter] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    def load(self, rows: Iterable[Tuple[int, str]]) -> None:
+        self.clear()
+        for user_id, search_text in rows:
+            self.replace(user_id, search_text)
+        self.loaded = True
+
+    def clear(self) -> None:
+        self.loaded = False
+        self._postings.clear()
+        self._documents.clear()
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+
+    def replace(self, user_id: int, search_text: str) -> None:
+        self.remove(user_id)
+        terms = Counter(search_text.split())
+        self._documents[user_id] = terms
+        for term, frequency in terms.items():
+            if term not in self._postings:
+                self._postings[term] = {}
+                self._vocabulary_dirty = True
+            self._postings[term][user_id] = frequency
+
+    def remove(self, user_id: int) -> None:
+        for term in self._documents.pop(user_id, ()):
+            postings = self._postings[term]
+            postings.pop(user_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+    def search(self, terms: List[str]) -> Dict[int, float]:
+        """Docentes que contienen todos los términos (como prefijo) con su relevancia 0..1."""
+        if not terms or not self._documents:
+            return {}
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+
+        total = len(self._documents)
+        scores: Optional[Dict[int, float]] = None
+        for term in terms:
+            term_scores: Dict[int, float] = {}
+            start = bisect.bisect_left(self._vocabulary, term)
+            for candidate in self._vocabulary[start:]:
+                if not candidate.startswith(term):
+                    break
+                postings = self._postings[candidate]
+                idf = math.log(1 + total / len(postings))
+                for user_id, frequency in postings.items():
+                    term_scores[user_id] = max(term_scores.get(user_id, 0.0), frequency * idf)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {user_id: score + term_scores[user_id] for user_id, score in scores.items() if user_id in term_scores}
+            if not scores:
+                return {}
+
+        best = max(scores.values())
+        return {user_id: score / best for user_id, score in scores.items()}
+
+
+# Instancia global
+teacher_search_index = TeacherSearchIndex()
+
+
+class TeacherSearchService:
+
+    @staticmethod
+    async def refresh_teacher(db: AsyncSession, user_id: int) -> None:
+        """
+        Recalcula el texto de búsqueda del docente (sin commit). Llamar después de
+        registrar un docente o de crear/actualizar sus documentos.
+
+        Args:
+            db: Sesión de base de datos
+            user_id: Docente a reindexar
+        """
+        await db.flush()  # las sesiones no hacen autoflush y el texto sale de los cambios pendientes
+        user = (await db.execute(
+            select(User.first_name, User.last_name, User.role_id).where(User.id == user_id)
+        )).one_or_none()
+        if not user or user.role_id != TEACHER_ROLE_ID:
+            await db.execute(delete(TeacherSearchDocument).where(TeacherSearchDocument.user_id == user_id))
+            teacher_search_index.remove(user_id)
+            return
+
+        documents = (await db.execute(
+            select(Document.expertise_area, Document.description).where(Document.user_id == user_id)
+        )).all()
+        search_text = build_search_text(user.first_name, user.last_name, documents)
+        await db.merge(TeacherSearchDocument(user_id=user_id, search_text=search_text))
+        if teacher_search_index.loaded:
+            teacher_search_index.replace(user_id, search_text)
+
+    @staticmethod
+    async def rebuild_search_index(db: AsyncSession) -> int:
+        """
+        Regenera `teacher_search_documents` para todos los docentes. Tarea de reparación.
+
+        Returns:
+            int: Número de docentes indexados
+        """
+        rows = (await db.execute(
+            select(User.id, User.first_name, User.last_name, Document.expertise_area, Document.description)
+            .outerjoin(Document, Document.user_id == User.id)
+            .where(User.role_id == TEACHER_ROLE_ID)
+            .order_by(User.id)
+        )).all()
+
+        names: Dict[int, Tuple[str, str]] = {}
+        documents: Dict[int, list] = {}
+        for row in rows:
+            names[row.id] = (row.first_name, row.last_name)
+            teacher_documents = documents.setdefault(row.id, [])
+            if row.expertise_area is not None or row.description is not None:
+                teacher_documents.append((row.expertise_area, row.description))
+
+        search_texts = {
+            user_id: build_search_text(first_name, last_name, documents[user_id])
+            for user_id, (first_name, last_name) in names.items()
+        }
+        await db.execute(delete(TeacherSearchDocument))
+        db.add_all(TeacherSearchDocument(user_id=user_id, search_text=text) for user_id, text in search_texts.items())
+        await db.commit()
+
+        teacher_search_index.load(search_texts.items())
+        return len(search_texts)
+
+    @staticmethod
+    async def match(db: AsyncSession, query: str) -> Optional[SearchMatch]:
+        """
+        Condición y relevancia para buscar `query` en el índice del motor activo.
+
+        Args:
+            db: Sesión de base de datos
+            query: Texto libre (nombre, materia, descripción)
+
+        Returns:
+            SearchMatch sobre `TeacherSearchDocument`, o None si la consulta no tiene términos
+        """
+        terms = search_terms(query)
+        if not terms:
+            return None
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            relevance = mysql_match(
+                TeacherSearchDocument.search_text,
+                against=" ".join(f"+{term}*" for term in terms)
+            ).in_boolean_mode()
+            # MATCH no tiene tope: relevance / (relevance + 1) la lleva a 0..1 como en los otros motores
+            return SearchMatch(relevance > 0, relevance / (relevance + 1))
+
+        if dialect == "postgresql":
+            vector = func.to_tsvector(TS_CONFIG, TeacherSearchDocument.search_text)
+            tsquery = func.to_tsquery(TS_CONFIG, " & ".join(f"{term}:*" for term in terms))
+            # Normalización 32 de ts_rank: rank / (rank + 1)
+            return SearchMatch(vector.op("@@")(tsquery), func.ts_rank(vector, tsquery, 32))
+
+        if not teacher_search_index.loaded:
+            rows = await db.execute(select(TeacherSearchDocument.user_id, TeacherSearchDocument.search_text))
+            teacher_search_index.load(rows.all())
+        scores = teacher_search_index.search(terms)
+        return SearchMatch(
+            TeacherSearchDocument.user_id.in_(list(scores)),
+            case(scores, value=TeacherSearchDocument.user_id, else_=0) if scores else literal_column("0")
+        )
+
+    @staticmethod
+    def rank(search_match: SearchMatch, avg_rating: ColumnElement) -> ColumnElement:
+        """Relevancia del texto + TEACHER_SEARCH_RATING_WEIGHT por calificación (0..5 llevada a 0..1)."""
+        return search_match.relevance + settings.TEACHER_SEARCH_RATING_WEIGHT * func.coalesce(avg_rating, 0) / 5
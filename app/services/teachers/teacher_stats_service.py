@@ -0,0 +1,131 @@
+"""
+Agregados precalculados por docente (tabla `teacher_stats`).
+
+Los servicios que crean calificaciones, reservas o completan clases llaman a
+`record_*` dentro de su transacción; el catálogo público lee estas columnas en
+lugar de recalcular el AVG sobre todo el historial. `rebuild_teacher_stats`
+recalcula todo desde las tablas de origen (tarea de reparación).
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import Float, case, cast, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.booking.assessment import Assessment
+from app.models.booking.bookings import Booking
+from app.models.booking.payment_bookings import PaymentBooking
+from app.models.common.status import Status
+from app.models.teachers.availability import Availability
+from app.models.teachers.teacher_stat import TeacherStat
+
+
+class TeacherStatsService:
+
+    @staticmethod
+    async def record_assessment(db: AsyncSession, teacher_id: int, qualification: Optional[int]) -> None:
+        """
+        Suma una calificación al promedio del docente (sin commit).
+
+        Args:
+            db: Sesión de base de datos
+            teacher_id: Docente evaluado
+            qualification: Calificación recibida (las nulas no cuentan para el promedio)
+        """
+        if qualification is None:
+            return
+        # avg_rating va primero: MySQL evalúa el SET de izquierda a derecha con los valores ya actualizados
+        await TeacherStatsService._increment(db, teacher_id, [
+            (TeacherStat.avg_rating, cast(TeacherStat.rating_sum + qualification, Float) / (TeacherStat.rating_count + 1)),
+            (TeacherStat.rating_sum, TeacherStat.rating_sum + qualification),
+            (TeacherStat.rating_count, TeacherStat.rating_count + 1),
+        ])
+
+    @staticmethod
+    async def record_booking(db: AsyncSession, teacher_id: int) -> None:
+        """Suma una reserva al docente (sin commit)."""
+        await TeacherStatsService._increment(db, teacher_id, [
+            (TeacherStat.total_bookings, TeacherStat.total_bookings + 1),
+        ])
+
+    @staticmethod
+    async def record_completed_class(db: AsyncSession, teacher_id: int) -> None:
+        """Suma una clase completada al docente (sin commit)."""
+        await TeacherStatsService._increment(db, teacher_id, [
+            (TeacherStat.completed_classes, TeacherStat.completed_classes + 1),
+        ])
+
+    @staticmethod
+    async def rebuild_teacher_stats(db: AsyncSession, teacher_ids: Optional[List[int]] = None) -> int:
+        """
+        Recalcula los agregados desde reservas y calificaciones. Tarea de reparación.
+
+        Args:
+            db: Sesión de base de datos
+            teacher_ids: Docentes a recalcular (todos si no se indica)
+
+        Returns:
+            int: Número de docentes con estadísticas
+        """
+        stats = await TeacherStatsService._compute(db, teacher_ids)
+
+        clear = delete(TeacherStat)
+        if teacher_ids is not None:
+            clear = clear.where(TeacherStat.user_id.in_(teacher_ids))
+        await db.execute(clear)
+        db.add_all(TeacherStat(user_id=user_id, **values) for user_id, values in stats.items())
+        await db.commit()
+        return len(stats)
+
+    @staticmethod
+    async def _increment(db: AsyncSession, teacher_id: int, values: list) -> None:
+        stmt = update(TeacherStat).where(TeacherStat.user_id == teacher_id).ordered_values(*values)
+        result = await db.execute(stmt)
+        if result.rowcount:
+            return
+
+        # Primera actividad del docente: se crea la fila desde el historial, que ya
+        # incluye el cambio recién enviado en esta misma transacción
+        await db.flush()
+        computed = await TeacherStatsService._compute(db, [teacher_id])
+        try:
+            async with db.begin_nested():
+                db.add(TeacherStat(user_id=teacher_id, **computed.get(teacher_id, {})))
+        except IntegrityError:
+            # Otra transacción creó la fila primero (sin ver nuestro cambio)
+            await db.execute(stmt)
+
+    @staticmethod
+    async def _compute(db: AsyncSession, teacher_ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        # Una reserva puede tener varios pagos/evaluaciones: las reservas se cuentan con DISTINCT
+        query = (
+            select(
+                Availability.user_id,
+                func.coalesce(func.avg(Assessment.qualification), 0).label("avg_rating"),
+                func.count(Assessment.qualification).label("rating_count"),
+                func.coalesce(func.sum(Assessment.qualification), 0).label("rating_sum"),
+                func.count(func.distinct(Booking.id)).label("total_bookings"),
+                func.count(func.distinct(case((Status.name == "completed", Booking.id)))).label("completed_classes"),
+            )
+            .select_from(Availability)
+            .outerjoin(Booking, Booking.availability_id == Availability.id)
+            .outerjoin(Status, Status.id == Booking.status_id)
+            .outerjoin(PaymentBooking, PaymentBooking.booking_id == Booking.id)
+            .outerjoin(Assessment, Assessment.payment_booking_id == PaymentBooking.id)
+            .group_by(Availability.user_id)
+        )
+        if teacher_ids is not None:
+            query = query.where(Availability.user_id.in_(teacher_ids))
+
+        result = await db.execute(query)
+        return {
+            row.user_id: {
+                "avg_rating": float(row.avg_rating or 0),
+                "rating_count": row.rating_count,
+                "rating_sum": int(row.rating_sum or 0),
+                "total_bookings": row.total_bookings,
+                "completed_classes": row.completed_classes,
+            }
+            for row in result.all()
+        }
@@ -1,33 +1,56 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, select, and_, or_
+from sqlalchemy import func, desc, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import User, Document, Price, Preference, Booking, EducationalLevel
-from app.models.users.profile import Profile
-from app.models.teachers.availability import Availability
+from app.models import User, Document, Price, Preference, EducationalLevel
 from app.models.teachers.video import Video
-from app.models.booking.assessment import Assessment
-from app.models.booking.payment_bookings import PaymentBooking
+from app.models.teachers.teacher_stat import TeacherStat
+from app.models.teachers.teacher_search_document import TeacherSearchDocument
+from app.services.teachers.teacher_search_service import TeacherSearchService
 from typing import Optional
-import json
+
+# Videos que se muestran en el catálogo (los que acepta validate_youtube_video_for_teacher)
+LISTED_VIDEO_PRIVACY_STATUSES = ("public", "unlisted")
+
 
 class PublicService:
     @staticmethod
-    async def get_public_teachers(db: AsyncSession, min_bookings: Optional[int] = None):
-        # Subconsulta para calcular el promedio de calificaciones por docente
-        rating_subquery = (
-            select(
-                Availability.user_id,
-                func.coalesce(func.avg(Assessment.qualification), 0).label("avg_rating")
-            )
-            .select_from(Availability)
-            .outerjoin(Booking, Booking.availability_id == Availability.id)
-            .outerjoin(PaymentBooking, PaymentBooking.booking_id == Booking.id)
-            .outerjoin(Assessment, Assessment.payment_booking_id == PaymentBooking.id)
-            .group_by(Availability.user_id)
-            .subquery()
-        )
-        
-        # Query principal
+    async def get_public_teachers(
+        db: AsyncSession,
+        min_bookings: Optional[int] = None,
+        page: int = 1,
+        page_size: int = 10
+    ):
+        """
+        Lista pública de docentes activos, paginada en SQL.
+
+        Calificación y reservas salen de `teacher_stats`, así que `min_bookings`
+        y el orden por calificación usan columnas indexadas y LIMIT/OFFSET solo
+        materializa las filas de la página. El total se obtiene con un COUNT
+        aparte que no une precios, videos ni documentos.
+
+        Args:
+            db: Sesión de base de datos
+            min_bookings: Cantidad mínima de reservas (opcional)
+            page: Número de página (desde 1)
+            page_size: Resultados por página
+
+        Returns:
+            Diccionario con `teachers`, `total`, `page` y `page_size`
+        """
+        filters = [User.role_id == 1, User.status_id == 1]  # Solo docentes activos
+        filter_bookings = min_bookings is not None and min_bookings > 0
+        if filter_bookings:
+            filters.append(TeacherStat.total_bookings >= min_bookings)
+
+        # Total sin las uniones de presentación
+        count_stmt = select(func.count(User.id)).select_from(User)
+        if filter_bookings:
+            count_stmt = count_stmt.join(TeacherStat, TeacherStat.user_id == User.id)
+        total = (await db.execute(count_stmt.where(*filters))).scalar_one()
+
+        if total == 0 or (page - 1) * page_size >= total:
+            return {"teachers": [], "total": total, "page": page, "page_size": page_size}
+
+        # Query principal: una fila por docente de la página
         stmt = (
             select(
                 User.id.label('user_id'),
@@ -36,51 +59,31 @@ class PublicService:
                 EducationalLevel.name.label("educational_level"),
                 Document.expertise_area,
                 Price.selected_prices.label("price_per_hour"),
-                rating_subquery.c.avg_rating.label("average_rating"),
+                TeacherStat.avg_rating.label("average_rating"),
                 Video.embed_url.label("video_embed_url"),
                 Video.thumbnail_url.label("video_thumbnail_url"),
-                func.count(Booking.id).label('total_bookings')
+                func.coalesce(TeacherStat.total_bookings, 0).label('total_bookings')
             )
             .select_from(User)
-            .outerjoin(Profile, Profile.user_id == User.id)
+            .outerjoin(TeacherStat, TeacherStat.user_id == User.id)
             .outerjoin(Preference, Preference.user_id == User.id)
             .outerjoin(EducationalLevel, EducationalLevel.id == Preference.educational_level_id)
             .outerjoin(Document, Document.user_id == User.id)
             .outerjoin(Price, Price.user_id == User.id)
             .outerjoin(Video, Video.user_id == User.id)
-            .outerjoin(rating_subquery, rating_subquery.c.user_id == User.id)
-            .outerjoin(Availability, Availability.user_id == User.id)
-            .outerjoin(Booking, Booking.availability_id == Availability.id)
-            .where(User.role_id == 1)  # Solo docentes
-            .where(User.status_id == 1)  # Solo activos
-            .group_by(
-                User.id,
-                User.first_name,
-                User.last_name,
-                EducationalLevel.name,
-                Document.expertise_area,
-                Price.selected_prices,
-                rating_subquery.c.avg_rating,
-                Video.embed_url,
-                Video.thumbnail_url
-            )
-            .order_by(desc(rating_subquery.c.avg_rating))
+            .where(*filters)
+            # Sin estadísticas cuenta como 0 (Postgres ordena los NULL primero en DESC);
+            # User.id desempata para que las páginas sean estables
+            .order_by(desc(func.coalesce(TeacherStat.avg_rating, 0)), User.id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
         )
-        
-        # Ejecutamos la consulta
+
         result = await db.execute(stmt)
-        results = result.all()
-        
-        # Aplicar filtro por cantidad mínima de reservas
-        filtered_results = []
-        for row in results:
-            if min_bookings is not None and row.total_bookings < min_bookings:
-                continue
-            filtered_results.append(row)
-        
+
         # Convertir a formato consistente con search_teachers_catalog
         teachers_list = []
-        for row in filtered_results:
+        for row in result.all():
             teachers_list.append({
                 "user_id": row.user_id,
                 "first_name": row.first_name,
@@ -93,8 +96,13 @@ class PublicService:
                 "video_thumbnail_url": row.video_thumbnail_url,
                 "total_bookings": row.total_bookings
             })
-        
-        return teachers_list
+
+        return {
+            "teachers": teachers_list,
+            "total": total,
+            "page": page,
+            "page_size": page_size
+        }
 
     @staticmethod
     async def search_teachers_catalog(
@@ -112,31 +120,18 @@ class PublicService:
         Búsqueda de docentes con filtros múltiples.
         
         Filtros:
-        - name: Busca en nombre y apellido
-        - subject: Área de especialidad (expertise_area)
+        - name / subject: Texto buscado en el índice de docentes (nombre, área de
+          especialidad y descripción, sin acentos); todos los términos deben coincidir
         - educational_level_id: Nivel educativo del docente
         - min_price/max_price: Rango de precio por hora
-        - min_rating: Calificación mínima (promedio de estrellas)
+        - min_rating: Calificación mínima (promedio de estrellas, desde `teacher_stats`)
         - page: Número de página (default: 1)
         - page_size: Resultados por página (default: 10)
         
-        Ordenamiento: Por calificación descendente (más calificados primero)
+        Ordenamiento: Con texto, por relevancia combinada con la calificación;
+        sin texto, por calificación descendente (más calificados primero)
         """
         
-        # Subconsulta para calcular el promedio de calificaciones por docente
-        rating_subquery = (
-            select(
-                Availability.user_id,
-                func.coalesce(func.avg(Assessment.qualification), 0).label("avg_rating")
-            )
-            .select_from(Availability)
-            .outerjoin(Booking, Booking.availability_id == Availability.id)
-            .outerjoin(PaymentBooking, PaymentBooking.booking_id == Booking.id)
-            .outerjoin(Assessment, Assessment.payment_booking_id == PaymentBooking.id)
-            .group_by(Availability.user_id)
-            .subquery()
-        )
-        
         # Query principal
         query = (
             select(
@@ -146,18 +141,17 @@ class PublicService:
                 EducationalLevel.name.label("educational_level"),
                 Document.expertise_area,
                 Price.selected_prices.label("price_per_hour"),
-                rating_subquery.c.avg_rating.label("average_rating"),
+                TeacherStat.avg_rating.label("average_rating"),
                 Video.embed_url.label("video_embed_url"),
                 Video.thumbnail_url.label("video_thumbnail_url")
             )
             .select_from(User)
-            .outerjoin(Profile, Profile.user_id == User.id)
             .outerjoin(Preference, Preference.user_id == User.id)
             .outerjoin(EducationalLevel, EducationalLevel.id == Preference.educational_level_id)
             .outerjoin(Document, Document.user_id == User.id)
             .outerjoin(Price, Price.user_id == User.id)
             .outerjoin(Video, Video.user_id == User.id)
-            .outerjoin(rating_subquery, rating_subquery.c.user_id == User.id)
+            .outerjoin(TeacherStat, TeacherStat.user_id == User.id)
             .where(User.role_id == 1)  # Solo docentes (teacher)
             .where(User.status_id == 1)  # Solo activos
         )
@@ -165,17 +159,14 @@ class PublicService:
         # Aplicar filtros
         filters = []
         
-        # Filtro por nombre
-        if name:
-            name_filter = or_(
-                User.first_name.ilike(f"%{name}%"),
-                User.last_name.ilike(f"%{name}%")
-            )
-            filters.append(name_filter)
-        
-        # Filtro por materia/área de especialidad
-        if subject:
-            filters.append(Document.expertise_area.ilike(f"%{subject}%"))
+        # Búsqueda de texto (nombre y materia) sobre el índice de docentes
+        search_match = None
+        text_query = " ".join(value for value in (name, subject) if value)
+        if text_query:
+            search_match = await TeacherSearchService.match(db, text_query)
+        if search_match is not None:
+            query = query.join(TeacherSearchDocument, TeacherSearchDocument.user_id == User.id)
+            filters.append(search_match.condition)
         
         # Filtro por nivel educativo
         if educational_level_id:
@@ -187,27 +178,29 @@ class PublicService:
         if max_price is not None:
             filters.append(Price.selected_prices <= max_price)
         
+        # Filtro por calificación mínima (sin estadísticas la calificación es 0)
+        if min_rating is not None and min_rating > 0:
+            filters.append(TeacherStat.avg_rating >= min_rating)
+        
         # Aplicar todos los filtros
         if filters:
             query = query.where(and_(*filters))
         
-        # Ordenar por calificación descendente (más calificados primero)
-        query = query.order_by(desc(rating_subquery.c.avg_rating))
-        
-        # Ejecutar query
-        result = await db.execute(query)
-        teachers = result.all()
-        
-        # Filtrar por calificación mínima (después de la query porque es calculado)
-        if min_rating is not None:
-            teachers = [t for t in teachers if (t.average_rating or 0) >= min_rating]
-        
         # Total de resultados
-        total = len(teachers)
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await db.execute(count_query)).scalar_one()
         
-        # Aplicar paginación
+        # Ordenar (relevancia + calificación, o solo calificación) y paginar en SQL
         offset = (page - 1) * page_size
-        teachers_paginated = teachers[offset:offset + page_size]
+        if search_match is not None:
+            query = query.order_by(desc(TeacherSearchService.rank(search_match, TeacherStat.avg_rating)), User.id)
+        else:
+            query = query.order_by(desc(func.coalesce(TeacherStat.avg_rating, 0)), User.id)
+        query = query.offset(offset).limit(page_size)
+        
+        # Ejecutar query
+        result = await db.execute(query)
+        teachers_paginated = result.all()
         
         # Convertir a diccionarios
         teachers_list = []
@@ -229,4 +222,80 @@ class PublicService:
             "total": total,
             "page": page,
             "page_size": page_size
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    async def get_teachers_with_videos(
+        db: AsyncSession,
+        limit: int = 20,
+        before_id: Optional[int] = None
+    ):
+        """
+        Docentes activos con video público o no listado e incrustable, del video más
+        nuevo al más antiguo.
+
+        Solo proyecta las columnas de la respuesta y pagina por cursor (keyset) sobre
+        `Video.id` usando el índice `ix_videos_public_listing`, así que cada página
+        cuesta lo mismo sin importar cuántos docentes haya.
+
+        Args:
+            db: Sesión de base de datos
+            limit: Número máximo de docentes
+            before_id: Cursor: solo videos con id menor a este
+
+        Returns:
+            Diccionario con `teachers`, `has_more` y `total` (todos los docentes listables, no solo la página)
+        """
+        filters = [
+            Video.privacy_status.in_(LISTED_VIDEO_PRIVACY_STATUSES),
+            Video.embeddable == True,
+            User.role_id == 1,  # Solo docentes
+            User.status_id == 1,  # Solo activos
+        ]
+        total = (await db.execute(
+            select(func.count(Video.id)).join(User, User.id == Video.user_id).where(*filters)
+        )).scalar_one()
+
+        stmt = (
+            select(
+                Video.id,
+                Video.user_id,
+                Video.youtube_video_id,
+                Video.title,
+                Video.thumbnail_url,
+                Video.duration_seconds,
+                Video.embed_url,
+                Video.privacy_status,
+                Video.embeddable,
+                Video.created_at,
+                User.first_name,
+                User.last_name
+            )
+            .join(User, User.id == Video.user_id)
+            .where(*filters)
+            .order_by(desc(Video.id))
+            .limit(limit + 1)
+        )
+        if before_id is not None:
+            stmt = stmt.where(Video.id < before_id)
+
+        rows = (await db.execute(stmt)).all()
+        teachers = [
+            {
+                "teacher_id": row.user_id,
+                "teacher_name": f"{row.first_name} {row.last_name}",
+                "video": {
+                    "id": row.id,
+                    "youtube_video_id": row.youtube_video_id,
+                    "title": row.title,
+                    "thumbnail_url": row.thumbnail_url,
+                    "duration_seconds": row.duration_seconds,
+                    "embed_url": row.embed_url,
+                    "privacy_status": row.privacy_status,
+                    "embeddable": row.embeddable,
+                    "created_at": row.created_at.isoformat() if row.created_at else None
+                }
+            }
+            for row in rows[:limit]
+        ]
+        return {"teachers": teachers, "has_more": len(rows) > limit, "total": total}
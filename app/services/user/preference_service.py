@@ -5,11 +5,12 @@ from datetime import datetime
 from fastapi import HTTPException  
 from app.models import Preference, EducationalLevel, Modality
 from app.models.users.user import User
-from app.cores.token import verify_token
+from app.cores.token import verify_access_token
 from app.schemas.user.preference_schema import (
     PreferenceUpdateRequest, 
     PreferenceCreateRequest
 )
+from app.services.teachers.public_catalog_cache import invalidate_public_catalog
 
 # ==================== VALIDACIONES ====================
 
@@ -44,7 +45,7 @@ async def _get_existing_preference_or_404(db: AsyncSession, user_id: int) -> Pre
 # ==================== FUNCIONES PRINCIPALES ====================
 
 async def get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
+    payload = verify_access_token(token)
     user_id = payload.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido: falta user_id")
@@ -80,6 +81,7 @@ async def create_preference_by_token(
 
     db.add(db_preference)
     await db.commit()
+    await invalidate_public_catalog()
     await db.refresh(db_preference)
     return db_preference
 
@@ -118,5 +120,6 @@ async def update_preference_by_token(
     preference.updated_at = datetime.utcnow()
     
     await db.commit()
+    await invalidate_public_catalog()
     await db.refresh(preference)
     return preference
@@ -5,7 +5,7 @@ from datetime import datetime
 from fastapi import HTTPException  
 from app.models.users.profile import Profile
 from app.models.users.user import User
-from app.cores.token import verify_token
+from app.cores.token import verify_access_token
 from app.schemas.user.profile_schema import ProfileUpdateRequest, ProfileCreateRequest
 
 # ==================== VALIDACIONES ====================
@@ -53,7 +53,7 @@ async def _get_existing_profile_or_404(db: AsyncSession, user_id: int) -> Profil
 # ==================== FUNCIONES PRINCIPALES ====================
 
 async def get_user_id_from_token(token: str) -> int:
-    payload = verify_token(token)
+    payload = verify_access_token(token)
     user_id = payload.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Token inválido: falta user_id")
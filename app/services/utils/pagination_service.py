@@ -3,6 +3,9 @@ from sqlalchemy.future import select
 from sqlalchemy import func
 from typing import TypeVar, Generic, Type, Sequence, Optional, Dict, Any
 from fastapi import HTTPException
+import base64
+import binascii
+import json
 
 T = TypeVar('T')
 
@@ -72,4 +75,35 @@ class PaginationService:
             }
             
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error in pagination: {str(e)}") 
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=f"Error in pagination: {str(e)}") 
+
+    @staticmethod
+    def encode_cursor(data: Dict[str, Any]) -> str:
+        """
+        Genera un cursor opaco (base64 url-safe) para paginación por llave (keyset).
+        
+        Args:
+            data: Valores de la llave de ordenamiento, por ejemplo {"before_id": 120}
+        
+        Returns:
+            str: Cursor opaco para el cliente
+        """
+        raw = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Dict[str, Any]:
+        """
+        Decodifica un cursor generado por `encode_cursor`.
+        
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise ValueError("Cursor de paginación inválido")
+        if not isinstance(data, dict):
+            raise ValueError("Cursor de paginación inválido")
+        return data
@@ -1,4 +1,3 @@
-import stripe
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from fastapi import HTTPException
@@ -14,7 +13,7 @@ from app.schemas.wallets.wallet_schema import (
     WithdrawFundsRequest,
     StripeConnectAccountRequest
 )
-from app.external.stripe_config import stripe_config
+from app.external.stripe_config import stripe
 
 
 class WalletService:
@@ -0,0 +1,22 @@
+import pytest
+
+from app.cores.db import Base, create_db_engine, create_sessionmaker
+import app.models  # noqa: F401  (registra todos los modelos en Base.metadata)
+
+
+@pytest.fixture
+async def db_engine(tmp_path, request):
+    """Engine sobre un SQLite vacío en `tmp_path`; se libera al terminar la prueba."""
+    engine = create_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", request.node.name)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def session_factory(db_engine):
+    """Fábrica de sesiones sobre `db_engine` con las tablas de los modelos ya creadas."""
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return create_sessionmaker(db_engine)
@@ -0,0 +1,661 @@
+-- Esquema que creaba `Base.metadata.create_all` (SQLite) antes de adoptar Alembic.
+-- Lo usa tests/test_migrations.py para probar el paso de una base previa a las migraciones.
+
+CREATE TABLE statuses (
+	id INTEGER NOT NULL, 
+	name VARCHAR(20) NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id)
+);
+
+CREATE TABLE verification_codes (
+	id INTEGER NOT NULL, 
+	email VARCHAR(255) NOT NULL, 
+	role VARCHAR(50) NOT NULL, 
+	purpose VARCHAR(50) NOT NULL, 
+	code VARCHAR(6) NOT NULL, 
+	used BOOLEAN NOT NULL, 
+	attempts INTEGER, 
+	last_attempt DATETIME, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	expires_at DATETIME NOT NULL, 
+	PRIMARY KEY (id)
+);
+
+CREATE TABLE notifications (
+	id INTEGER NOT NULL, 
+	title VARCHAR(100) NOT NULL, 
+	message VARCHAR(500) NOT NULL, 
+	type VARCHAR(50) NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id)
+);
+
+CREATE TABLE stripe_prices (
+	id INTEGER NOT NULL, 
+	stripe_product_id VARCHAR(100), 
+	stripe_price_id VARCHAR(100) NOT NULL, 
+	amount FLOAT NOT NULL, 
+	currency VARCHAR(10) NOT NULL, 
+	type VARCHAR(50) NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	CONSTRAINT uix_amount_type UNIQUE (amount, type), 
+	UNIQUE (stripe_price_id)
+);
+
+CREATE TABLE category (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	UNIQUE (name)
+);
+
+CREATE TABLE roles (
+	id INTEGER NOT NULL, 
+	name VARCHAR(20), 
+	description VARCHAR(50), 
+	status_id INTEGER, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE modalities (
+	id INTEGER NOT NULL, 
+	name VARCHAR(20) NOT NULL, 
+	status_id INTEGER, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE educational_levels (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	status_id INTEGER, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE benefits (
+	id INTEGER NOT NULL, 
+	name VARCHAR(255) NOT NULL, 
+	description VARCHAR(500), 
+	status_id INTEGER, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE privileges (
+	id INTEGER NOT NULL, 
+	name VARCHAR(100) NOT NULL, 
+	action VARCHAR(255) NOT NULL, 
+	description VARCHAR(255), 
+	status_id INTEGER, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE price_ranges (
+	id INTEGER NOT NULL, 
+	educational_level_id INTEGER NOT NULL, 
+	minimum_price FLOAT NOT NULL, 
+	maximum_price FLOAT NOT NULL, 
+	status_id INTEGER, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(educational_level_id) REFERENCES educational_levels (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE users (
+	id INTEGER NOT NULL, 
+	first_name VARCHAR(100) NOT NULL, 
+	last_name VARCHAR(100) NOT NULL, 
+	email VARCHAR(120) NOT NULL, 
+	password VARCHAR(255) NOT NULL, 
+	privacy_policy_accepted BOOLEAN DEFAULT '1' NOT NULL, 
+	role_id INTEGER, 
+	status_id INTEGER NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(role_id) REFERENCES roles (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE plans (
+	id INTEGER NOT NULL, 
+	guy VARCHAR(100) NOT NULL, 
+	name VARCHAR(255) NOT NULL, 
+	description VARCHAR(500), 
+	price INTEGER NOT NULL, 
+	duration VARCHAR(50), 
+	stripe_product_id VARCHAR(100), 
+	stripe_price_id VARCHAR(100), 
+	role_id INTEGER NOT NULL, 
+	status_id INTEGER, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(role_id) REFERENCES roles (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE privilege_roles (
+	id INTEGER NOT NULL, 
+	privilege_id INTEGER NOT NULL, 
+	role_id INTEGER NOT NULL, 
+	status_id INTEGER NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(privilege_id) REFERENCES privileges (id), 
+	FOREIGN KEY(role_id) REFERENCES roles (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE preferences (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	educational_level_id INTEGER NOT NULL, 
+	modality_id INTEGER NOT NULL, 
+	location VARCHAR(100), 
+	location_description VARCHAR(200), 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(educational_level_id) REFERENCES educational_levels (id), 
+	FOREIGN KEY(modality_id) REFERENCES modalities (id)
+);
+
+CREATE TABLE documents (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	rfc_hash VARCHAR(64) NOT NULL, 
+	rfc_cipher TEXT NOT NULL, 
+	certificate VARCHAR(255) NOT NULL, 
+	curriculum VARCHAR(255) NOT NULL, 
+	expertise_area VARCHAR(100) NOT NULL, 
+	description VARCHAR(500) NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id)
+);
+
+CREATE TABLE videos (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	youtube_video_id VARCHAR(20) NOT NULL, 
+	title VARCHAR(255) NOT NULL, 
+	thumbnail_url TEXT, 
+	duration_seconds INTEGER NOT NULL, 
+	embed_url TEXT NOT NULL, 
+	privacy_status VARCHAR(20) NOT NULL, 
+	embeddable BOOLEAN NOT NULL, 
+	original_url TEXT NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	CONSTRAINT uq_user_video UNIQUE (user_id), 
+	FOREIGN KEY(user_id) REFERENCES users (id)
+);
+
+CREATE TABLE plan_benefits (
+	plan_id INTEGER NOT NULL, 
+	benefit_id INTEGER NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	PRIMARY KEY (plan_id, benefit_id), 
+	FOREIGN KEY(plan_id) REFERENCES plans (id), 
+	FOREIGN KEY(benefit_id) REFERENCES benefits (id)
+);
+
+CREATE TABLE payment_subscriptions (
+	id INTEGER NOT NULL, 
+	plan_id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	stripe_payment_intent_id VARCHAR(100), 
+	payment_date DATETIME NOT NULL, 
+	status_id INTEGER, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(plan_id) REFERENCES plans (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE privilege_users (
+	id INTEGER NOT NULL, 
+	privilege_id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	status_id INTEGER NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(privilege_id) REFERENCES privileges (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE user_notifications (
+	id INTEGER NOT NULL, 
+	notification_id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	is_read BOOLEAN NOT NULL, 
+	sent_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(notification_id) REFERENCES notifications (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id)
+);
+
+CREATE TABLE wallets (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	stripe_account_id VARCHAR(50), 
+	stripe_bank_status VARCHAR(50), 
+	stripe_setup_url VARCHAR(500), 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	UNIQUE (user_id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	UNIQUE (stripe_account_id)
+);
+
+CREATE TABLE foro (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	category_id INTEGER NOT NULL, 
+	title VARCHAR(255) NOT NULL, 
+	description TEXT, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(category_id) REFERENCES category (id)
+);
+
+CREATE TABLE profile (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	credential VARCHAR(255) NOT NULL, 
+	gender VARCHAR(50), 
+	sex VARCHAR(50), 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id)
+);
+
+CREATE TABLE chats (
+	id INTEGER NOT NULL, 
+	student_id INTEGER NOT NULL, 
+	teacher_id INTEGER NOT NULL, 
+	is_active BOOLEAN NOT NULL, 
+	is_blocked BOOLEAN NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(student_id) REFERENCES users (id), 
+	FOREIGN KEY(teacher_id) REFERENCES users (id)
+);
+
+CREATE TABLE prices (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	preference_id INTEGER NOT NULL, 
+	price_range_id INTEGER NOT NULL, 
+	selected_prices FLOAT NOT NULL, 
+	extra_hour_price FLOAT NOT NULL, 
+	stripe_product_id VARCHAR(100), 
+	stripe_price_id VARCHAR(100), 
+	stripe_extra_product_id VARCHAR(100), 
+	stripe_extra_price_id VARCHAR(100), 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(preference_id) REFERENCES preferences (id), 
+	FOREIGN KEY(price_range_id) REFERENCES price_ranges (id)
+);
+
+CREATE TABLE subscriptions (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	plan_id INTEGER NOT NULL, 
+	payment_suscription_id INTEGER, 
+	start_date DATETIME NOT NULL, 
+	end_date DATETIME, 
+	status_id INTEGER, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(plan_id) REFERENCES plans (id), 
+	FOREIGN KEY(payment_suscription_id) REFERENCES payment_subscriptions (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE availabilities (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	preference_id INTEGER NOT NULL, 
+	day_of_week INTEGER NOT NULL, 
+	start_time VARCHAR(10) NOT NULL, 
+	end_time VARCHAR(10) NOT NULL, 
+	is_active BOOLEAN NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(preference_id) REFERENCES preferences (id)
+);
+
+CREATE TABLE foro_comment (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	foro_id INTEGER NOT NULL, 
+	comment TEXT NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(foro_id) REFERENCES foro (id)
+);
+
+CREATE TABLE messages (
+	id INTEGER NOT NULL, 
+	chat_id INTEGER NOT NULL, 
+	sender_id INTEGER NOT NULL, 
+	encrypted_content TEXT NOT NULL, 
+	encryption_version VARCHAR(10) NOT NULL, 
+	is_encrypted BOOLEAN NOT NULL, 
+	is_read BOOLEAN NOT NULL, 
+	is_deleted BOOLEAN NOT NULL, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(chat_id) REFERENCES chats (id), 
+	FOREIGN KEY(sender_id) REFERENCES users (id)
+);
+
+CREATE TABLE bookings (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	availability_id INTEGER NOT NULL, 
+	start_time DATETIME NOT NULL, 
+	end_time DATETIME NOT NULL, 
+	class_space VARCHAR(100), 
+	status_id INTEGER, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(availability_id) REFERENCES availabilities (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE foro_reply_comment (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	foro_comment_id INTEGER, 
+	comment TEXT NOT NULL, 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(foro_comment_id) REFERENCES foro_comment (id) ON DELETE SET NULL
+);
+
+CREATE TABLE payment_bookings (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	booking_id INTEGER NOT NULL, 
+	price_id INTEGER NOT NULL, 
+	total_amount INTEGER NOT NULL, 
+	commission_percentage NUMERIC(5, 2) NOT NULL, 
+	commission_amount INTEGER NOT NULL, 
+	teacher_amount INTEGER NOT NULL, 
+	platform_amount INTEGER NOT NULL, 
+	transfer_date DATETIME, 
+	transfer_status VARCHAR(50) NOT NULL, 
+	teacher_stripe_account_id VARCHAR(100), 
+	stripe_transfer_id VARCHAR(100), 
+	application_fee_amount INTEGER, 
+	status_id INTEGER, 
+	stripe_payment_intent_id VARCHAR(100), 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(booking_id) REFERENCES bookings (id), 
+	FOREIGN KEY(price_id) REFERENCES prices (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE reschedule_requests (
+	id INTEGER NOT NULL, 
+	booking_id INTEGER NOT NULL, 
+	teacher_id INTEGER NOT NULL, 
+	student_id INTEGER NOT NULL, 
+	current_availability_id INTEGER NOT NULL, 
+	current_start_time DATETIME NOT NULL, 
+	current_end_time DATETIME NOT NULL, 
+	new_availability_id INTEGER NOT NULL, 
+	new_start_time DATETIME NOT NULL, 
+	new_end_time DATETIME NOT NULL, 
+	reason TEXT, 
+	status_id INTEGER, 
+	status VARCHAR(20), 
+	student_response TEXT, 
+	created_at DATETIME, 
+	responded_at DATETIME, 
+	expires_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(booking_id) REFERENCES bookings (id), 
+	FOREIGN KEY(teacher_id) REFERENCES users (id), 
+	FOREIGN KEY(student_id) REFERENCES users (id), 
+	FOREIGN KEY(current_availability_id) REFERENCES availabilities (id), 
+	FOREIGN KEY(new_availability_id) REFERENCES availabilities (id), 
+	FOREIGN KEY(status_id) REFERENCES statuses (id)
+);
+
+CREATE TABLE confirmations (
+	id INTEGER NOT NULL, 
+	teacher_id INTEGER NOT NULL, 
+	student_id INTEGER NOT NULL, 
+	payment_booking_id INTEGER NOT NULL, 
+	confirmation_date_teacher BOOLEAN, 
+	confirmation_date_student BOOLEAN, 
+	evidence_student VARCHAR(255), 
+	evidence_teacher VARCHAR(255), 
+	description_student VARCHAR(255), 
+	description_teacher VARCHAR(255), 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(teacher_id) REFERENCES users (id), 
+	FOREIGN KEY(student_id) REFERENCES users (id), 
+	FOREIGN KEY(payment_booking_id) REFERENCES payment_bookings (id)
+);
+
+CREATE TABLE assessments (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	payment_booking_id INTEGER NOT NULL, 
+	qualification INTEGER, 
+	comment VARCHAR(255), 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id), 
+	FOREIGN KEY(payment_booking_id) REFERENCES payment_bookings (id)
+);
+
+CREATE TABLE refund_requests (
+	id INTEGER NOT NULL, 
+	student_id INTEGER NOT NULL, 
+	payment_booking_id INTEGER NOT NULL, 
+	booking_id INTEGER NOT NULL, 
+	confirmation_id INTEGER NOT NULL, 
+	refund_amount FLOAT NOT NULL, 
+	refund_type VARCHAR(50) NOT NULL, 
+	reason TEXT, 
+	status VARCHAR(20) NOT NULL, 
+	stripe_refund_id VARCHAR(255), 
+	created_at DATETIME NOT NULL, 
+	updated_at DATETIME NOT NULL, 
+	processed_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(student_id) REFERENCES users (id), 
+	FOREIGN KEY(payment_booking_id) REFERENCES payment_bookings (id), 
+	FOREIGN KEY(booking_id) REFERENCES bookings (id), 
+	FOREIGN KEY(confirmation_id) REFERENCES confirmations (id)
+);
+
+CREATE INDEX ix_statuses_id ON statuses (id);
+
+CREATE INDEX ix_statuses_name ON statuses (name);
+
+CREATE INDEX ix_verification_codes_id ON verification_codes (id);
+
+CREATE INDEX ix_verification_codes_email ON verification_codes (email);
+
+CREATE INDEX ix_verification_codes_code ON verification_codes (code);
+
+CREATE INDEX ix_notifications_title ON notifications (title);
+
+CREATE INDEX ix_notifications_message ON notifications (message);
+
+CREATE INDEX ix_notifications_id ON notifications (id);
+
+CREATE INDEX ix_notifications_type ON notifications (type);
+
+CREATE INDEX ix_stripe_prices_id ON stripe_prices (id);
+
+CREATE INDEX ix_stripe_prices_amount ON stripe_prices (amount);
+
+CREATE INDEX ix_category_id ON category (id);
+
+CREATE INDEX ix_roles_id ON roles (id);
+
+CREATE INDEX ix_roles_name ON roles (name);
+
+CREATE INDEX ix_modalities_name ON modalities (name);
+
+CREATE INDEX ix_modalities_id ON modalities (id);
+
+CREATE INDEX ix_educational_levels_id ON educational_levels (id);
+
+CREATE INDEX ix_educational_levels_name ON educational_levels (name);
+
+CREATE INDEX ix_benefits_id ON benefits (id);
+
+CREATE INDEX ix_privileges_name ON privileges (name);
+
+CREATE INDEX ix_privileges_action ON privileges (action);
+
+CREATE INDEX ix_privileges_id ON privileges (id);
+
+CREATE INDEX ix_price_ranges_id ON price_ranges (id);
+
+CREATE INDEX ix_price_ranges_educational_level_id ON price_ranges (educational_level_id);
+
+CREATE INDEX ix_users_id ON users (id);
+
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+
+CREATE INDEX ix_plans_id ON plans (id);
+
+CREATE INDEX ix_privilege_roles_id ON privilege_roles (id);
+
+CREATE INDEX ix_preferences_user_id ON preferences (user_id);
+
+CREATE INDEX ix_preferences_location_description ON preferences (location_description);
+
+CREATE INDEX ix_preferences_modality_id ON preferences (modality_id);
+
+CREATE INDEX ix_preferences_id ON preferences (id);
+
+CREATE INDEX ix_preferences_location ON preferences (location);
+
+CREATE INDEX ix_preferences_educational_level_id ON preferences (educational_level_id);
+
+CREATE INDEX ix_documents_id ON documents (id);
+
+CREATE UNIQUE INDEX ix_documents_rfc_hash ON documents (rfc_hash);
+
+CREATE INDEX ix_documents_user_id ON documents (user_id);
+
+CREATE UNIQUE INDEX ix_videos_youtube_video_id ON videos (youtube_video_id);
+
+CREATE INDEX ix_videos_user_id ON videos (user_id);
+
+CREATE INDEX ix_videos_id ON videos (id);
+
+CREATE INDEX ix_payment_subscriptions_id ON payment_subscriptions (id);
+
+CREATE INDEX ix_privilege_users_id ON privilege_users (id);
+
+CREATE INDEX ix_user_notifications_id ON user_notifications (id);
+
+CREATE INDEX ix_wallets_id ON wallets (id);
+
+CREATE INDEX ix_foro_id ON foro (id);
+
+CREATE INDEX ix_profile_id ON profile (id);
+
+CREATE INDEX ix_chats_teacher_id ON chats (teacher_id);
+
+CREATE INDEX ix_chats_student_id ON chats (student_id);
+
+CREATE INDEX ix_chats_id ON chats (id);
+
+CREATE INDEX ix_prices_id ON prices (id);
+
+CREATE INDEX ix_prices_user_id ON prices (user_id);
+
+CREATE INDEX ix_subscriptions_id ON subscriptions (id);
+
+CREATE INDEX ix_availabilities_id ON availabilities (id);
+
+CREATE INDEX ix_availabilities_user_id ON availabilities (user_id);
+
+CREATE INDEX ix_foro_comment_id ON foro_comment (id);
+
+CREATE INDEX ix_messages_sender_id ON messages (sender_id);
+
+CREATE INDEX ix_messages_chat_id ON messages (chat_id);
+
+CREATE INDEX ix_messages_id ON messages (id);
+
+CREATE INDEX ix_bookings_id ON bookings (id);
+
+CREATE INDEX ix_foro_reply_comment_id ON foro_reply_comment (id);
+
+CREATE INDEX ix_payment_bookings_id ON payment_bookings (id);
+
+CREATE INDEX ix_reschedule_requests_id ON reschedule_requests (id);
+
+CREATE INDEX ix_confirmations_id ON confirmations (id);
+
+CREATE INDEX ix_assessments_id ON assessments (id);
+
+CREATE INDEX ix_refund_requests_id ON refund_requests (id);
@@ -0,0 +1,58 @@
+import pytest
+from fastapi import HTTPException, Request
+from sqlalchemy import event
+
+from app.apis.deps import require_privilege
+from app.cores.authorization_cache import clear_authorization_cache, invalidate_privilege_decisions
+from app.cores.token import create_access_token
+from app.models import Role, Status
+from app.models.privileges.privilege import Privilege
+from app.models.privileges.privilege_role import PrivilegeRole
+from tests.test_db import engine_test, init_test_db, TestingSessionLocal
+
+
+async def run_checker(checker, authorization: str) -> int:
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        async with TestingSessionLocal() as session:
+            await checker(request=Request({"type": "http", "headers": []}), authorization=authorization, db=session)
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", on_execute)
+    return len(statements)
+
+
+@pytest.mark.asyncio
+async def test_require_privilege_skips_database_on_warm_path():
+    await init_test_db()
+    clear_authorization_cache()
+    async with TestingSessionLocal() as session:
+        active = Status(name="active")
+        session.add(active)
+        await session.flush()
+        role = Role(name="auditor", description="Auditor", status_id=active.id)
+        privilege = Privilege(name="reports", action="read", status_id=active.id)
+        session.add_all([role, privilege])
+        await session.flush()
+        grant = PrivilegeRole(privilege_id=privilege.id, role_id=role.id, status_id=active.id)
+        session.add(grant)
+        await session.commit()
+
+    authorization = f"Bearer {create_access_token({'user_id': 99, 'role': 'auditor'})}"
+    checker = require_privilege("reports", "read")
+
+    assert await run_checker(checker, authorization) > 0
+    assert await run_checker(checker, authorization) == 0
+
+    async with TestingSessionLocal() as session:
+        await session.delete(await session.get(PrivilegeRole, grant.id))
+        await session.commit()
+    invalidate_privilege_decisions()
+
+    with pytest.raises(HTTPException) as error:
+        await run_checker(checker, authorization)
+    assert error.value.status_code == 403
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.apis.chat_api import router as chat_router
+from app.cores.token import create_access_token, create_refresh_token
+from app.services.chat import ChatService, InMemoryChatBroker, MessageService, set_chat_broker
+from app.services.chat.chat_broker import user_channel
+from tests.test_chat_summaries import create_teacher_with_chats
+from tests.test_db import init_test_db, TestingSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_broker_delivers_only_to_subscribed_channel():
+    broker = InMemoryChatBroker()
+    async with broker.subscribe(user_channel(1)) as subscription:
+        assert await broker.publish_to_users([1, 2], {"type": "ping"}) == 1
+        assert await asyncio.wait_for(subscription.get(), 1) == {"type": "ping"}
+    assert broker.subscriber_count(user_channel(1)) == 0
+
+
+@pytest.mark.asyncio
+async def test_send_message_and_block_publish_events_to_participants():
+    broker = InMemoryChatBroker()
+    set_chat_broker(broker)
+    await init_test_db()
+    async with TestingSessionLocal() as session:
+        teacher = await create_teacher_with_chats(session, "realtime", 1)
+        chat = (await ChatService.get_user_chats(session, teacher.id, "teacher"))[0]
+
+        async with broker.subscribe(user_channel(chat.student_id)) as subscription:
+            await MessageService.send_message(session, chat.id, teacher.id, "Hola alumno", "teacher")
+            await ChatService.block_chat(session, chat.id, teacher.id)
+
+            new_message = await asyncio.wait_for(subscription.get(), 1)
+            blocked = await asyncio.wait_for(subscription.get(), 1)
+
+    assert new_message["type"] == "message.new"
+    assert new_message["message"]["content"] == "Hola alumno"
+    assert blocked == {"type": "chat.blocked", "chat_id": chat.id, "by_user_id": teacher.id}
+
+
+def test_websocket_accepts_only_access_tokens():
+    broker = InMemoryChatBroker()
+    set_chat_broker(broker)
+    app = FastAPI()
+    app.include_router(chat_router, prefix="/api/chat")
+    claims = {"user_id": 7, "email": "ws@test.com", "role": "student", "statuses": "active"}
+
+    with TestClient(app) as client:
+        with client.websocket_connect(f"/api/chat/ws?token={create_access_token(claims)}") as websocket:
+            while broker.subscriber_count(user_channel(7)) == 0:
+                websocket.portal.call(asyncio.sleep, 0.01)
+            websocket.portal.call(broker.publish_to_users, [7], {"type": "ping"})
+            assert websocket.receive_json() == {"type": "ping"}
+
+        for token in (None, "no-es-un-jwt", create_refresh_token(claims)):
+            url = "/api/chat/ws" if token is None else f"/api/chat/ws?token={token}"
+            with pytest.raises(WebSocketDisconnect) as closed:
+                with client.websocket_connect(url):
+                    pass
+            assert closed.value.code == 1008
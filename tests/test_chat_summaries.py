@@ -0,0 +1,200 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.apis.chat_api import get_chat_messages
+
+from app.cores.security import get_password_hash
+from app.models import Status, User
+from app.models.chat import Chat, Message
+from app.services.chat import ChatService, MessageService
+from app.services.encryption import EncryptionService
+from app.services.utils.pagination_service import PaginationService
+from tests.test_db import engine_test, init_test_db, TestingSessionLocal
+
+PASSWORD_HASH = get_password_hash("Password123!!")
+
+
+async def create_teacher_with_chats(session, prefix: str, chat_count: int) -> User:
+    status = Status(name="active")
+    session.add(status)
+    await session.flush()
+
+    def new_user(email):
+        return User(
+            first_name="Test",
+            last_name="Chat",
+            email=email,
+            password=PASSWORD_HASH,
+            status_id=status.id,
+            privacy_policy_accepted=True,
+        )
+
+    teacher = new_user(f"{prefix}-teacher@chat.com")
+    session.add(teacher)
+    await session.flush()
+
+    for index in range(chat_count):
+        student = new_user(f"{prefix}-student{index}@chat.com")
+        session.add(student)
+        await session.flush()
+
+        chat = Chat(student_id=student.id, teacher_id=teacher.id)
+        session.add(chat)
+        await session.flush()
+
+        for text in ("Hola profesor", f"Mensaje {index}"):
+            session.add(Message(
+                chat_id=chat.id,
+                sender_id=student.id,
+                encrypted_content=EncryptionService.encrypt_message(text, student.id),
+            ))
+
+    await session.commit()
+    await ChatService.rebuild_inbox_counters(session)
+    return teacher
+
+
+async def count_summary_queries(teacher_id: int):
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        async with TestingSessionLocal() as session:
+            summaries = await ChatService.get_chat_summaries(session, teacher_id, "teacher")
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", on_execute)
+    return len(statements), summaries
+
+
+@pytest.mark.asyncio
+async def test_chat_summaries_use_constant_number_of_queries():
+    await init_test_db()
+    async with TestingSessionLocal() as session:
+        small = await create_teacher_with_chats(session, "small", 2)
+        large = await create_teacher_with_chats(session, "large", 12)
+
+    small_queries, small_summaries = await count_summary_queries(small.id)
+    large_queries, large_summaries = await count_summary_queries(large.id)
+
+    assert len(small_summaries) == 2
+    assert len(large_summaries) == 12
+    assert small_queries == large_queries == 1
+
+    summary = large_summaries[0]
+    assert summary.unread_count == 2
+    assert summary.last_message is not None
+    assert summary.last_message.content.startswith("Mensaje")
+
+
+@pytest.mark.asyncio
+async def test_inbox_counters_are_maintained_on_write():
+    await init_test_db()
+    async with TestingSessionLocal() as session:
+        teacher = await create_teacher_with_chats(session, "counters", 1)
+        chat = (await ChatService.get_user_chats(session, teacher.id, "teacher"))[0]
+        student_id = chat.student_id
+
+        reply = await MessageService.send_message(session, chat.id, teacher.id, "Hola, con gusto", "teacher")
+        assert await MessageService.get_unread_count(session, chat.id, student_id) == 1
+        assert await MessageService.get_unread_count(session, chat.id, teacher.id) == 2
+
+        messages = await MessageService.get_chat_messages(session, chat.id, teacher.id)
+        incoming = [m.id for m in messages if m.sender_id == student_id]
+        await MessageService.mark_messages_as_read(session, chat.id, teacher.id, incoming)
+        assert await MessageService.get_unread_count(session, chat.id, teacher.id) == 0
+
+        await MessageService.delete_message(session, reply.id, teacher.id)
+        assert await MessageService.get_unread_count(session, chat.id, student_id) == 0
+
+    summaries = (await count_summary_queries(teacher.id))[1]
+    assert summaries[0].last_message.content == "Mensaje 0"
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_walks_history_without_gaps():
+    await init_test_db()
+    async with TestingSessionLocal() as session:
+        teacher = await create_teacher_with_chats(session, "keyset", 1)
+        chat = (await ChatService.get_user_chats(session, teacher.id, "teacher"))[0]
+        for index in range(5):
+            await MessageService.send_message(session, chat.id, teacher.id, f"Respuesta {index}", "teacher")
+
+        newest = await MessageService.get_chat_messages(session, chat.id, teacher.id, limit=3)
+        older = await MessageService.get_chat_messages(
+            session, chat.id, teacher.id, limit=3, before_id=newest[0].id
+        )
+        oldest = await MessageService.get_chat_messages(
+            session, chat.id, teacher.id, limit=3, before_id=older[0].id
+        )
+        newer = await MessageService.get_chat_messages(
+            session, chat.id, teacher.id, limit=10, after_id=older[-1].id
+        )
+
+    ids = [m.id for m in oldest + older + newest]
+    assert ids == sorted(ids) and len(ids) == 7
+    assert [m.id for m in newer] == [m.id for m in newest]
+
+
+@pytest.mark.asyncio
+async def test_messages_endpoint_validates_cursors_and_reports_has_more():
+    await init_test_db()
+    async with TestingSessionLocal() as session:
+        teacher = await create_teacher_with_chats(session, "has-more", 1)
+        chat = (await ChatService.get_user_chats(session, teacher.id, "teacher"))[0]
+        user = {"user_id": teacher.id}
+
+        async def page(limit, before_id=None, after_id=None, cursor=None):
+            return await get_chat_messages(
+                chat.id, limit=limit, offset=0, before_id=before_id, after_id=after_id,
+                cursor=cursor, db=session, current_user=user
+            )
+
+        # El chat tiene exactamente dos mensajes
+        full = await page(2)
+        assert full.has_more is False and len(full.data) == 2
+        newest = await page(1)
+        assert newest.has_more is True and newest.data[0].id == full.data[1].id
+        older = await page(1, cursor=newest.next_cursor)
+        assert older.has_more is False and older.data[0].id == full.data[0].id
+        newer = await page(1, cursor=older.prev_cursor)
+        assert newer.has_more is False and newer.data[0].id == full.data[1].id
+
+        invalid_cursors = [
+            PaginationService.encode_cursor({"before_id": "5"}),
+            PaginationService.encode_cursor({"before_id": -1}),
+            PaginationService.encode_cursor({"before_id": 5, "after_id": 1}),
+            PaginationService.encode_cursor({}),
+            "no-es-un-cursor",
+        ]
+        for cursor in invalid_cursors:
+            with pytest.raises(HTTPException) as error:
+                await page(1, cursor=cursor)
+            assert error.value.status_code == 400
+        with pytest.raises(HTTPException) as error:
+            await page(1, before_id=5, after_id=1)
+        assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_mark_read_up_to_watermark_uses_single_update():
+    await init_test_db()
+    async with TestingSessionLocal() as session:
+        teacher = await create_teacher_with_chats(session, "watermark", 1)
+        chat = (await ChatService.get_user_chats(session, teacher.id, "teacher"))[0]
+        messages = await MessageService.get_chat_messages(session, chat.id, teacher.id)
+
+        marked = await MessageService.mark_messages_as_read_up_to(
+            session, chat.id, teacher.id, messages[0].id
+        )
+        assert marked == 1
+        assert await MessageService.get_unread_count(session, chat.id, teacher.id) == 1
+
+        marked = await MessageService.mark_messages_as_read_up_to(
+            session, chat.id, teacher.id, messages[-1].id
+        )
+        assert marked == 1
+        assert await MessageService.get_unread_count(session, chat.id, teacher.id) == 0
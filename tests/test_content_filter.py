@@ -0,0 +1,70 @@
+import re
+
+from app.services.chat import message_service
+from app.services.content_filter import ContentFilterService, chat_content_filter, get_profanity_stats
+from app.services.content_filter.content_filter_service import CHAT_PROFANITY_DOMAIN
+from app.services.foro.content_filter import FORO_PROFANITY_DOMAIN, content_filter
+
+
+def test_foro_filter_detects_whole_and_embedded_words():
+    assert content_filter.contains_profanity("Eres un pendejo") == (True, "pendejo")
+    assert content_filter.contains_profanity("M13rd4 con números") == (True, "mierda")
+    assert content_filter.contains_profanity("supendejote") == (True, "pendejo")
+    assert content_filter.contains_profanity("Texto normal sin problemas") == (False, "")
+
+
+def test_foro_filter_returns_first_match_offset():
+    assert content_filter.find_profanity("hola mierda y pendejo") == ("mierda", 5)
+
+
+def test_chat_and_foro_dictionaries_are_isolated():
+    # "fuck" solo existe en el diccionario del chat
+    assert not chat_content_filter.filter_message("fuck")["is_appropriate"]
+    assert content_filter.contains_profanity("fuck") == (False, "")
+    assert chat_content_filter.filter_message("Hola profesor, ¿cómo está?")["is_appropriate"]
+
+
+def test_chat_filter_detects_leet_and_symbol_variants():
+    # Variantes que better-profanity detectaba antes del motor compilado
+    for text in ("f*ck", "b1tch", "a$$hole", "@sshole", "eres un sh1t total"):
+        result = chat_content_filter.filter_message(text)
+        assert not result["is_appropriate"], text
+        assert "****" in result["filtered_content"]
+    assert chat_content_filter.filter_message("Mi correo es ana@test.com")["is_appropriate"]
+    assert chat_content_filter.filter_message("La clase cuesta $250 a las 5")["is_appropriate"]
+
+
+def test_chat_filter_is_compiled_once_and_shared(monkeypatch):
+    engine = chat_content_filter.engine
+    assert message_service.chat_content_filter is chat_content_filter
+    assert ContentFilterService().engine is engine
+
+    # Filtrar mensajes no vuelve a compilar el vocabulario ni los patrones
+    compiled = []
+    original_compile = re.compile
+    monkeypatch.setattr(re, "compile", lambda *args, **kwargs: compiled.append(args) or original_compile(*args, **kwargs))
+    for _ in range(3):
+        chat_content_filter.filter_message("Hola profesor, mi número es 5512345678")
+        ContentFilterService().filter_message("fuck")
+    assert compiled == []
+    assert chat_content_filter.engine is engine
+
+
+def test_chat_and_foro_engines_keep_separate_stats():
+    chat_engine, foro_engine = chat_content_filter.engine, content_filter.engine
+    assert chat_engine is not foro_engine
+    assert (chat_engine.domain, foro_engine.domain) == (CHAT_PROFANITY_DOMAIN, FORO_PROFANITY_DOMAIN)
+
+    chat_before, foro_before = chat_engine.stats(), foro_engine.stats()
+    content_filter.contains_profanity("Eres un pendejo")
+    chat_content_filter.filter_message("Hola profesor")
+    chat_after, foro_after = chat_engine.stats(), foro_engine.stats()
+
+    # La grosería del foro solo cuenta en el foro; el mensaje limpio del chat solo en el chat
+    assert (foro_after["checks"], foro_after["hits"]) == (foro_before["checks"] + 1, foro_before["hits"] + 1)
+    assert (chat_after["checks"], chat_after["hits"]) == (chat_before["checks"] + 1, chat_before["hits"])
+    assert dict(foro_after["top_words"])["pendejo"] == dict(foro_before["top_words"]).get("pendejo", 0) + 1
+
+    stats = get_profanity_stats()
+    assert stats[CHAT_PROFANITY_DOMAIN]["checks"] == chat_after["checks"]
+    assert stats[FORO_PROFANITY_DOMAIN]["checks"] == foro_after["checks"]
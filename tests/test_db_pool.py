@@ -0,0 +1,42 @@
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy import text
+
+from app.cores.db import create_db_engine, get_pool_metrics, run_pool_metrics_log
+
+
+@pytest.mark.asyncio
+async def test_sqlite_file_engine_uses_wal_and_records_pool_metrics(tmp_path):
+    engine = create_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", "pool-test")
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+
+        async def query():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(query() for _ in range(8)))
+    finally:
+        await engine.dispose()
+
+    metrics = get_pool_metrics("pool-test")["pool-test"]
+    assert metrics["checkouts"] == metrics["checkins"] == 9
+    assert metrics["checked_out"] == 0
+    assert metrics["peak_checked_out"] >= 1
+    assert metrics["timeouts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_are_logged_periodically(db_engine, caplog):
+    async with db_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    caplog.set_level(logging.INFO)
+    task = asyncio.create_task(run_pool_metrics_log(0.01))
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    assert any(db_engine.pool.logging_name in record.getMessage() and "checkouts" in record.getMessage() for record in caplog.records)
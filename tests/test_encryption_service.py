@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+from app.services.encryption import EncryptionService
+
+
+def setup_function():
+    EncryptionService.clear_key_cache()
+
+
+def test_encrypt_decrypt_roundtrip():
+    encrypted = EncryptionService.encrypt_message("Hola profesor", 7)
+    assert EncryptionService.decrypt_message(encrypted, 7) == "Hola profesor"
+
+
+def test_key_derived_once_per_user():
+    original = EncryptionService._derive_key
+    with patch.object(EncryptionService, "_derive_key", side_effect=original) as derive:
+        for i in range(50):
+            encrypted = EncryptionService.encrypt_message(f"mensaje {i}", 1)
+            EncryptionService.decrypt_message(encrypted, 1)
+        EncryptionService.encrypt_message("hola", 2)
+
+    assert derive.call_count == 2
+    stats = EncryptionService.get_key_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 99
+
+
+async def test_decrypt_many_keeps_order_and_reports_errors():
+    first = EncryptionService.encrypt_message("uno", 1)
+    second = EncryptionService.encrypt_message("dos", 2)
+
+    results = await EncryptionService.decrypt_many([(first, 1), ("no-valido", 1), (second, 2)])
+
+    assert results[0] == (True, "uno")
+    assert results[1][0] is False
+    assert results[2] == (True, "dos")
@@ -0,0 +1,25 @@
+from app.cores.import_profiler import IMPORT_TIME_BUDGET_SECONDS, parse_importtime, profile_imports
+
+# Subsistemas que deben cargarse en su primer uso, no al importar la aplicación
+LAZY_MODULES = ("stripe", "alembic", "better_profanity", "app.scripts.databases.create_docente")
+
+
+def test_parse_importtime_reads_depth_and_skips_header():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   encodings.idna\n"
+        "import time:      3000 |       3120 | app.main\n"
+    )
+    assert parse_importtime(output) == [
+        ("encodings.idna", 120, 120, 1),
+        ("app.main", 3000, 3120, 0),
+    ]
+
+
+def test_app_import_stays_within_budget_and_skips_lazy_subsystems():
+    profile = profile_imports("app.main")
+
+    assert not [module for module in profile.modules if module.split(".")[0] in LAZY_MODULES or module in LAZY_MODULES]
+    assert profile.total_seconds <= IMPORT_TIME_BUDGET_SECONDS, (
+        f"import app.main tardó {profile.total_seconds:.3f}s (presupuesto {IMPORT_TIME_BUDGET_SECONDS}s)"
+    )
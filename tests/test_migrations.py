@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+
+from app.cores.db import Base, create_sessionmaker
+from app.cores.migrations import upgrade_to_head, verify_schema_version
+from app.scripts.databases.seed import SeedStep, run_seeds
+
+
+@pytest.mark.asyncio
+async def test_migrations_reach_head_and_match_models(db_engine):
+    with pytest.raises(RuntimeError):
+        await verify_schema_version(db_engine)
+
+    await upgrade_to_head(db_engine)
+    assert await verify_schema_version(db_engine)
+
+    async with db_engine.connect() as conn:
+        assert await conn.run_sync(compare_with_models) == []
+
+
+LEGACY_SCHEMA = Path(__file__).with_name("legacy_schema.sql")
+
+
+def compare_with_models(sync_conn) -> list:
+    return compare_metadata(MigrationContext.configure(sync_conn), Base.metadata)
+
+
+def create_legacy_schema(sync_conn) -> None:
+    """Base como la dejaba `create_all` antes de las migraciones (sin `alembic_version`)."""
+    lines = LEGACY_SCHEMA.read_text(encoding="utf-8").splitlines()
+    script = "\n".join(line for line in lines if not line.startswith("--"))
+    for statement in script.split(";\n"):
+        if statement.strip():
+            sync_conn.exec_driver_sql(statement)
+    sync_conn.exec_driver_sql("INSERT INTO statuses (id, name) VALUES (1, 'active')")
+    for user_id in (1, 2):
+        sync_conn.exec_driver_sql(
+            "INSERT INTO users (id, first_name, last_name, email, password, status_id, privacy_policy_accepted) "
+            f"VALUES ({user_id}, 'U', 'X', 'u{user_id}@test.com', 'x', 1, 1)"
+        )
+    sync_conn.exec_driver_sql("INSERT INTO chats (id, student_id, teacher_id, is_active, is_blocked) VALUES (1, 1, 2, 1, 0)")
+    for message_id, sender_id, is_read in ((1, 2, 0), (2, 2, 0), (3, 1, 0), (4, 2, 1)):
+        sync_conn.exec_driver_sql(
+            "INSERT INTO messages (id, chat_id, sender_id, encrypted_content, encryption_version, is_encrypted, is_read, is_deleted) "
+            f"VALUES ({message_id}, 1, {sender_id}, 'x', 'v1', 1, {is_read}, 0)"
+        )
+
+
+@pytest.mark.asyncio
+async def test_legacy_create_all_database_is_stamped_at_baseline(db_engine):
+    async with db_engine.begin() as conn:
+        await conn.run_sync(create_legacy_schema)
+
+    await upgrade_to_head(db_engine)
+    assert await verify_schema_version(db_engine)
+
+    async with db_engine.connect() as conn:
+        assert await conn.run_sync(compare_with_models) == []
+        chat = (await conn.execute(text(
+            "SELECT last_message_id, student_unread_count, teacher_unread_count FROM chats WHERE id = 1"
+        ))).one()
+    # Mensajes no leídos: dos del docente (2) para el alumno y uno del alumno (1) para el docente
+    assert tuple(chat) == (4, 2, 1)
+
+
+async def seed_example():
+    seed_example.calls += 1
+
+
+@pytest.mark.asyncio
+async def test_seed_steps_run_once_per_checksum(db_engine):
+    session_factory = create_sessionmaker(db_engine)
+    seed_example.calls = 0
+    steps = [SeedStep("example", seed_example)]
+    await upgrade_to_head(db_engine)
+
+    assert await run_seeds(steps, session_factory=session_factory) == ["example"]
+    assert await run_seeds(steps, session_factory=session_factory) == []
+    assert await run_seeds(steps, force=True, session_factory=session_factory) == ["example"]
+    assert seed_example.calls == 2
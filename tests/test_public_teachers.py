@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+
+from app.models import Availability, Booking, User, Video
+from app.services.teachers.teacher_stats_service import TeacherStatsService
+from app.services.teachers.teachers_public_service import PublicService
+
+
+@pytest.mark.asyncio
+async def test_public_teachers_are_filtered_and_paginated_in_sql(session_factory):
+    async with session_factory() as db:
+        student = User(first_name="Est", last_name="Udiante", email="s@test.com", password="x", status_id=1, role_id=2)
+        db.add(student)
+        teachers = []
+        for index in range(5):
+            teacher = User(first_name=f"Doc{index}", last_name="Ente", email=f"t{index}@test.com", password="x", status_id=1, role_id=1)
+            db.add(teacher)
+            teachers.append(teacher)
+        await db.flush()
+
+        # El docente i tiene i reservas
+        for index, teacher in enumerate(teachers):
+            slot = Availability(user_id=teacher.id, preference_id=1, day_of_week=1, start_time="09:00:00", end_time="10:00:00")
+            db.add(slot)
+            await db.flush()
+            for _ in range(index):
+                db.add(Booking(user_id=student.id, availability_id=slot.id, start_time=datetime.utcnow(), end_time=datetime.utcnow()))
+        await db.commit()
+        assert await TeacherStatsService.rebuild_teacher_stats(db) == 5
+
+        first_page = await PublicService.get_public_teachers(db, page=1, page_size=2)
+        last_page = await PublicService.get_public_teachers(db, page=3, page_size=2)
+        assert first_page["total"] == 5
+        assert [t["user_id"] for t in first_page["teachers"]] == [teachers[0].id, teachers[1].id]
+        assert [t["user_id"] for t in last_page["teachers"]] == [teachers[4].id]
+
+        busy = await PublicService.get_public_teachers(db, min_bookings=3, page=1, page_size=10)
+        assert busy["total"] == 2
+        assert sorted(t["total_bookings"] for t in busy["teachers"]) == [3, 4]
+
+        beyond = await PublicService.get_public_teachers(db, min_bookings=3, page=2, page_size=10)
+        assert beyond == {"teachers": [], "total": 2, "page": 2, "page_size": 10}
+
+
+@pytest.mark.asyncio
+async def test_teachers_with_videos_are_filtered_and_keyset_paginated(session_factory):
+    async with session_factory() as db:
+        # (role_id, status_id, privacy_status, embeddable): solo los tres primeros son visibles
+        variants = [(1, 1, "public", True), (1, 1, "unlisted", True), (1, 1, "public", True),
+                    (1, 1, "private", True), (1, 1, "public", False), (1, 2, "public", True),
+                    (2, 1, "public", True)]
+        for index, (role_id, status_id, privacy_status, embeddable) in enumerate(variants):
+            user = User(first_name=f"U{index}", last_name="X", email=f"u{index}@test.com", password="x", status_id=status_id, role_id=role_id)
+            db.add(user)
+            await db.flush()
+            db.add(Video(
+                user_id=user.id, youtube_video_id=f"yt{index}", title="t", duration_seconds=30,
+                embed_url="e", privacy_status=privacy_status, embeddable=embeddable, original_url="o"
+            ))
+        await db.commit()
+
+        first = await PublicService.get_teachers_with_videos(db, limit=2)
+        assert first["has_more"] is True and first["total"] == 3
+        assert [t["teacher_name"] for t in first["teachers"]] == ["U2 X", "U1 X"]
+
+        second = await PublicService.get_teachers_with_videos(db, limit=2, before_id=first["teachers"][-1]["video"]["id"])
+        assert second["has_more"] is False and second["total"] == 3
+        assert [t["teacher_name"] for t in second["teachers"]] == ["U0 X"]
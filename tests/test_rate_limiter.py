@@ -0,0 +1,49 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from slowapi.errors import RateLimitExceeded
+
+from app.cores.rate_limit_storage import BoundedMemoryStorage
+from app.cores.rate_limiter import RateLimitMiddleware, WeightedLimiter, get_client_ip, rate_limit_exceeded_handler
+
+
+def test_bounded_memory_storage_evicts_least_recently_used_keys():
+    storage = BoundedMemoryStorage(max_keys=2)
+    storage.incr("client-a", 60)
+    storage.incr("client-b", 60)
+    storage.incr("client-a", 60)
+    storage.incr("client-c", 60)
+
+    assert storage.key_count() == 2
+    assert storage.evictions == 1
+    assert storage.get("client-b") == 0
+    assert storage.get("client-a") == 2
+
+
+@pytest.mark.asyncio
+async def test_expensive_routes_consume_more_of_the_default_limit():
+    limiter = WeightedLimiter(
+        key_func=get_client_ip,
+        default_limits=["6/minute"],
+        storage_uri="bounded-memory://",
+        storage_options={"max_keys": 100},
+    )
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    app.add_middleware(RateLimitMiddleware)
+
+    @app.get("/api/public/search-teachers/")
+    async def search_teachers():
+        return {"ok": True}
+
+    @app.get("/api/public/teachers/")
+    async def list_teachers():
+        return {"ok": True}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        search = [(await client.get("/api/public/search-teachers/")).status_code for _ in range(3)]
+        cheap = [(await client.get("/api/public/teachers/")).status_code for _ in range(6)]
+
+    assert search == [200, 200, 429]
+    assert cheap == [200] * 6
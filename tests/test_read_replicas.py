@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import text
+
+from app.cores.db import ReadReplicaRouter, create_db_engine, create_sessionmaker
+
+
+async def create_marked_database(url: str, marker: str) -> None:
+    engine = create_db_engine(url, f"seed-{marker}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE origin (name TEXT)"))
+        await conn.execute(text("INSERT INTO origin VALUES (:name)"), {"name": marker})
+    await engine.dispose()
+
+
+async def read_origin(router: ReadReplicaRouter) -> str:
+    session = await router.open_session()
+    try:
+        return (await session.execute(text("SELECT name FROM origin"))).scalar_one()
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_rotate_between_replicas_and_fall_back_to_primary(tmp_path):
+    primary_url = f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"
+    replica_urls = [f"sqlite+aiosqlite:///{tmp_path / name}.db" for name in ("replica-a", "replica-b")]
+    await create_marked_database(primary_url, "primary")
+    await create_marked_database(replica_urls[0], "replica-a")
+    await create_marked_database(replica_urls[1], "replica-b")
+
+    primary_engine = create_db_engine(primary_url, "test-primary")
+    router = ReadReplicaRouter(create_sessionmaker(primary_engine), replica_urls, name="test-replica")
+    try:
+        origins = [await read_origin(router) for _ in range(4)]
+        assert origins == ["replica-a", "replica-b", "replica-a", "replica-b"]
+    finally:
+        await router.dispose()
+
+    broken = ReadReplicaRouter(
+        create_sessionmaker(primary_engine),
+        [f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"],
+        name="test-broken",
+    )
+    try:
+        # La réplica no se toca hasta la primera consulta
+        session = await broken.open_session()
+        assert broken._unavailable_until == {}
+        await session.close()
+
+        assert await read_origin(broken) == "primary"
+        assert broken._candidates() == []
+    finally:
+        await broken.dispose()
+        await primary_engine.dispose()
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import event
+
+from app.models import Modality, Status
+from app.services.common.reference_data import ReferenceDataRegistry
+from tests.test_db import engine_test, init_test_db, TestingSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_registry_loads_once_and_refreshes_on_demand():
+    await init_test_db()
+    registry = ReferenceDataRegistry()
+    async with TestingSessionLocal() as session:
+        session.add_all([Status(name="registry-active"), Status(name="registry-cancelled")])
+        await session.commit()
+
+        active = await registry.get_status(session, "registry-active")
+        assert active is not None and active.name == "registry-active"
+
+        statements = []
+
+        def listener(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine_test.sync_engine, "before_cursor_execute", listener)
+        try:
+            assert await registry.get_status_id(session, "registry-cancelled") is not None
+            assert await registry.get_status_by_id(session, active.id) == active
+            assert await registry.get_status(session, "registry-missing") is None
+        finally:
+            event.remove(engine_test.sync_engine, "before_cursor_execute", listener)
+        assert statements == []
+
+        session.add(Modality(name="registry-hybrid", status_id=active.id))
+        await session.commit()
+        assert await registry.get_modality(session, "registry-hybrid") is None
+
+        await registry.refresh(session)
+        modality = await registry.get_modality(session, "registry-hybrid")
+        assert modality is not None and modality.status_id == active.id
+
+
+@pytest.mark.asyncio
+async def test_registry_reloads_after_ttl_for_changes_from_other_workers():
+    await init_test_db()
+    registry = ReferenceDataRegistry(ttl_seconds=60)
+    async with TestingSessionLocal() as session:
+        assert await registry.get_status(session, "registry-ttl") is None
+
+        # Otro worker agrega el status: este proceso no recibe `refresh`
+        session.add(Status(name="registry-ttl"))
+        await session.commit()
+        assert await registry.get_status(session, "registry-ttl") is None
+
+        registry._loaded_at -= 60
+        assert await registry.get_status(session, "registry-ttl") is not None
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+
+from app.models import RefreshToken, Status, User
+from app.services.auths.logout_service import logout_user
+from app.services.auths.refresh_token_service import (
+    hash_refresh_token,
+    issue_refresh_token,
+    purge_expired_refresh_tokens,
+    refresh_access_token,
+)
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_rotate_detect_reuse_and_purge(session_factory):
+    async with session_factory() as db:
+        status = Status(name="active")
+        db.add(status)
+        await db.flush()
+        user = User(first_name="Ana", last_name="López", email="ana@test.com", password="x", status_id=status.id)
+        db.add(user)
+        await db.flush()
+        token_data = {"user_id": user.id, "email": user.email, "role": "student", "statuses": "active"}
+
+        first = await issue_refresh_token(db, token_data)
+        await db.commit()
+        stored = (await db.execute(select(RefreshToken.token_hash))).scalar_one()
+        assert stored == hash_refresh_token(first) and first not in stored
+
+        _, second, _ = await refresh_access_token(db, first)
+        assert second != first
+
+        # Reutilizar un token ya rotado revoca todas las sesiones del usuario
+        with pytest.raises(HTTPException) as error:
+            await refresh_access_token(db, first)
+        assert error.value.status_code == 401
+        with pytest.raises(HTTPException):
+            await refresh_access_token(db, second)
+
+        third = await issue_refresh_token(db, token_data)
+        await db.commit()
+        assert await logout_user(db, user.email) is True
+        with pytest.raises(HTTPException):
+            await refresh_access_token(db, third)
+
+        # Un registro vencido no renueva aunque el JWT siga vigente
+        fourth = await issue_refresh_token(db, token_data)
+        await db.commit()
+        await db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == hash_refresh_token(fourth))
+            .values(expires_at=datetime.now(timezone.utc) - timedelta(days=1))
+        )
+        await db.commit()
+        with pytest.raises(HTTPException):
+            await refresh_access_token(db, fourth)
+
+        assert await purge_expired_refresh_tokens(db) == 1
+        assert (await db.execute(select(func.count(RefreshToken.id)))).scalar_one() == 3
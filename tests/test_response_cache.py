@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.cores.response_cache import InMemoryResponseCacheBackend, ResponseCache
+
+
+@pytest.mark.asyncio
+async def test_responses_are_cached_per_declared_params_with_etag():
+    cache = ResponseCache(InMemoryResponseCacheBackend(max_entries=10), ttl_seconds=60)
+    calls = []
+    app = FastAPI()
+
+    @app.get("/teachers/")
+    async def teachers(request: Request, page: int = 1):
+        async def build():
+            calls.append(page)
+            return {"page": page, "version": len(calls)}
+        return await cache.respond(request, "teachers", {"page": page}, build)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/teachers/?page=2")
+        # Parámetros no declarados (p. ej. para romper la caché) usan la misma entrada
+        same = await client.get("/teachers/?page=02&nocache=123")
+        not_modified = await client.get("/teachers/?page=2", headers={"If-None-Match": first.headers["etag"]})
+
+        await cache.invalidate("teachers")
+        fresh = await client.get("/teachers/?page=2", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.json() == same.json() == {"page": 2, "version": 1}
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert fresh.status_code == 200 and fresh.json()["version"] == 2
+    assert fresh.headers["etag"] != first.headers["etag"]
+    assert calls == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_run_the_producer_once():
+    cache = ResponseCache(InMemoryResponseCacheBackend(), ttl_seconds=60)
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_query():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"teachers": []}
+
+    request = Request({"type": "http", "query_string": b"", "headers": []})
+    responses = [asyncio.create_task(cache.respond(request, "search", {}, slow_query)) for _ in range(5)]
+    await asyncio.sleep(0)
+    await cache.invalidate("search")  # llega mientras la consulta sigue en curso
+    release.set()
+    responses = await asyncio.gather(*responses)
+
+    assert calls == 1
+    assert {response.body for response in responses} == {b'{"teachers":[]}'}
+    # El resultado calculado antes de la invalidación no se guarda
+    assert await cache.backend.get("search", "") is None
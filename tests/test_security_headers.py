@@ -0,0 +1,40 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.cores.rate_limiter import RateLimitMiddleware, WeightedLimiter, get_client_ip
+from app.cores.security_headers import SecurityHeadersMiddleware
+
+
+@pytest.mark.asyncio
+async def test_asgi_middlewares_add_headers_without_buffering_streams():
+    app = FastAPI()
+    app.state.limiter = WeightedLimiter(
+        key_func=get_client_ip,
+        default_limits=["10/minute"],
+        storage_uri="bounded-memory://",
+        storage_options={"max_keys": 10},
+        headers_enabled=True,
+    )
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+
+    @app.get("/download")
+    async def download():
+        async def chunks():
+            for chunk in (b"uno,", b"dos,", b"tres"):
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="text/plain", headers={"Server": "uvicorn"})
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with client.stream("GET", "/download") as response:
+            received = [chunk async for chunk in response.aiter_raw()]
+
+    assert b"".join(received) == b"uno,dos,tres"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers.get_list("server") == ["OnlyCation"]
+    assert response.headers["content-security-policy"].startswith("default-src 'self'; ")
+    assert response.headers["x-ratelimit-limit"] == "10"
+    assert response.headers["x-ratelimit-remaining"] == "9"
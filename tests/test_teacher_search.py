@@ -0,0 +1,60 @@
+import pytest
+
+from app.models import Document, TeacherStat, User
+from app.services.teachers.teacher_search_service import TeacherSearchIndex, TeacherSearchService, teacher_search_index
+from app.services.teachers.teachers_public_service import PublicService
+
+
+def test_memory_index_requires_every_term_as_prefix():
+    index = TeacherSearchIndex()
+    index.load([(1, "jose perez matematicas algebra"), (2, "ana gomez fisica"), (3, "jose luis fisica matematicas")])
+
+    assert set(index.search(["mate"])) == {1, 3}
+    assert set(index.search(["jose", "fis"])) == {3}
+    assert index.search(["quimica"]) == {}
+
+    index.remove(3)
+    assert set(index.search(["jose"])) == {1}
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_folds_accents_and_blends_rating(session_factory):
+    teacher_search_index.clear()
+    try:
+        async with session_factory() as db:
+            teachers = [
+                User(first_name="José", last_name="Pérez", email="jose@test.com", password="x", status_id=1, role_id=1),
+                User(first_name="Ana", last_name="Gómez", email="ana@test.com", password="x", status_id=1, role_id=1),
+                User(first_name="Luis", last_name="Díaz", email="luis@test.com", password="x", status_id=1, role_id=1),
+            ]
+            db.add_all(teachers)
+            await db.flush()
+            areas = ["Matemáticas", "Física", "Matemáticas"]
+            for index, (teacher, area) in enumerate(zip(teachers, areas)):
+                db.add(Document(
+                    user_id=teacher.id, rfc_hash=str(index), rfc_cipher="x", certificate="c", curriculum="c",
+                    expertise_area=area, description=f"Clases de {area} para secundaria"
+                ))
+            db.add_all([
+                TeacherStat(user_id=teachers[0].id, avg_rating=3.0),
+                TeacherStat(user_id=teachers[2].id, avg_rating=5.0),
+            ])
+            await db.commit()
+            assert await TeacherSearchService.rebuild_search_index(db) == 3
+
+            found = await PublicService.search_teachers_catalog(db, subject="matematicas")
+            assert [t["user_id"] for t in found["teachers"]] == [teachers[2].id, teachers[0].id]
+            assert found["total"] == 2
+
+            found = await PublicService.search_teachers_catalog(db, name="JOSE", subject="mate")
+            assert [t["user_id"] for t in found["teachers"]] == [teachers[0].id]
+
+            # Las actualizaciones de documentos se reflejan sin reconstruir el índice
+            document = await db.get(Document, 2)
+            document.expertise_area = "Matemáticas aplicadas"
+            await TeacherSearchService.refresh_teacher(db, teachers[1].id)
+            await db.commit()
+            found = await PublicService.search_teachers_catalog(db, subject="aplicadas")
+            assert [t["user_id"] for t in found["teachers"]] == [teachers[1].id]
+    finally:
+        teacher_search_index.clear()
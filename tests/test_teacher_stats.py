@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Assessment, Availability, Booking, PaymentBooking, Status, TeacherStat, User
+from app.services.teachers.teacher_stats_service import TeacherStatsService
+
+
+@pytest.mark.asyncio
+async def test_incremental_teacher_stats_match_a_full_rebuild(session_factory):
+    async with session_factory() as db:
+        completed = Status(name="completed")
+        teacher = User(first_name="Doc", last_name="Ente", email="t@test.com", password="x", status_id=1, role_id=1)
+        student = User(first_name="Est", last_name="Udiante", email="s@test.com", password="x", status_id=1, role_id=2)
+        db.add_all([completed, teacher, student])
+        await db.flush()
+        slot = Availability(user_id=teacher.id, preference_id=1, day_of_week=1, start_time="09:00:00", end_time="10:00:00")
+        db.add(slot)
+        await db.flush()
+
+        for qualification in (5, 4, None):
+            booking = Booking(user_id=student.id, availability_id=slot.id, start_time=datetime.utcnow(), end_time=datetime.utcnow())
+            db.add(booking)
+            await db.flush()
+            await TeacherStatsService.record_booking(db, teacher.id)
+
+            payment = PaymentBooking(user_id=student.id, booking_id=booking.id, price_id=1, total_amount=100, status_id=1)
+            db.add(payment)
+            await db.flush()
+            db.add(Assessment(user_id=student.id, payment_booking_id=payment.id, qualification=qualification))
+            await db.flush()
+            await TeacherStatsService.record_assessment(db, teacher.id, qualification)
+
+        booking.status_id = completed.id
+        await TeacherStatsService.record_completed_class(db, teacher.id)
+        await db.commit()
+
+        def snapshot(stat):
+            return (stat.avg_rating, stat.rating_count, stat.rating_sum, stat.total_bookings, stat.completed_classes)
+
+        incremental = snapshot((await db.execute(select(TeacherStat))).scalar_one())
+        assert incremental == (4.5, 2, 9, 3, 1)
+
+        db.expunge_all()
+        await TeacherStatsService.rebuild_teacher_stats(db)
+        assert snapshot((await db.execute(select(TeacherStat))).scalar_one()) == incremental
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException, Request
+
+from app.apis.deps import get_token_claims
+from app.cores.token import clear_token_cache, create_access_token, get_token_cache_stats, verify_token
+
+
+def test_verify_token_reuses_decoded_claims_until_exp():
+    clear_token_cache()
+    token = create_access_token({"user_id": 7, "role": "student"})
+
+    claims = verify_token(token)
+    claims["user_id"] = 0  # los servicios reciben una copia
+    assert verify_token(token)["user_id"] == 7
+    assert get_token_cache_stats()["hits"] == 1
+
+    expired = create_access_token({"user_id": 7}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(HTTPException) as error:
+        verify_token(expired)
+    assert error.value.status_code == 401
+    assert get_token_cache_stats()["size"] == 1
+
+
+def test_request_claims_are_verified_once_per_request():
+    clear_token_cache()
+    authorization = f"Bearer {create_access_token({'user_id': 8, 'role': 'teacher'})}"
+    request = Request({"type": "http", "headers": []})
+
+    first = get_token_claims(request, authorization)
+    assert get_token_claims(request, authorization) is first
+    assert get_token_cache_stats()["misses"] == 1
+    assert get_token_cache_stats()["hits"] == 0